@@ -0,0 +1,167 @@
+"""Tests for the warm browser pool. (With fake browsers)"""
+import itertools
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+from seleniumbase import config as sb_config
+from seleniumbase.core import browser_pool
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+
+class FakeDriver:
+    ids = itertools.count(1)
+
+    def __init__(self, driver_kwargs):
+        self.id = next(self.ids)
+        self.driver_kwargs = driver_kwargs
+        self.commands = []
+        self.quit_count = 0
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+
+    def get_window_size(self):
+        return {"width": 1280, "height": 840}
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append(cmd)
+        if cmd == "Target.createBrowserContext":
+            return {"browserContextId": "context_%s" % len(self.commands)}
+        if cmd == "Target.createTarget":
+            return {"targetId": "target_%s" % len(self.commands)}
+        if cmd == "Target.getTargets":
+            return {"targetInfos": []}
+        return {}
+
+    def quit(self):
+        self.quit_count += 1
+
+
+class Launcher:
+    def __init__(self):
+        self.launches = []
+        self.threads = []
+
+    def __call__(self, **driver_kwargs):
+        self.threads.append(threading.current_thread().name)
+        driver = FakeDriver(driver_kwargs)
+        sb_config._cdp_browser = "browser_%s" % driver.id
+        self.launches.append(driver)
+        return driver
+
+
+def wait_for(condition, timeout=5):
+    stop_time = time.time() + timeout
+    while not condition():
+        assert time.time() < stop_time, "Timed out!"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def pool():
+    saved_globals = browser_pool.get_launch_globals()
+    pool = browser_pool.BrowserPool(size=1)
+    yield pool
+    pool.close()
+    browser_pool.set_launch_globals(saved_globals)
+
+
+def test_get_signature():
+    signature = browser_pool.get_signature(
+        {"browser": "chrome", "headless": True, "test_id": "test_1"}
+    )
+    assert signature == browser_pool.get_signature(
+        {"headless": True, "browser": "chrome", "test_id": "test_2"}
+    )
+    assert signature != browser_pool.get_signature(
+        {"browser": "chrome", "headless": False}
+    )
+    hash(browser_pool.get_signature({"proxy_bypass_list": ["a", "b"]}))
+
+
+def test_checkout_and_checkin(pool):
+    launcher = Launcher()
+    sb_config._cdp_browser = "test_value"
+    driver = pool.checkout(launcher, browser="chrome", test_id="test_1")
+    assert launcher.threads[0] == threading.current_thread().name
+    assert sb_config._cdp_browser == "browser_%s" % driver.id
+    signature = browser_pool.get_signature({"browser": "chrome"})
+    wait_for(lambda: len(pool.idle[signature]) == 1)
+    prelaunched = pool.idle[signature][0]
+    assert launcher.threads[1].startswith("sb-browser-pool")
+    # The background launch didn't change the values of the test thread
+    assert sb_config._cdp_browser == "browser_%s" % driver.id
+    assert pool.uses == {driver: 0, prelaunched: 0}
+    assert pool.checkin(driver)  # (The idle pool is full, so it's quit)
+    assert driver.quit_count == 1
+    assert driver not in pool.uses
+    driver_2 = pool.checkout(launcher, browser="chrome", test_id="test_2")
+    assert driver_2 is prelaunched
+    assert sb_config._cdp_browser == "browser_%s" % prelaunched.id
+    wait_for(lambda: len(pool.idle[signature]) == 1)
+    assert len(launcher.launches) == 3
+
+
+def test_reset_and_reuse(pool):
+    launcher = Launcher()
+    driver = pool.checkout(launcher, browser="chrome")
+    signature = browser_pool.get_signature({"browser": "chrome"})
+    wait_for(lambda: len(pool.idle[signature]) == 1)
+    pool.idle[signature].pop().quit()  # (Make room for the checkin)
+    assert pool.checkin(driver)
+    assert driver.quit_count == 0
+    assert pool.idle[signature] == [driver]
+    assert pool.uses[driver] == 1
+    assert driver.commands[:2] == [
+        "Target.createBrowserContext", "Target.createTarget"
+    ]
+    assert pool.checkout(launcher, browser="chrome") is driver
+    assert pool.checkin(driver)
+    # The context of the previous test is disposed of
+    assert "Target.disposeBrowserContext" in driver.commands
+    assert pool.uses[driver] == 2
+
+
+def test_max_reuses(pool, monkeypatch):
+    monkeypatch.setattr(browser_pool, "MAX_REUSES", 2)
+    launcher = Launcher()
+    signature = browser_pool.get_signature({"browser": "chrome"})
+    driver = pool.checkout(launcher, browser="chrome")
+    wait_for(lambda: len(pool.idle[signature]) == 1)
+    pool.idle[signature].pop().quit()
+    assert pool.checkin(driver)
+    assert pool.checkout(launcher, browser="chrome") is driver
+    wait_for(lambda: len(pool.idle[signature]) == 1)
+    pool.idle[signature].pop().quit()
+    assert pool.checkin(driver)  # (The 2nd use)
+    assert driver.quit_count == 1
+    assert driver not in pool.idle[signature]
+    assert driver not in pool.uses
+
+
+def test_unknown_drivers(pool, monkeypatch):
+    driver = FakeDriver({})
+    assert not pool.checkin(driver)
+    assert driver.quit_count == 0
+    monkeypatch.setattr(browser_pool, "shared_pool", None)
+    assert not browser_pool.checkin(driver)  # (No pool yet)
+
+
+def test_size_bound_and_close():
+    launcher = Launcher()
+    pool = browser_pool.BrowserPool(size=2)
+    signature = browser_pool.get_signature({"browser": "chrome"})
+    drivers = [pool.checkout(launcher, browser="chrome") for x in range(3)]
+    wait_for(lambda: sum(pool.pending.values()) == 0)
+    assert len(pool.idle[signature]) == 2
+    for driver in drivers:
+        assert pool.checkin(driver)
+    assert len(pool.idle[signature]) == 2
+    assert all(driver.quit_count == 1 for driver in drivers)
+    idle = list(pool.idle[signature])
+    pool.close()
+    assert all(driver.quit_count == 1 for driver in idle)
+    assert not pool.idle
+    assert not pool.uses
@@ -0,0 +1,135 @@
+"""Tests for the Dashboard journal of multi-process runs. (pytest -n N)"""
+import os
+import time
+from types import SimpleNamespace
+from seleniumbase.core import dash_journal
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+
+def new_config(results=None):
+    results = results or {}
+    return SimpleNamespace(
+        _results=dict(results),
+        _display_id={key: "display_" + key for key in results},
+        _duration={key: "-" for key in results},
+        _d_t_log_path={key: None for key in results},
+    )
+
+
+def finish_test(config, test_id, result="Passed"):
+    config._results[test_id] = result
+    config._duration[test_id] = "1.5s"
+    config._d_t_log_path[test_id] = "logs/" + test_id
+
+
+def test_snapshot_and_get_changes():
+    config = new_config({"t1": "Untested", "t2": "Untested"})
+    before = dash_journal.snapshot(config)
+    assert dash_journal.get_changes(before, config) is None
+    finish_test(config, "t1")
+    assert before["_results"]["t1"] == "Untested"  # (The snapshot is a copy)
+    changes = dash_journal.get_changes(before, config)
+    assert changes["_results"] == {"t1": "Passed"}
+    assert changes["_duration"] == {"t1": "1.5s"}
+    assert changes["_display_id"] == {}
+    assert "removed" not in changes
+    before = dash_journal.snapshot(config)
+    for field in dash_journal.FIELDS:
+        getattr(config, field).pop("t2")
+    assert dash_journal.get_changes(before, config)["removed"] == ["t2"]
+
+
+def test_append_and_merge(tmp_path):
+    path = str(tmp_path / "dashboard.jsonl")
+    results = {"t1": "Untested", "t2": "Untested", "t3": "Untested"}
+    config_1 = new_config(results)
+    config_2 = new_config(results)
+    journal_1 = dash_journal.DashJournal(path)
+    journal_2 = dash_journal.DashJournal(path)
+    assert not journal_1.has_new_entries()
+    assert journal_1.read_new_entries() == []
+    before = dash_journal.snapshot(config_1)
+    finish_test(config_1, "t1")
+    journal_1.append(dash_journal.get_changes(before, config_1))
+    before = dash_journal.snapshot(config_2)
+    finish_test(config_2, "t2", "Failed")
+    journal_2.append(dash_journal.get_changes(before, config_2))
+    journal_1.merge_into(config_1)
+    assert config_1._results == {
+        "t1": "Passed", "t2": "Failed", "t3": "Untested"
+    }
+    assert config_1._d_t_log_path["t2"] == "logs/t2"
+    assert not journal_1.has_new_entries()  # (Only new lines are read)
+    journal_1.merge_into(config_1)
+    assert config_1._results["t2"] == "Failed"
+    journal_2.merge_into(config_2)
+    assert config_2._results == config_1._results
+    assert dash_journal.get_counts(config_2._results) == (1, 1, 0, 1)
+
+
+def test_partial_lines_are_read_later(tmp_path):
+    path = str(tmp_path / "dashboard.jsonl")
+    journal = dash_journal.DashJournal(path)
+    journal.append({"_results": {"t1": "Passed"}})
+    with open(path, mode="ab") as f:
+        f.write(b'{"_results": {"t2": ')
+    assert journal.read_new_entries() == [{"_results": {"t1": "Passed"}}]
+    assert journal.has_new_entries()
+    assert journal.read_new_entries() == []
+    with open(path, mode="ab") as f:
+        f.write(b'"Skipped"}}\n')
+    assert journal.read_new_entries() == [{"_results": {"t2": "Skipped"}}]
+
+
+def test_last_processes_see_all_results(tmp_path):
+    # The last 2 processes both merge before either one appends.
+    # The one that checks for new entries last has the final results.
+    path = str(tmp_path / "dashboard.jsonl")
+    results = {"t1": "Untested", "t2": "Untested"}
+    configs = [new_config(results), new_config(results)]
+    journals = [dash_journal.DashJournal(path) for config in configs]
+    snapshots = []
+    for config, journal in zip(configs, journals):
+        journal.merge_into(config)
+        snapshots.append(dash_journal.snapshot(config))
+    for index, config in enumerate(configs):
+        finish_test(config, "t%s" % (index + 1))
+        journals[index].append(
+            dash_journal.get_changes(snapshots[index], config)
+        )
+    for config, journal in zip(configs, journals):
+        assert dash_journal.get_counts(config._results)[3] == 1
+        while journal.has_new_entries():
+            journal.merge_into(config)
+    assert dash_journal.get_counts(configs[-1]._results) == (2, 0, 0, 0)
+
+
+def test_get_counts():
+    results = {
+        "t1": "Passed",
+        "t2": "Failed",
+        "t3": "Skipped",
+        "t4": "Untested",
+        "t5": "Unknown",
+        "t6": "Passed",
+    }
+    assert dash_journal.get_counts(results) == (2, 1, 2, 1)
+    assert dash_journal.get_counts({}) == (0, 0, 0, 0)
+
+
+def test_is_rebuild_due_and_write_atomically(tmp_path):
+    html_path = str(tmp_path / "dashboard.html")
+    assert dash_journal.is_rebuild_due(html_path)  # (No file yet)
+    dash_journal.write_atomically(html_path, "<html>1</html>")
+    assert not dash_journal.is_rebuild_due(html_path, interval=60)
+    assert dash_journal.is_rebuild_due(html_path, interval=0)
+    old_time = time.time() - 5
+    os.utime(html_path, (old_time, old_time))
+    assert dash_journal.is_rebuild_due(html_path, interval=1)
+    dash_journal.write_atomically(html_path, "<html>2</html>")
+    with open(html_path, mode="r", encoding="utf-8") as f:
+        assert f.read() == "<html>2</html>"
+    assert os.listdir(str(tmp_path)) == ["dashboard.html"]  # (No temp file)
@@ -0,0 +1,176 @@
+"""Offline tests for DB reporting. (With settings.DB_SQLITE_FILE)"""
+import sqlite3
+import threading
+import pytest
+from seleniumbase.config import settings
+from seleniumbase.core import db_writer
+from seleniumbase.core import testcase_manager
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+
+@pytest.fixture
+def db_file(tmp_path, monkeypatch):
+    db_file = str(tmp_path / "test_db.sqlite")
+    monkeypatch.setattr(settings, "DB_SQLITE_FILE", db_file, raising=False)
+    monkeypatch.setattr(db_writer, "shared_writer", None)
+    yield db_file
+    db_writer.flush()
+
+
+def get_rows(db_file, query):
+    conn = sqlite3.connect(db_file)
+    try:
+        return conn.execute(query).fetchall()
+    finally:
+        conn.close()
+
+
+def test_get_sqlite_tables():
+    statements = db_writer.get_sqlite_tables()
+    assert len(statements) == 2
+    conn = sqlite3.connect(":memory:")
+    for statement in statements:
+        assert statement.startswith("CREATE TABLE IF NOT EXISTS ")
+        assert "ENGINE=" not in statement
+        conn.execute(statement)
+        conn.execute(statement)  # (The tables can be created again)
+    tables = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+    ).fetchall()
+    assert tables == [("test_execution",), ("test_run_data",)]
+
+
+def test_get_sqlite_query():
+    query = "UPDATE t SET a=%(a)s, b_2=%(b_2)s WHERE guid=%(guid)s"
+    assert db_writer.get_sqlite_query(query) == (
+        "UPDATE t SET a=:a, b_2=:b_2 WHERE guid=:guid"
+    )
+
+
+def test_insert_update_and_read_back(db_file):
+    manager = testcase_manager.TestcaseManager("test")
+    execution = testcase_manager.ExecutionQueryPayload()
+    execution.execution_start_time = 1000
+    execution.guid = "exec_1"
+    manager.insert_execution_data(execution)
+    testcase = testcase_manager.TestcaseDataPayload()
+    testcase.guid = "test_1"
+    testcase.execution_guid = "exec_1"
+    testcase.test_address = "my_test.py::MyTest::test_one"
+    testcase.browser = "chrome"
+    testcase.state = "Untested"
+    testcase.env = "test"
+    testcase.start_time = 1000
+    testcase.runtime = 0
+    manager.insert_testcase_data(testcase)
+    testcase.state = "Passed"
+    testcase.runtime = 250
+    manager.update_testcase_data(testcase)
+    testcase.log_url = "https://example.com/logs/index.html"
+    manager.update_testcase_log_url(testcase)
+    manager.update_execution_data("exec_1", 300)
+    manager.flush()
+    assert db_writer.get_writer().is_sqlite
+    assert db_writer.get_writer().failed == 0
+    assert get_rows(
+        db_file, "SELECT guid, total_execution_time FROM test_execution"
+    ) == [("exec_1", 300)]
+    assert get_rows(
+        db_file, "SELECT guid, state, runtime, log_url FROM test_run_data"
+    ) == [("test_1", "Passed", 250, "https://example.com/logs/index.html")]
+
+
+def test_batches_keep_the_order_of_queries(db_file):
+    insert = (
+        "INSERT INTO test_execution (guid, execution_start, "
+        "total_execution_time, username) "
+        "VALUES (%(guid)s, 0, %(time)s, 'Default')"
+    )
+    update = (
+        "UPDATE test_execution SET total_execution_time=%(time)s "
+        "WHERE guid=%(guid)s"
+    )
+    items = (
+        [(insert, {"guid": "a%s" % i, "time": -1}) for i in range(150)]
+        + [(update, {"guid": "a0", "time": 5})]
+        + [(insert, {"guid": "b%s" % i, "time": -1}) for i in range(49)]
+        + [(update, {"guid": "b0", "time": 7})]
+    )
+    writer = db_writer.DbWriter()
+    calls = []
+    first_batch_started = threading.Event()
+    queued = threading.Event()
+    execute_many = writer._DbWriter__execute_many
+
+    def record_execute_many(query, params_list):
+        if not calls:
+            first_batch_started.set()
+            queued.wait(10)  # Hold the writer until all queries are queued
+        calls.append((query, len(params_list)))
+        execute_many(query, params_list)
+
+    writer._DbWriter__execute_many = record_execute_many
+    writer.write(*items[0])
+    assert first_batch_started.wait(10)
+    for item in items[1:]:
+        writer.write(*item)
+    queued.set()
+    writer.flush()
+    # The first query ran alone, and then the rest ran in 2 full batches
+    assert writer.batches == 3
+    assert writer.written == len(items)
+    assert writer.failed == 0
+    # Consecutive queries with the same SQL run together (executemany)
+    assert calls == [
+        (insert, 1),
+        (insert, 100),
+        (insert, 49),
+        (update, 1),
+        (insert, 49),
+        (update, 1),
+    ]
+    rows = dict(
+        get_rows(
+            db_file, "SELECT guid, total_execution_time FROM test_execution"
+        )
+    )
+    assert len(rows) == 199
+    assert rows["a0"] == 5  # (The update ran after the insert)
+    assert rows["b0"] == 7
+    assert rows["a1"] == -1
+
+
+def test_reconnect_after_cooldown(db_file, monkeypatch):
+    connect = db_writer.get_sqlite_connection
+    connect_calls = []
+
+    def get_sqlite_connection(db_file):
+        connect_calls.append(db_file)
+        if len(connect_calls) == 1:
+            raise Exception("The DB is down!")
+        return connect(db_file)
+
+    monkeypatch.setattr(
+        db_writer, "get_sqlite_connection", get_sqlite_connection
+    )
+    insert = (
+        "INSERT INTO test_execution (guid, execution_start, "
+        "total_execution_time, username) "
+        "VALUES (%(guid)s, 0, 0, 'Default')"
+    )
+    writer = db_writer.DbWriter()
+    writer.write(insert, {"guid": "a"})
+    writer.flush()
+    writer.write(insert, {"guid": "b"})  # (Fails fast during the cooldown)
+    writer.flush()
+    assert writer.failed == 2
+    assert len(connect_calls) == 1
+    monkeypatch.setattr(db_writer, "RECONNECT_COOLDOWN", 0)
+    writer.write(insert, {"guid": "c"})
+    writer.flush()
+    assert writer.written == 1
+    assert len(connect_calls) == 2
+    assert get_rows(db_file, "SELECT guid FROM test_execution") == [("c",)]
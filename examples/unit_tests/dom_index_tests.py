@@ -0,0 +1,128 @@
+"""Tests for the DomIndex of CDP document trees. (No browser needed)"""
+import itertools
+import random
+import mycdp as cdp
+from seleniumbase.undetected.cdp_driver import cdp_util
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+
+def new_node(ids, parent=None, node_name="DIV"):
+    node_id = next(ids)
+    return cdp.dom.Node(
+        node_id=cdp.dom.NodeId(node_id),
+        backend_node_id=cdp.dom.BackendNodeId(node_id + 10000),
+        node_type=1,
+        node_name=node_name,
+        local_name=node_name.lower(),
+        node_value="",
+        parent_id=parent.node_id if parent else None,
+        children=[],
+    )
+
+
+def build_tree(seed, num_nodes=300):
+    """Returns a random document with shadow roots, iframe documents, and
+    template contents. (Nodes under the last 2 aren't in filter_recurse.)"""
+    rng = random.Random(seed)
+    ids = itertools.count(1)
+    doc = new_node(ids, node_name="#document")
+    nodes = [doc]
+    for x in range(num_nodes):
+        parent = rng.choice(nodes)
+        node = new_node(ids, parent)
+        roll = rng.random()
+        if roll < 0.05:
+            node.shadow_roots = [new_node(ids, node, "#document-fragment")]
+            nodes.append(node.shadow_roots[0])
+        elif roll < 0.08:
+            node.content_document = new_node(ids, None, "#document")
+            nodes.append(node.content_document)
+        elif roll < 0.1:
+            node.template_content = new_node(ids, node, "#document-fragment")
+            nodes.append(node.template_content)
+        parent.children.append(node)
+        nodes.append(node)
+    return doc, nodes
+
+
+def test_matches_filter_recurse():
+    for seed in range(5):
+        doc, nodes = build_tree(seed)
+        index = cdp_util.DomIndex(doc)
+        visited = cdp_util.filter_recurse_all(doc, lambda n: True)
+        assert len(index) == len(visited)
+        assert len(visited) < len(nodes)  # (Some nodes aren't covered)
+        for node in nodes + [new_node(itertools.count(99999))]:
+            node_id = node.node_id
+            backend_id = node.backend_node_id
+            expected = cdp_util.filter_recurse(
+                doc, lambda n: n.node_id == node_id
+            )
+            assert index.get_node(node_id) is expected
+            assert cdp_util.find_node_by_id(doc, node_id) is expected
+            expected = cdp_util.filter_recurse(
+                doc, lambda n: n.backend_node_id == backend_id
+            )
+            assert cdp_util.find_node_by_backend_id(
+                doc, backend_id
+            ) is expected
+
+
+def test_duplicate_ids_return_the_first_match():
+    ids = itertools.count(1)
+    doc = new_node(ids, node_name="#document")
+    host = new_node(ids, doc)
+    shadow_root = new_node(ids, host, "#document-fragment")
+    host.shadow_roots = [shadow_root]
+    in_shadow = new_node(itertools.count(50), shadow_root)
+    shadow_root.children.append(in_shadow)
+    child = new_node(itertools.count(50), host)
+    host.children.append(child)
+    later = new_node(itertools.count(50), doc)
+    doc.children.extend([host, later])
+    expected = cdp_util.filter_recurse(doc, lambda n: n.node_id == 50)
+    assert expected is in_shadow  # (Shadow roots are searched first)
+    assert cdp_util.find_node_by_id(doc, 50) is expected
+
+
+def test_parents():
+    doc, nodes = build_tree(7, num_nodes=100)
+    index = cdp_util.DomIndex(doc)
+    for node in cdp_util.filter_recurse_all(doc, lambda n: True):
+        parent = index.parents.get(node.node_id)
+        if parent.node_name == "#document-fragment":
+            continue  # (Children of shadow roots)
+        assert node in parent.children
+        if parent is doc:
+            # (The document itself isn't indexed, like in filter_recurse())
+            assert index.get_parent(node) is None
+        else:
+            assert index.get_parent(node) is parent
+
+
+def test_index_is_cached_per_tree():
+    doc, nodes = build_tree(3, num_nodes=50)
+    index = cdp_util.get_dom_index(doc)
+    assert cdp_util.get_dom_index(doc) is index
+    other_doc, nodes = build_tree(3, num_nodes=50)
+    assert cdp_util.get_dom_index(other_doc) is not index
+
+
+def test_remove_from_tree():
+    doc, nodes = build_tree(11, num_nodes=100)
+    visited = cdp_util.filter_recurse_all(doc, lambda n: True)
+    node = visited[len(visited) // 2]
+    removed_ids = {
+        n.node_id for n in cdp_util.filter_recurse_all(node, lambda n: True)
+    }
+    removed_ids.add(node.node_id)
+    cdp_util.find_node_by_id(doc, node.node_id)  # (Builds the index)
+    cdp_util.remove_from_tree(doc, node)
+    # The index is rebuilt for the changed tree
+    assert cdp_util.find_node_by_id(doc, node.node_id) is None
+    remaining = cdp_util.filter_recurse_all(doc, lambda n: True)
+    assert len(remaining) == len(visited) - len(removed_ids)
+    assert len(cdp_util.get_dom_index(doc)) == len(remaining)
@@ -0,0 +1,95 @@
+"""Offline tests for link checking. (With a local http.server)"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from seleniumbase.fixtures import link_checker
+from seleniumbase.fixtures import page_utils
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+
+class Handler(BaseHTTPRequestHandler):
+    statuses = {}  # {path: status_code} (Can be changed during tests)
+    requests = []  # [(method, path)]
+
+    def respond(self, method):
+        self.requests.append((method, self.path))
+        status_code = self.statuses.get(self.path, 404)
+        if self.path == "/no-head" and method == "HEAD":
+            status_code = 405
+        self.send_response(status_code)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        if method == "GET":
+            self.wfile.write(b"OK")
+
+    def do_HEAD(self):
+        self.respond("HEAD")
+
+    def do_GET(self):
+        self.respond("GET")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.statuses = {"/ok": 200, "/no-head": 200, "/deploy": 503}
+    Handler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%s" % httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_single_links_are_not_cached(server):
+    link = server + "/deploy"
+    assert page_utils._get_link_status_code(link) == 503
+    Handler.statuses["/deploy"] = 200
+    assert page_utils._get_link_status_code(link) == 200
+    assert Handler.requests == [("HEAD", "/deploy"), ("HEAD", "/deploy")]
+
+
+def test_single_links_only_use_head(server):
+    assert page_utils._get_link_status_code(server + "/no-head") == 405
+    assert page_utils._get_link_status_code(server + "/missing") == 404
+    assert all(method == "HEAD" for method, path in Handler.requests)
+
+
+def test_bulk_checks_are_cached(server):
+    checker = link_checker.LinkChecker(max_workers=4, max_per_host=2)
+    links = [server + path for path in ("/ok", "/missing", "/ok", "/deploy")]
+    status_codes = checker.get_status_codes(links)
+    assert status_codes == {
+        server + "/ok": 200,
+        server + "/missing": 404,
+        server + "/deploy": 503,
+    }
+    assert len(Handler.requests) == 3  # (Duplicates are removed)
+    Handler.statuses["/deploy"] = 200
+    assert checker.get_status_codes(links) == status_codes  # (Cached)
+    assert len(Handler.requests) == 3
+    assert checker.get_stats() == {"hits": 3, "misses": 3, "size": 3}
+    checker.clear_cache()
+    assert checker.get_status_code(server + "/deploy") == 200
+    checker.close()
+
+
+def test_bulk_checks_fall_back_to_get(server):
+    checker = link_checker.LinkChecker()
+    assert checker.get_status_code(server + "/no-head") == 200
+    assert Handler.requests == [("HEAD", "/no-head"), ("GET", "/no-head")]
+    checker.close()
+
+
+def test_connection_errors_are_not_cached(server):
+    checker = link_checker.LinkChecker()
+    link = "http://127.0.0.1:9/unreachable"
+    assert checker.get_status_code(link, timeout=1) == 404
+    assert checker.get_stats()["size"] == 0
+    checker.close()
@@ -0,0 +1,150 @@
+"""Tests for patching ChromeDriver binaries. (With fake binaries)"""
+import random
+import re
+import string
+from seleniumbase.undetected import patcher
+from seleniumbase.undetected.patcher import Patcher
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+JS_NAMES = ["Array", "Promise", "Symbol", "Object", "Proxy", "JSON", "Window"]
+
+
+def old_patch(content):
+    """The previous patch_exe(): 3 passes of re.sub() over the content."""
+    def gen_js_whitespaces(match):
+        return b"\n" * len(match.group())
+
+    def gen_call_function_js_cache_name(match):
+        rep_len = len(match.group()) - 3
+        ran_len = random.randint(6, rep_len)
+        bb = b"'" + bytes(str().join(random.choices(
+            population=string.ascii_letters, k=ran_len
+        )), 'ascii') + b"';" + (b"\n" * (rep_len - ran_len))
+        return bb
+
+    content = re.sub(
+        b"window\\.cdc_[a-zA-Z0-9]{22}_"
+        b"(Array|Promise|Symbol|Object|Proxy|JSON|Window) = window\\."
+        b"(Array|Promise|Symbol|Object|Proxy|JSON|Window);",
+        gen_js_whitespaces,
+        content,
+    )
+    content = re.sub(
+        b"window\\.cdc_[a-zA-Z0-9]{22}_"
+        b"(Array|Promise|Symbol|Object|Proxy|JSON|Window) \\|\\|",
+        gen_js_whitespaces,
+        content,
+    )
+    content = re.sub(
+        b"'\\$cdc_[a-zA-Z0-9]{22}_';",
+        gen_call_function_js_cache_name,
+        content,
+    )
+    return content
+
+
+def new_patch(content):
+    content = bytearray(content)
+    for start, replacement in Patcher.find_patches(content):
+        content[start:start + len(replacement)] = replacement
+    return bytes(content)
+
+
+def build_binary(seed, num_snippets=200):
+    """Returns random bytes with patchable strings and near misses."""
+    rng = random.Random(seed)
+
+    def cdc(length=22):
+        chars = string.ascii_letters + string.digits
+        return "cdc_%s_" % "".join(rng.choices(chars, k=length))
+
+    snippets = [
+        lambda: "window.%s%s = window.%s;" % (
+            cdc(), rng.choice(JS_NAMES), rng.choice(JS_NAMES)
+        ),
+        lambda: "window.%s%s ||" % (cdc(), rng.choice(JS_NAMES)),
+        lambda: "'$%s';" % cdc(),
+        # Near misses
+        lambda: "window.%s%s = window.%s;" % (
+            cdc(21), rng.choice(JS_NAMES), rng.choice(JS_NAMES)
+        ),
+        lambda: "window.%sDocument ||" % cdc(),
+        lambda: "windowX%sArray ||" % cdc(),
+        lambda: "window.%sArray = window.Array," % cdc(),
+        lambda: "'$%s'" % cdc(),
+        lambda: "\"$%s\";" % cdc(),
+        lambda: "$%s';" % cdc(),
+        lambda: cdc(),
+        lambda: "cdc_",
+        lambda: "window.",
+    ]
+    filler = string.ascii_letters + string.digits + "_.$'\";|= \n\x00"
+    parts = []
+    for x in range(num_snippets):
+        parts.append(rng.choice(snippets)())
+        if rng.random() < 0.7:  # (Otherwise the snippets are adjacent)
+            parts.append("".join(rng.choices(filler, k=rng.randint(1, 40))))
+    return "".join(parts).encode("latin-1")
+
+
+def test_find_patches_matches_old_patch():
+    for seed in range(20):
+        content = build_binary(seed)
+        random.seed(seed)
+        expected = old_patch(content)
+        random.seed(seed)
+        assert new_patch(content) == expected
+        assert len(expected) == len(content)
+        if seed == 0:
+            assert expected != content  # (Some strings were patched)
+
+
+def test_find_patches():
+    content = (
+        b"\x00window.cdc_adoQpoasnfa76pfcZLmcfl_Array = window.Array;"
+        b"window.cdc_adoQpoasnfa76pfcZLmcfl_Promise ||"
+        b"'$cdc_asdjflasutopfhvcZLmcfl_';\x00"
+    )
+    assert patcher.UNPATCHED_PATTERN.search(content)
+    patches = Patcher.find_patches(content)
+    assert [start for start, replacement in patches] == [1, 56, 100]
+    assert patches[0][1] == b"\n" * 55
+    assert patches[1][1] == b"\n" * 44
+    name = patches[2][1]
+    assert len(name) == len(b"'$cdc_asdjflasutopfhvcZLmcfl_';")
+    assert re.match(b"^'[a-zA-Z]{6,}';\n*$", name)
+    patched = new_patch(content)
+    assert not patcher.UNPATCHED_PATTERN.search(patched)
+    assert not patcher.CDC_PATTERN.search(patched)
+    assert Patcher.find_patches(patched) == []
+    assert Patcher.find_patches(b"") == []
+
+
+def test_patch_exe_and_marker(tmp_path):
+    exe_path = str(tmp_path / "chromedriver")
+    content = build_binary(1) + (
+        b"window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol = window.Symbol;"
+    )
+    with open(exe_path, "wb") as f:
+        f.write(content)
+    p = Patcher(executable_path=exe_path)
+    assert not p.is_binary_patched()
+    assert p.patch_exe()
+    with open(exe_path, "rb") as f:
+        patched = f.read()
+    assert len(patched) == len(content)
+    assert not patcher.UNPATCHED_PATTERN.search(patched)
+    assert not p.find_patches(patched)
+    assert p.has_patched_marker(exe_path)
+    assert p.is_binary_patched()
+    assert p.patch_exe()  # (Already patched, so nothing changes)
+    with open(exe_path, "rb") as f:
+        assert f.read() == patched
+    # A different binary of the same size isn't seen as patched
+    with open(exe_path, "wb") as f:
+        f.write(content)
+    assert not p.has_patched_marker(exe_path)
+    assert not p.is_binary_patched()
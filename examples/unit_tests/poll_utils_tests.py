@@ -0,0 +1,143 @@
+"""Tests for the shared PollScheduler of wait loops. (With a fake clock)"""
+import asyncio
+import time
+import pytest
+from seleniumbase import config as sb_config
+from seleniumbase.common.exceptions import TimeLimitExceededException
+from seleniumbase.fixtures import poll_utils
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(poll_utils, "time", clock)
+    monkeypatch.setattr(sb_config, "time_limit", None, raising=False)
+    poll_utils.reset_stats()
+    yield clock
+    poll_utils.reset_stats()
+
+
+def test_backoff_schedule(clock):
+    poller = poll_utils.PollScheduler(1, name="test_wait")
+    checks = list(poller)
+    # 5ms, 10ms, 20ms, ... capped at MAX_INTERVAL (200ms)
+    assert clock.sleeps[:7] == [0.005, 0.01, 0.02, 0.04, 0.08, 0.16, 0.2]
+    assert max(clock.sleeps) == poll_utils.MAX_INTERVAL
+    # The last sleep is cut short, so that the timeout isn't overshot
+    assert round(sum(clock.sleeps), 6) == 1
+    assert clock.sleeps[-1] < poll_utils.MAX_INTERVAL
+    assert checks == list(range(len(clock.sleeps) + 1))
+    assert poller.timed_out
+    assert poller.stats["checks"] == len(checks)
+
+
+def test_custom_intervals(clock):
+    poller = poll_utils.PollScheduler(
+        1, min_interval=0.1, max_interval=0.25
+    )
+    list(poller)
+    assert clock.sleeps[:4] == [0.1, 0.2, 0.25, 0.25]
+
+
+def test_early_exit(clock):
+    poller = poll_utils.PollScheduler(5, name="early")
+    for attempt in poller:
+        if attempt == 2:
+            break
+    assert clock.sleeps == [0.005, 0.01]
+    assert not poller.timed_out
+    assert poll_utils.get_stats()["recent"][-1]["checks"] == 3
+
+
+@pytest.mark.parametrize("timeout", [0, None, -1])
+def test_minimum_single_check(clock, timeout):
+    poller = poll_utils.PollScheduler(timeout)
+    assert list(poller) == [0]
+    assert clock.sleeps == []
+    assert poller.timed_out
+
+
+def test_waiter(clock):
+    waited = []
+
+    def waiter(remaining):
+        waited.append(remaining)
+        clock.now += 0.5
+        return True
+
+    poller = poll_utils.PollScheduler(1, waiter=waiter)
+    assert list(poller) == [0, 1, 2]
+    assert waited == [1, 0.5]
+    assert clock.sleeps == []  # (The waiter blocks instead of sleeping)
+    assert poller.stats["slept"] == 1.0
+
+
+def test_time_limit(clock, monkeypatch):
+    monkeypatch.setattr(sb_config, "time_limit", 2, raising=False)
+    monkeypatch.setattr(sb_config, "time_limit_ms", 2000, raising=False)
+    monkeypatch.setattr(
+        sb_config, "start_time_ms", int(time.time() * 1000) - 3000,
+        raising=False,
+    )
+    monkeypatch.setattr(sb_config, "recorder_mode", False, raising=False)
+    with pytest.raises(TimeLimitExceededException):
+        list(poll_utils.PollScheduler(1))
+    # (The time limit is ignored when requested)
+    assert list(
+        poll_utils.PollScheduler(0, ignore_test_time_limit=True)
+    ) == [0]
+
+
+def test_get_stats_and_reset_stats(clock):
+    list(poll_utils.PollScheduler(0.1, name="timed_out"))
+    for attempt in poll_utils.PollScheduler(1, name="found"):
+        break
+    stats = poll_utils.get_stats()
+    assert stats["waits"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["checks"] == stats["recent"][0]["checks"] + 1
+    assert stats["seconds"] == 0.1
+    assert [wait["name"] for wait in stats["recent"]] == [
+        "timed_out", "found"
+    ]
+    poller = poll_utils.PollScheduler(1)
+    poller.record()
+    poller.record()  # (Only recorded once)
+    assert poll_utils.get_stats()["waits"] == 3
+    poll_utils.reset_stats()
+    assert poll_utils.get_stats() == {
+        "waits": 0, "timeouts": 0, "checks": 0, "seconds": 0.0, "recent": []
+    }
+
+
+def test_async_iteration(monkeypatch):
+    poll_utils.reset_stats()
+    monkeypatch.setattr(sb_config, "time_limit", None, raising=False)
+
+    async def wait():
+        attempts = []
+        async for attempt in poll_utils.PollScheduler(0.05, name="async"):
+            attempts.append(attempt)
+        return attempts
+
+    attempts = asyncio.run(wait())
+    assert attempts[0] == 0 and len(attempts) >= 2
+    assert poll_utils.get_stats()["recent"][-1]["timed_out"]
+    poll_utils.reset_stats()
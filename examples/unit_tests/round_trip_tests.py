@@ -0,0 +1,136 @@
+"""Tests for counting WebDriver round trips. (With a stub driver)"""
+from seleniumbase import BaseCase
+from seleniumbase.config import settings
+from seleniumbase.fixtures import shared_utils
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+
+class StubElement:
+    """Each WebElement call is one driver.execute() command."""
+    def __init__(self, driver):
+        self.driver = driver
+
+    def is_displayed(self):
+        return self.driver.execute("isElementDisplayed")
+
+    def is_enabled(self):
+        return self.driver.execute("isElementEnabled")
+
+    @property
+    def tag_name(self):
+        return self.driver.execute("getElementTagName")
+
+    def get_attribute(self, name):
+        return self.driver.execute("getElementAttribute", name)
+
+    def click(self):
+        return self.driver.execute("clickElement")
+
+
+class StubDriver:
+    """Each WebDriver call is one driver.execute() command."""
+    def __init__(self):
+        self.capabilities = {"browserName": "chrome"}
+        self.commands = []
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        if driver_command == "executeScript":
+            if "var el = arguments[0], scroll" in params:
+                return {
+                    "visible": True,
+                    "tag": "button",
+                    "href": None,
+                    "onclick": None,
+                    "target": None,
+                    "rect": {"x": 8, "y": 8, "width": 60, "height": 20},
+                    "url": "https://example.com/",
+                }
+            if "angular: !!window.angular" in params:
+                return {"url": "https://example.com/", "angular": False}
+            if "document.readyState" in params:
+                return "complete"
+            return True
+        if driver_command == "getWindowHandles":
+            return ["window_1"]
+        if driver_command == "getCurrentUrl":
+            return "https://example.com/"
+        if driver_command == "getElementTagName":
+            return "button"
+        return True
+
+    def find_element(self, by="css selector", value=None):
+        self.execute("findElement", value)
+        return StubElement(self)
+
+    def find_elements(self, by="css selector", value=None):
+        self.execute("findElements", value)
+        return [StubElement(self)]
+
+    def execute_script(self, script, *args):
+        return self.execute("executeScript", script)
+
+    @property
+    def window_handles(self):
+        return self.execute("getWindowHandles")
+
+    @property
+    def current_url(self):
+        return self.execute("getCurrentUrl")
+
+
+class StubTest(BaseCase):
+    __test__ = False  # (Only used as a stub. Not collected by pytest.)
+
+    def test_stub(self):
+        pass
+
+
+def get_stub_test():
+    sb = StubTest("test_stub")
+    sb.browser = "chrome"
+    sb.headless = True
+    sb.headless2 = False
+    sb.xvfb = False
+    sb.undetectable = False
+    sb.demo_mode = False
+    sb.slow_mode = False
+    sb.recorder_mode = False
+    sb.timeout_multiplier = None
+    sb.page_load_strategy = None
+    sb.driver = StubDriver()
+    shared_utils.add_round_trip_counter(sb.driver)
+    return sb
+
+
+def test_add_round_trip_counter():
+    driver = StubDriver()
+    shared_utils.add_round_trip_counter(driver)
+    shared_utils.add_round_trip_counter(driver)  # (Only wraps once)
+    driver.find_element("css selector", "h1").click()
+    assert driver._round_trips == 2
+    driver._round_trips = 0
+    assert driver.current_url == "https://example.com/"
+    assert driver._round_trips == 1
+
+
+def test_batched_click_has_fewer_round_trips(monkeypatch):
+    sb = get_stub_test()
+    monkeypatch.setattr(settings, "BATCH_ACTION_PROBES", False)
+    sb.reset_round_trip_count()
+    sb.click("button")
+    unbatched = sb.get_round_trip_count()
+    assert "isElementDisplayed" in sb.driver.commands
+    assert unbatched == len(sb.driver.commands)
+    monkeypatch.setattr(settings, "BATCH_ACTION_PROBES", True)
+    sb.driver.commands = []
+    sb.reset_round_trip_count()
+    sb.click("button")
+    batched = sb.get_round_trip_count()
+    assert "isElementDisplayed" not in sb.driver.commands
+    assert sb.driver.commands.count("clickElement") == 1
+    assert batched == len(sb.driver.commands)
+    assert batched < unbatched
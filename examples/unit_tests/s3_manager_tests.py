@@ -0,0 +1,137 @@
+"""Tests for the S3 log uploader, with a mocked S3 (moto)."""
+import gzip
+import threading
+import pytest
+from seleniumbase.config import settings
+from seleniumbase.core import s3_manager
+
+moto = pytest.importorskip("moto")
+boto3 = pytest.importorskip("boto3")
+BUCKET = "sb-test-logs"
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setattr(settings, "S3_ENDPOINT_URL", None, raising=False)
+    monkeypatch.setattr(settings, "S3_GZIP_UPLOADS", False, raising=False)
+    monkeypatch.setattr(s3_manager, "shared_sessions", {})
+    with moto.mock_aws():
+        boto3.client("s3").create_bucket(Bucket=BUCKET)
+        yield s3_manager.S3LoggingBucket(
+            log_bucket=BUCKET,
+            bucket_url="https://%s.s3.amazonaws.com/" % BUCKET,
+            selenium_access_key="testing",
+            selenium_secret_key="testing",
+        )
+        s3_manager.wait_for_uploads()
+
+
+def get_object(name):
+    return boto3.client("s3").get_object(Bucket=BUCKET, Key=name)
+
+
+def test_concurrent_uploads(bucket, tmp_path, monkeypatch):
+    # The first two uploads only finish if they run at the same time
+    barrier = threading.Barrier(2, timeout=10)
+    client = bucket.client
+    upload_file = client.upload_file
+    calls = []
+
+    def upload_file_at_once(*args, **kwargs):
+        calls.append(threading.current_thread().name)
+        if len(calls) <= 2:
+            barrier.wait()
+        return upload_file(*args, **kwargs)
+
+    monkeypatch.setattr(client, "upload_file", upload_file_at_once)
+    futures = []
+    for i in range(12):
+        path = tmp_path / ("log_%s.txt" % i)
+        path.write_text("Log %s" % i)
+        futures.append(
+            bucket.upload_file_async("logs/log_%s.txt" % i, str(path))
+        )
+    s3_manager.wait_for_uploads()
+    for future in futures:
+        assert future.result() is None
+    assert len(set(calls[:2])) == 2
+    assert all(name.startswith("sb-s3-upload") for name in calls)
+    listed = boto3.client("s3").list_objects_v2(Bucket=BUCKET)["Contents"]
+    assert len(listed) == 12
+    assert get_object("logs/log_7.txt")["Body"].read() == b"Log 7"
+
+
+def test_content_types(bucket, tmp_path):
+    files = {
+        "page.html": "text/html",
+        "screenshot.png": "image/png",
+        "data.json": "application/json",
+        "basic_test_info.txt": "text/plain",
+        "no_extension": "text/plain",
+    }
+    for name in files:
+        (tmp_path / name).write_bytes(b"data")
+        bucket.upload_file("types/" + name, str(tmp_path / name))
+    for name, content_type in files.items():
+        s3_object = get_object("types/" + name)
+        assert s3_object["ContentType"] == content_type
+        assert "ContentEncoding" not in s3_object
+
+
+def test_gzip_uploads(bucket, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "S3_GZIP_UPLOADS", True)
+    html = ("<p>%s</p>" % ("SeleniumBase " * 20000)).encode("utf-8")
+    (tmp_path / "page.html").write_bytes(html)
+    (tmp_path / "screenshot.png").write_bytes(b"\x89PNG" + b"\x00" * 1000)
+    bucket.upload_file("gzip/page.html", str(tmp_path / "page.html"))
+    bucket.upload_file("gzip/shot.png", str(tmp_path / "screenshot.png"))
+    s3_object = get_object("gzip/page.html")
+    assert s3_object["ContentType"] == "text/html"
+    assert s3_object["ContentEncoding"] == "gzip"
+    body = s3_object["Body"].read()
+    assert len(body) < len(html)
+    assert gzip.decompress(body) == html
+    s3_object = get_object("gzip/shot.png")  # (Images aren't gzipped)
+    assert "ContentEncoding" not in s3_object
+    assert s3_object["Body"].read() == b"\x89PNG" + b"\x00" * 1000
+
+
+def test_index_file(bucket, tmp_path):
+    bucket.save_uploaded_file_names(["b/2.txt", "a/1.txt", "b/2.txt"])
+    assert s3_manager.already_uploaded_files[:2] == ["a/1.txt", "b/2.txt"]
+
+    def save_data_to_logs(data, file_name):
+        (tmp_path / file_name).write_text(data)
+
+    index_url = bucket.upload_index_file(
+        "test_address", "guid", str(tmp_path), save_data_to_logs
+    )
+    s3_manager.wait_for_uploads()
+    assert index_url.endswith("test_address/guid/index.html")
+    body = get_object("test_address/guid/index.html")["Body"].read()
+    assert b"a/1.txt" in body and b"b/2.txt" in body
+
+
+def test_endpoint_url(monkeypatch):
+    monkeypatch.setattr(
+        settings, "S3_ENDPOINT_URL", "http://127.0.0.1:5000", raising=False
+    )
+    monkeypatch.setattr(s3_manager, "shared_sessions", {})
+    s3_bucket = s3_manager.S3LoggingBucket(
+        log_bucket=BUCKET,
+        selenium_access_key="testing",
+        selenium_secret_key="testing",
+    )
+    assert s3_bucket.client.meta.endpoint_url == "http://127.0.0.1:5000"
+    s3_key = s3_bucket.get_key("logs/index.html")
+    assert s3_key.meta.client.meta.endpoint_url == "http://127.0.0.1:5000"
+    assert s3_manager.S3LoggingBucket(
+        log_bucket=BUCKET,
+        selenium_access_key="testing",
+        selenium_secret_key="testing",
+    ).client is s3_bucket.client  # (The client is shared)
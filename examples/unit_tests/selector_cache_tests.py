@@ -0,0 +1,134 @@
+"""Tests for the LRU cache of selector translations."""
+import pytest
+from seleniumbase.fixtures import css_to_xpath
+from seleniumbase.fixtures import page_utils
+from seleniumbase.fixtures import selector_cache
+from seleniumbase.fixtures import xpath_to_css
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+SELECTORS = [
+    ("button", "css selector"),
+    ('button:contains("Next")', "css selector"),
+    ("//div[@id='main']", "css selector"),
+    ("link=Sign in", "css selector"),
+    ("partial_link=Sign", "css selector"),
+    ("name=q", "css selector"),
+    ("css selector", "#swapped"),
+    ("h1", ""),
+]
+
+
+@pytest.fixture
+def new_cached(monkeypatch):
+    """Decorates test functions without keeping them in the global stats."""
+    monkeypatch.setattr(selector_cache, "cached_functions", [])
+    return selector_cache.cached
+
+
+def test_hits_and_misses(new_cached):
+    calls = []
+
+    @new_cached
+    def convert(selector, by="css selector"):
+        calls.append(selector)
+        return selector.upper()
+
+    assert convert("a") == "A"
+    assert convert("a") == "A"
+    assert convert("a", "xpath") == "A"  # (A different key)
+    assert calls == ["a", "a"]
+    stats = selector_cache.get_stats()
+    assert stats["functions"] == {
+        "selector_cache_tests.convert": {"hits": 1, "misses": 2, "size": 2}
+    }
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+    selector_cache.clear()
+    assert selector_cache.get_stats()["size"] == 0
+    assert convert("a") == "A"
+    assert calls == ["a", "a", "a"]
+
+
+def test_lru_eviction(new_cached, monkeypatch):
+    monkeypatch.setattr(selector_cache, "MAX_CACHED_SELECTORS", 2)
+    calls = []
+
+    @new_cached
+    def convert(selector):
+        calls.append(selector)
+        return selector
+
+    convert("a")
+    convert("b")
+    convert("a")  # ("a" is now the most recently used)
+    convert("c")  # (Evicts "b")
+    convert("a")
+    convert("b")
+    assert calls == ["a", "b", "c", "b"]
+    assert selector_cache.get_stats()["size"] == 2
+
+
+def test_exceptions_are_not_cached(new_cached):
+    calls = []
+
+    @new_cached
+    def convert(selector):
+        calls.append(selector)
+        raise Exception("Invalid selector!")
+
+    for x in range(2):
+        with pytest.raises(Exception):
+            convert("a")
+    assert calls == ["a", "a"]
+    assert selector_cache.get_stats()["size"] == 0
+
+
+def test_recalculate_selector_matches_uncached():
+    uncached = page_utils._recalculate_selector.__wrapped__
+    selector_cache.clear()
+    for xp_ok in (True, False):
+        for selector, by in SELECTORS:
+            expected = uncached(selector, by, xp_ok)
+            assert page_utils.recalculate_selector(
+                selector, by, xp_ok=xp_ok
+            ) == expected
+            assert page_utils.recalculate_selector(
+                selector, by, xp_ok=xp_ok
+            ) == expected
+    info = page_utils._recalculate_selector.cache_info()
+    assert info.misses == 2 * len(SELECTORS)
+    assert info.hits == 2 * len(SELECTORS)
+    # "xp_ok" is part of the key
+    assert page_utils.recalculate_selector(
+        'button:contains("Next")', "css selector"
+    )[1] == "xpath"
+    assert page_utils.recalculate_selector(
+        'button:contains("Next")', "css selector", xp_ok=False
+    ) == ('button:contains("Next")', "css selector")
+
+
+def test_invalid_inputs_are_not_cached():
+    selector_cache.clear()
+    with pytest.raises(Exception):
+        page_utils.recalculate_selector(None, "css selector")
+    with pytest.raises(Exception):
+        page_utils.recalculate_selector("button", "invalid by")
+    assert page_utils._recalculate_selector.cache_info().currsize == 0
+
+
+def test_conversions_match_uncached():
+    selector_cache.clear()
+    css = 'div.results > a:contains("Next")'
+    expected = css_to_xpath.convert_css_to_xpath.__wrapped__(css)
+    assert css_to_xpath.convert_css_to_xpath(css) == expected
+    assert css_to_xpath.convert_css_to_xpath(css) == expected
+    xpath = "//div[@id='main']/a[@class='next']"
+    expected = xpath_to_css.convert_xpath_to_css.__wrapped__(xpath)
+    assert xpath_to_css.convert_xpath_to_css(xpath) == expected
+    assert xpath_to_css.convert_xpath_to_css(xpath) == expected
+    functions = selector_cache.get_stats()["functions"]
+    assert functions["css_to_xpath.convert_css_to_xpath"]["hits"] == 1
+    assert functions["xpath_to_css.convert_xpath_to_css"]["hits"] == 1
+    assert "page_utils._recalculate_selector" in functions
@@ -0,0 +1,87 @@
+"""Offline tests for the pixel diffs of self.check_window(). (Pillow)"""
+import pytest
+from seleniumbase.core import visual_diff
+
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+if __name__ == "__main__":
+    from pytest import main
+    main([__file__, "-v", "-s"])
+
+
+def save_page(path, lines, size=(1280, 2000)):
+    image = Image.new("RGB", size, (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    for index, line in enumerate(lines):
+        draw.text((40, 40 + 24 * index), line, fill=(0, 0, 0))
+    image.save(str(path))
+    return str(path)
+
+
+LINES = ["SeleniumBase line %s: Automated Visual Testing" % i
+         for i in range(60)]
+
+
+def test_identical_files(tmp_path):
+    baseline = save_page(tmp_path / "baseline.png", LINES)
+    latest = save_page(tmp_path / "latest.png", LINES)
+    results = visual_diff.compare_images(baseline, latest)
+    assert results["identical"] and results["unchanged"]
+    assert results["changed_ratio"] == 0.0
+
+
+def test_small_text_change_is_not_unchanged(tmp_path):
+    changed_lines = list(LINES)
+    changed_lines[30] = "SeleniumBase line 30: Automated Visual Tests!"
+    baseline = save_page(tmp_path / "baseline.png", LINES)
+    latest = save_page(tmp_path / "latest.png", changed_lines)
+    diff_path = str(tmp_path / "heatmap.png")
+    results = visual_diff.compare_images(baseline, latest, diff_path)
+    # The dHash is too coarse to see a change of one line of text
+    assert results["hash_distance"] <= visual_diff.HASH_THRESHOLD
+    assert not results["identical"]
+    assert not results["unchanged"]
+    assert 0 < results["changed_ratio"] < 0.001
+    assert results["changed_blocks"] > 0
+    assert results["diff_path"] == diff_path
+    with Image.open(diff_path) as heatmap:
+        assert heatmap.size == (1280, 2000)
+
+
+def test_ratio_not_needed(tmp_path):
+    baseline = save_page(tmp_path / "baseline.png", LINES)
+    latest = save_page(tmp_path / "latest.png", LINES[::-1][:20])
+    results = visual_diff.compare_images(
+        baseline, latest, ratio_needed=False
+    )
+    assert results["hash_distance"] > visual_diff.HASH_THRESHOLD
+    assert not results["unchanged"]
+    assert results["changed_ratio"] is None  # (No pixel diff)
+    results = visual_diff.compare_images(baseline, latest)
+    assert not results["unchanged"]
+    assert results["changed_ratio"] > 0
+
+
+def test_size_changed(tmp_path):
+    baseline = save_page(tmp_path / "baseline.png", LINES)
+    latest = save_page(tmp_path / "latest.png", LINES, size=(1280, 2100))
+    results = visual_diff.compare_images(baseline, latest)
+    assert results["size_changed"]
+    assert not results["unchanged"]
+    assert results["changed_ratio"] > 0
+
+
+def test_pixel_tolerance(tmp_path):
+    baseline = tmp_path / "baseline.png"
+    latest = tmp_path / "latest.png"
+    Image.new("RGB", (64, 64), (200, 200, 200)).save(str(baseline))
+    Image.new("RGB", (64, 64), (208, 200, 200)).save(str(latest))
+    results = visual_diff.compare_images(str(baseline), str(latest))
+    assert results["unchanged"]  # (Within PIXEL_TOLERANCE)
+    assert results["changed_ratio"] == 0.0
+    results = visual_diff.compare_images(
+        str(baseline), str(latest), pixel_tolerance=4
+    )
+    assert not results["unchanged"]
+    assert results["changed_ratio"] == 1.0
@@ -83,6 +83,7 @@ behave -D agent="User Agent String" -D demo
 -D uc-cdp-events  (Capture CDP events when running in "-D undetected" mode)
 -D log-cdp  ("goog:loggingPrefs", {"performance": "ALL", "browser": "ALL"})
 -D remote-debug  (Sync to Chrome Remote Debugger chrome://inspect/#devices)
+-D launch-profile  (Print a timing breakdown of each browser launch.)
 -D dashboard  (Enable the SeleniumBase Dashboard. Saved at: dashboard.html)
 -D dash-title=STRING  (Set the title shown for the generated dashboard.)
 -D enable-3d-apis  (Enables WebGL and 3D APIs.)
@@ -233,6 +234,7 @@ def get_configured_sb(context):
     sb.do_not_track = False
     sb.external_pdf = False
     sb.remote_debug = False
+    sb.launch_profile = False
     sb.settings_file = None
     sb.user_data_dir = None
     sb.chromium_arg = None
@@ -771,6 +773,10 @@ def get_configured_sb(context):
         if low_key in ["remote-debug", "remote_debug", "remote-debugger"]:
             sb.remote_debug = True
             continue
+        # Handle: -D launch-profile / launch_profile
+        if low_key in ["launch-profile", "launch_profile"]:
+            sb.launch_profile = True
+            continue
         # Handle: -D settings=FILE / settings-file=FILE / settings_file=FILE
         if low_key in ["settings", "settings-file", "settings_file"]:
             settings_file = userdata[key]
@@ -1050,6 +1056,7 @@ def get_configured_sb(context):
     sb_config.disable_js = sb.disable_js
     sb_config.disable_csp = sb.disable_csp
     sb_config.record_sleep = sb.record_sleep
+    sb_config.launch_profile = sb.launch_profile
     sb_config._is_timeout_changed = False
     sb_config._SMALL_TIMEOUT = settings.SMALL_TIMEOUT
     sb_config._LARGE_TIMEOUT = settings.LARGE_TIMEOUT
@@ -79,6 +79,48 @@ WAIT_FOR_ANGULARJS = True
 # Skip all calls to wait_for_ready_state_complete() and wait_for_angularjs().
 SKIP_JS_WAITS = False
 
+# If True, element waits (Eg. self.wait_for_element_visible(selector)) will
+# wait in the browser with a MutationObserver between checks, which returns
+# as soon as the DOM changes to meet the condition. (Instead of 100ms sleeps.)
+# If the observer can't run on a page, waits fall back to regular polling.
+USE_OBSERVER_WAITS = False
+
+# If True, self.click(selector) on Chromium browsers batches the probes that
+# happen before and after the click (visibility, tag, href, target, URL,
+# scrolling, readyState) into single script calls, rather than making a
+# separate WebDriver call for each. (Fewer round trips when using a Grid.)
+BATCH_ACTION_PROBES = False
+
+# If True, the event loop of CDP Mode runs on a dedicated daemon thread.
+# Sync CDP methods submit their coroutines to that thread, which keeps
+# CDP events flowing between calls, and allows calls from multiple threads.
+USE_CDP_LOOP_THREAD = False
+
+# If greater than 0, each test process keeps a warm pool of this many
+# pre-launched browsers per set of launch options. Tests check out a warm
+# browser, which gets reset and returned to the pool after the test.
+# (Not used with UC Mode, or with a custom user_data_dir.)
+WARM_BROWSER_POOL_SIZE = 0
+
+# If True, each tab of CDP Mode keeps a local mirror of the DOM, which is
+# updated with DOM events (Eg. DOM.childNodeInserted). Queries and waits use
+# the mirror, instead of fetching the whole document for every query.
+# (The document is only refetched after navigations or unknown changes.)
+USE_CDP_DOM_MIRROR = False
+
+# If True, CSS queries of CDP Mode (Eg. sb.cdp.select(selector)) only fetch
+# the root node of the document, and then describe the matching nodes.
+# (Instead of fetching the whole document tree for every query.)
+# The parent, children, and text of found elements are loaded on first use.
+USE_CDP_SHALLOW_QUERIES = False
+
+# If set, sb.cdp.open(url) returns as soon as the new page reaches this
+# milestone (detected with page lifecycle and network events), instead of
+# sleeping for a fixed time and then waiting for the tab to become idle.
+# Options: "domcontentloaded", "load", "networkidle0", "networkidle2".
+# (networkidle0/2: No more than 0/2 requests in flight for 0.5s after load)
+CDP_MODE_WAIT_UNTIL = None
+
 # Default time to wait after each browser action performed during Demo Mode.
 # Use Demo Mode when you want others to see what your automation is doing.
 # Usage: "--demo_mode". (Can be overwritten by using "--demo_sleep=TIME".)
@@ -165,6 +207,10 @@ DB_PORT = 3306
 DB_USERNAME = "root"
 DB_PASSWORD = "test"
 DB_SCHEMA = "test_db"
+# If set, DB reporting saves results to this local SQLite file instead,
+# which doesn't need a MySQL server. (Eg. DB_SQLITE_FILE = "test_db.sqlite")
+# (The tables are created from seleniumbase/core/create_db_tables.sql)
+DB_SQLITE_FILE = None
 
 
 # Amazon S3 Bucket Credentials
@@ -175,6 +221,10 @@ S3_LOG_BUCKET = "[S3 BUCKET NAME]"
 S3_BUCKET_URL = "https://s3.amazonaws.com/[S3 BUCKET NAME]/"
 S3_SELENIUM_ACCESS_KEY = "[S3 ACCESS KEY]"
 S3_SELENIUM_SECRET_KEY = "[S3 SECRET KEY]"
+# (Optional) The URL of an S3-compatible server. (Eg. a moto server / MinIO)
+S3_ENDPOINT_URL = None
+# If True, text files (Eg. html, txt, json) are gzipped for uploads to S3.
+S3_GZIP_UPLOADS = False
 
 
 # ENCRYPTION SETTINGS
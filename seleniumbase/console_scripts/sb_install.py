@@ -49,6 +49,7 @@ import tarfile
 import urllib3
 import zipfile
 from contextlib import suppress
+from seleniumbase.core import launch_cache
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import shared_utils
 from seleniumbase import config as sb_config
@@ -316,6 +317,7 @@ def log_d(message):
         print(message)
 
 
+@launch_cache.phase("driver download")
 def main(override=None, intel_for_uc=None, force_uc=None):
     if override:
         found_proxy = None
@@ -294,7 +294,6 @@ def main():
     data.append("report.html")
     data.append("report.xml")
     data.append("dashboard.html")
-    data.append("dashboard.json")
     data.append("dash_pie.json")
     data.append("dashboard.lock")
     data.append("allure_report")
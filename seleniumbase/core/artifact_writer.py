@@ -0,0 +1,118 @@
+"""A background writer for the log files of tests. (Eg. failure artifacts)
+
+The screenshot, page source, and test info of a failing test are captured
+on the test thread (they need the browser), and then handed to a writer
+thread, which saves them to disk while teardown continues (and quits the
+browser). The data is only captured once: the writer gets the same bytes
+and strings that were captured, and it can also save a second copy of each
+file (Eg. into the archived_logs/ folder), so that archiving is done
+incrementally instead of by copying the whole latest_logs/ folder later.
+
+Anything that reads log files must call flush() first. (That's done by
+archive_logs_if_set(), clear_empty_logs(), log_folder_setup(), and the S3
+uploader.) Pending files are also flushed when the process exits.
+
+Usage:
+    artifact_writer.write(file_path, data)  # data is bytes or str
+    ...
+    artifact_writer.flush()  # Waits until all files are written"""
+import atexit
+import os
+import queue
+import threading
+from contextlib import suppress
+from seleniumbase.fixtures import shared_utils
+
+MAX_PENDING = 100  # If more files are pending, write() waits for the writer
+
+shared_writer = None
+shared_writer_lock = threading.Lock()
+
+
+def write_file(file_path, data):
+    """Writes bytes or str (as UTF-8) to a file. (Creates the folder.)"""
+    folder = os.path.dirname(file_path)
+    if folder and not os.path.exists(folder):
+        with suppress(Exception):
+            os.makedirs(folder, exist_ok=True)
+    if isinstance(data, bytes):
+        with open(file_path, mode="wb") as f:
+            f.write(data)
+    else:
+        with open(file_path, mode="w+", encoding="utf-8") as f:
+            f.write(data)
+    with suppress(Exception):
+        shared_utils.make_writable(file_path)
+
+
+class ArtifactWriter:
+    def __init__(self, max_pending=MAX_PENDING):
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.written = 0
+        self.failed = 0
+        self.__thread = None
+        self.__pid = None
+        self.__lock = threading.Lock()
+
+    def __start(self):
+        with self.__lock:
+            if (
+                self.__thread
+                and self.__thread.is_alive()
+                and self.__pid == os.getpid()
+            ):
+                return
+            if self.__pid != os.getpid():
+                # (A forked process doesn't have the thread of its parent)
+                self.queue = queue.Queue(maxsize=self.queue.maxsize)
+            self.__pid = os.getpid()
+            self.__thread = threading.Thread(
+                target=self.__run, name="sb-artifact-writer", daemon=True
+            )
+            self.__thread.start()
+
+    def __run(self):
+        while True:
+            file_paths, data = self.queue.get()
+            try:
+                for file_path in file_paths:
+                    try:
+                        write_file(file_path, data)
+                        self.written += 1
+                    except Exception:
+                        self.failed += 1
+            finally:
+                self.queue.task_done()
+
+    def write(self, file_path, data, copy_path=None):
+        """Queues data (bytes or str) to be written to the file.
+        If copy_path is set, the same data is also written there."""
+        file_paths = [file_path]
+        if copy_path:
+            file_paths.append(copy_path)
+        self.__start()
+        self.queue.put((file_paths, data))
+
+    def flush(self):
+        """Waits until all queued files have been written."""
+        if self.__thread and self.__pid == os.getpid():
+            self.queue.join()
+
+
+def get_writer():
+    """Returns the ArtifactWriter of this process (created on first use)."""
+    global shared_writer
+    with shared_writer_lock:
+        if not shared_writer:
+            shared_writer = ArtifactWriter()
+            atexit.register(shared_writer.flush)
+        return shared_writer
+
+
+def write(file_path, data, copy_path=None):
+    get_writer().write(file_path, data, copy_path)
+
+
+def flush():
+    if shared_writer:
+        shared_writer.flush()
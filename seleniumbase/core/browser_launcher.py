@@ -32,6 +32,9 @@ from seleniumbase import extensions  # browser extensions storage folder
 from seleniumbase.config import settings
 from seleniumbase.core import detect_b_ver
 from seleniumbase.core import download_helper
+from seleniumbase.core import extension_cache
+from seleniumbase.core import launch_cache
+from seleniumbase.core import loop_helper
 from seleniumbase.core import proxy_helper
 from seleniumbase.core import sb_driver
 from seleniumbase.core import sb_cdp
@@ -381,13 +384,7 @@ def get_uc_driver_version(full=False, local_uc_driver=None):
     uc_driver_version = None
     if os.path.exists(local_uc_driver):
         with suppress(Exception):
-            output = subprocess.check_output(
-                '"%s" --version' % local_uc_driver, shell=True
-            )
-            if IS_WINDOWS:
-                output = output.decode("latin1")
-            else:
-                output = output.decode("utf-8")
+            output = launch_cache.get_version_output(local_uc_driver)
             full_version = output.split(" ")[1]
             output = output.split(" ")[1].split(".")[0]
             if int(output) >= 72:
@@ -663,7 +660,9 @@ def uc_open_with_cdp_mode(driver, url=None, **kwargs):
     ):
         # CDP Mode was already initialized
         driver.cdp.open(url, **kwargs)
-        if not safe_url:
+        if settings.CDP_MODE_WAIT_UNTIL and not kwargs:
+            pass  # The page already reached the milestone
+        elif not safe_url:
             time.sleep(constants.UC.CDP_MODE_OPEN_WAIT)
             if IS_WINDOWS:
                 time.sleep(constants.UC.EXTRA_WINDOWS_WAIT)
@@ -754,6 +753,9 @@ def uc_open_with_cdp_mode(driver, url=None, **kwargs):
             time.sleep(constants.UC.EXTRA_WINDOWS_WAIT)
     else:
         time.sleep(0.012)
+    if settings.USE_CDP_LOOP_THREAD:
+        loop = loop_helper.LoopThread(loop)
+        loop_helper.close_on_quit(driver, loop)
     cdp = types.SimpleNamespace()
     CDPM = sb_cdp.CDPMethods(loop, page, driver)
     cdp.get = CDPM.get
@@ -2132,23 +2134,6 @@ def _was_driver_repaired():
     return os.path.exists(file_path)
 
 
-def _set_proxy_filenames():
-    DOWNLOADS_DIR = constants.Files.DOWNLOADS_FOLDER
-    for num in range(1000):
-        PROXY_ZIP_PATH = os.path.join(DOWNLOADS_DIR, "proxy_%s.zip" % num)
-        PROXY_DIR_PATH = os.path.join(DOWNLOADS_DIR, "proxy_ext_dir_%s" % num)
-        if os.path.exists(PROXY_ZIP_PATH) or os.path.exists(PROXY_DIR_PATH):
-            continue
-        proxy_helper.PROXY_ZIP_PATH = PROXY_ZIP_PATH
-        proxy_helper.PROXY_DIR_PATH = PROXY_DIR_PATH
-        return
-    # Exceeded upper bound. Use Defaults:
-    PROXY_ZIP_PATH = os.path.join(DOWNLOADS_DIR, "proxy.zip")
-    PROXY_DIR_PATH = os.path.join(DOWNLOADS_DIR, "proxy_ext_dir")
-    proxy_helper.PROXY_ZIP_PATH = PROXY_ZIP_PATH
-    proxy_helper.PROXY_DIR_PATH = PROXY_DIR_PATH
-
-
 def _add_chrome_proxy_extension(
     chrome_options,
     proxy_string,
@@ -2161,80 +2146,19 @@ def _add_chrome_proxy_extension(
 ):
     """Implementation of https://stackoverflow.com/a/35293284/7058266
     for https://stackoverflow.com/q/12848327/7058266
-    (Run Selenium on a proxy server that requires authentication.)"""
-    zip_it = False
-    args = " ".join(sys.argv)
-    bypass_list = proxy_bypass_list
-    if (
-        not ("-n" in sys.argv or " -n=" in args or args == "-c")
-        and not multi_proxy
-    ):
-        # Single-threaded
-        if zip_it:
-            proxy_zip_lock = fasteners.InterProcessLock(PROXY_ZIP_LOCK)
-            with proxy_zip_lock:
-                proxy_helper.create_proxy_ext(
-                    proxy_string,
-                    proxy_user,
-                    proxy_pass,
-                    proxy_scheme,
-                    bypass_list,
-                )
-                proxy_zip = proxy_helper.PROXY_ZIP_PATH
-                chrome_options.add_extension(proxy_zip)
-        else:
-            proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-            with proxy_dir_lock:
-                proxy_helper.create_proxy_ext(
-                    proxy_string,
-                    proxy_user,
-                    proxy_pass,
-                    proxy_scheme,
-                    bypass_list,
-                    zip_it=False,
-                )
-                proxy_dir_path = proxy_helper.PROXY_DIR_PATH
-                chrome_options = add_chrome_ext_dir(
-                    chrome_options, proxy_dir_path
-                )
-    else:
-        # Multi-threaded
-        if zip_it:
-            proxy_zip_lock = fasteners.InterProcessLock(PROXY_ZIP_LOCK)
-            with proxy_zip_lock:
-                with suppress(Exception):
-                    shared_utils.make_writable(PROXY_ZIP_LOCK)
-                if multi_proxy:
-                    _set_proxy_filenames()
-                if not os.path.exists(proxy_helper.PROXY_ZIP_PATH):
-                    proxy_helper.create_proxy_ext(
-                        proxy_string,
-                        proxy_user,
-                        proxy_pass,
-                        proxy_scheme,
-                        bypass_list,
-                    )
-                proxy_zip = proxy_helper.PROXY_ZIP_PATH
-                chrome_options.add_extension(proxy_zip)
-        else:
-            proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-            with proxy_dir_lock:
-                with suppress(Exception):
-                    shared_utils.make_writable(PROXY_DIR_LOCK)
-                if multi_proxy:
-                    _set_proxy_filenames()
-                if not os.path.exists(proxy_helper.PROXY_DIR_PATH):
-                    proxy_helper.create_proxy_ext(
-                        proxy_string,
-                        proxy_user,
-                        proxy_pass,
-                        proxy_scheme,
-                        bypass_list,
-                        zip_it=False,
-                    )
-                chrome_options = add_chrome_ext_dir(
-                    chrome_options, proxy_helper.PROXY_DIR_PATH
-                )
+    (Run Selenium on a proxy server that requires authentication.)
+    The extension folder comes from the content-addressed extension cache,
+    so each set of proxy settings gets its own folder. (No locks needed.)
+    "zip_it" and "multi_proxy" are kept for backwards compatibility."""
+    proxy_dir_path = extension_cache.get_proxy_extension(
+        proxy_string,
+        proxy_user,
+        proxy_pass,
+        proxy_scheme,
+        proxy_bypass_list,
+    )
+    proxy_helper.PROXY_DIR_PATH = proxy_dir_path
+    chrome_options = add_chrome_ext_dir(chrome_options, proxy_dir_path)
     return chrome_options
 
 
@@ -2244,17 +2168,12 @@ def is_using_uc(undetectable, browser_name):
     return False
 
 
-def _unzip_to_new_folder(zip_file, folder):
-    proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-    with proxy_dir_lock:
-        with suppress(Exception):
-            shared_utils.make_writable(PROXY_DIR_LOCK)
-        if not os.path.exists(folder):
-            import zipfile
-            zip_ref = zipfile.ZipFile(zip_file, "r")
-            os.makedirs(folder)
-            zip_ref.extractall(folder)
-            zip_ref.close()
+def _add_cached_ext_dir(chrome_options, zip_path):
+    """Adds an extension zip as an unpacked folder from the extension cache.
+    Returns the folder, which gets reused by later launches."""
+    ext_dir = extension_cache.get_unpacked_extension(zip_path)
+    add_chrome_ext_dir(chrome_options, ext_dir)
+    return ext_dir
 
 
 def add_chrome_ext_dir(chrome_options, dir_path):
@@ -2276,21 +2195,21 @@ def add_chrome_ext_dir(chrome_options, dir_path):
 def _add_chrome_disable_csp_extension(chrome_options):
     """Disable Chrome's Content-Security-Policy with a browser extension.
     See https://github.com/PhilGrayson/chrome-csp-disable for details."""
-    chrome_options.add_extension(DISABLE_CSP_ZIP_PATH)
+    _add_cached_ext_dir(chrome_options, DISABLE_CSP_ZIP_PATH)
     return chrome_options
 
 
 def _add_chrome_ad_block_extension(chrome_options):
     """Block Ads on Chromium Browsers with a browser extension.
     See https://github.com/slingamn/simpleblock for details."""
-    chrome_options.add_extension(AD_BLOCK_ZIP_PATH)
+    _add_cached_ext_dir(chrome_options, AD_BLOCK_ZIP_PATH)
     return chrome_options
 
 
 def _add_chrome_recorder_extension(chrome_options):
     """The SeleniumBase Recorder Chrome/Edge extension.
     https://seleniumbase.io/help_docs/recorder_mode/"""
-    chrome_options.add_extension(RECORDER_ZIP_PATH)
+    _add_cached_ext_dir(chrome_options, RECORDER_ZIP_PATH)
     return chrome_options
 
 
@@ -2542,12 +2461,8 @@ def _set_chrome_options(
             abs_path = os.path.realpath(extension_zip_item)
             if os.path.exists(abs_path):
                 try:
-                    abs_path_dir = os.path.join(
-                        DOWNLOADS_FOLDER, abs_path.split(".")[0]
-                    )
-                    _unzip_to_new_folder(abs_path, abs_path_dir)
-                    chrome_options = add_chrome_ext_dir(
-                        chrome_options, abs_path_dir
+                    abs_path_dir = _add_cached_ext_dir(
+                        chrome_options, abs_path
                     )
                     sb_config._ext_dirs.append(abs_path_dir)
                 except Exception:
@@ -2594,31 +2509,21 @@ def _set_chrome_options(
     if (settings.DISABLE_CSP_ON_CHROME or disable_csp) and not headless:
         # Headless Chrome does not support extensions, which are required
         # for disabling the Content Security Policy on Chrome.
-        disable_csp_zip = DISABLE_CSP_ZIP_PATH
-        disable_csp_dir = os.path.join(DOWNLOADS_FOLDER, "disable_csp")
-        _unzip_to_new_folder(disable_csp_zip, disable_csp_dir)
-        chrome_options = add_chrome_ext_dir(
-            chrome_options, disable_csp_dir
+        disable_csp_dir = _add_cached_ext_dir(
+            chrome_options, DISABLE_CSP_ZIP_PATH
         )
         sb_config._ext_dirs.append(disable_csp_dir)
     if ad_block_on and not headless:
         # Headless Chrome does not support extensions.
-        ad_block_zip = AD_BLOCK_ZIP_PATH
-        ad_block_dir = os.path.join(DOWNLOADS_FOLDER, "ad_block")
-        _unzip_to_new_folder(ad_block_zip, ad_block_dir)
-        chrome_options = add_chrome_ext_dir(chrome_options, ad_block_dir)
+        ad_block_dir = _add_cached_ext_dir(chrome_options, AD_BLOCK_ZIP_PATH)
         sb_config._ext_dirs.append(ad_block_dir)
     if recorder_ext and not headless:
-        recorder_zip = RECORDER_ZIP_PATH
-        recorder_dir = os.path.join(DOWNLOADS_FOLDER, "recorder")
-        _unzip_to_new_folder(recorder_zip, recorder_dir)
-        chrome_options = add_chrome_ext_dir(chrome_options, recorder_dir)
+        recorder_dir = _add_cached_ext_dir(chrome_options, RECORDER_ZIP_PATH)
         sb_config._ext_dirs.append(recorder_dir)
     if chromium_arg and "sbase" in chromium_arg:
-        sbase_ext_zip = SBASE_EXT_ZIP_PATH
-        sbase_ext_dir = os.path.join(DOWNLOADS_FOLDER, "sbase_ext")
-        _unzip_to_new_folder(sbase_ext_zip, sbase_ext_dir)
-        chrome_options = add_chrome_ext_dir(chrome_options, sbase_ext_dir)
+        sbase_ext_dir = _add_cached_ext_dir(
+            chrome_options, SBASE_EXT_ZIP_PATH
+        )
         sb_config._ext_dirs.append(sbase_ext_dir)
     if proxy_string:
         if proxy_auth:
@@ -3034,6 +2939,7 @@ def _set_firefox_options(
     return options
 
 
+@launch_cache.profiled
 def get_driver(
     browser_name=None,
     headless=False,
@@ -4398,7 +4304,7 @@ def get_local_driver(
             if binary_location:
                 try:
                     major_edge_version = (
-                        detect_b_ver.get_browser_version_from_binary(
+                        launch_cache.get_browser_version_from_binary(
                             binary_location
                         )
                     )
@@ -4411,7 +4317,7 @@ def get_local_driver(
             if not major_edge_version:
                 br_app = "edge"
                 major_edge_version = (
-                    detect_b_ver.get_browser_version_from_os(br_app)
+                    launch_cache.get_browser_version_from_os(br_app)
                 )
                 saved_mev = major_edge_version
                 major_edge_version = major_edge_version.split(".")[0]
@@ -4437,13 +4343,7 @@ def get_local_driver(
         edgedriver_upgrade_needed = False
         if os.path.exists(local_edgedriver):
             with suppress(Exception):
-                output = subprocess.check_output(
-                    '"%s" --version' % local_edgedriver, shell=True
-                )
-                if IS_WINDOWS:
-                    output = output.decode("latin1")
-                else:
-                    output = output.decode("utf-8")
+                output = launch_cache.get_version_output(local_edgedriver)
                 if output.split(" ")[0] == "MSEdgeDriver":
                     # MSEdgeDriver VERSION
                     output = output.split(" ")[1]
@@ -4668,7 +4568,10 @@ def get_local_driver(
             extension_zip_list = extension_zip.split(",")
             for extension_zip_item in extension_zip_list:
                 abs_path = os.path.realpath(extension_zip_item)
-                edge_options.add_extension(abs_path)
+                try:
+                    _add_cached_ext_dir(edge_options, abs_path)
+                except Exception:
+                    edge_options.add_extension(abs_path)
         if extension_dir:
             # load-extension input can be a comma-separated list
             abs_path = (
@@ -5031,7 +4934,7 @@ def get_local_driver(
                 if chrome_options.binary_location:
                     try:
                         major_chrome_version = (
-                            detect_b_ver.get_browser_version_from_binary(
+                            launch_cache.get_browser_version_from_binary(
                                 chrome_options.binary_location,
                             )
                         )
@@ -5044,7 +4947,7 @@ def get_local_driver(
                 if not major_chrome_version:
                     br_app = "google-chrome"
                     full_ch_version = (
-                        detect_b_ver.get_browser_version_from_os(br_app)
+                        launch_cache.get_browser_version_from_os(br_app)
                     )
                     saved_mcv = full_ch_version
                     major_chrome_version = full_ch_version.split(".")[0]
@@ -5095,13 +4998,9 @@ def get_local_driver(
             path_chromedriver = chromedriver_on_path()
             if os.path.exists(local_chromedriver):
                 with suppress(Exception):
-                    output = subprocess.check_output(
-                        '"%s" --version' % local_chromedriver, shell=True
+                    output = launch_cache.get_version_output(
+                        local_chromedriver
                     )
-                    if IS_WINDOWS:
-                        output = output.decode("latin1")
-                    else:
-                        output = output.decode("utf-8")
                     full_ch_driver_version = output.split(" ")[1]
                     output = full_ch_driver_version.split(".")[0]
                     if int(output) >= 2:
@@ -5117,13 +5016,9 @@ def get_local_driver(
                         " executable: %s" % e
                     )
                 with suppress(Exception):
-                    output = subprocess.check_output(
-                        '"%s" --version' % path_chromedriver, shell=True
+                    output = launch_cache.get_version_output(
+                        path_chromedriver
                     )
-                    if IS_WINDOWS:
-                        output = output.decode("latin1")
-                    else:
-                        output = output.decode("utf-8")
                     full_ch_driver_version = output.split(" ")[1]
                     output = full_ch_driver_version.split(".")[0]
                     if int(output) >= 2:
@@ -5364,14 +5259,9 @@ def get_local_driver(
                             intel_for_uc = True  # Use Intel driver for UC Mode
                         if os.path.exists(local_chromedriver):
                             with suppress(Exception):
-                                output = subprocess.check_output(
-                                    '"%s" --version' % local_chromedriver,
-                                    shell=True,
+                                output = launch_cache.get_version_output(
+                                    local_chromedriver
                                 )
-                                if IS_WINDOWS:
-                                    output = output.decode("latin1")
-                                else:
-                                    output = output.decode("utf-8")
                                 full_ch_driver_version = output.split(" ")[1]
                                 output = full_ch_driver_version.split(".")[0]
                                 if int(output) >= 2:
@@ -0,0 +1,316 @@
+"""A warm pool of pre-launched browsers. (One pool per process/worker.)
+
+Launching a browser (driver resolution, options building, driver spawn,
+and browser start) can take seconds. With a pool, browsers with the same
+launch options are pre-launched on a background thread while tests run.
+A test checks out a warm browser, and at the end of the test, the browser
+is reset and put back in the pool for the next test. The reset moves the
+browser to a new window in a new (disposable) browser context, and then
+disposes the context of the previous test, so that no cookies, storage
+(of any origin), IndexedDB, service workers, caches, or permissions carry
+over. Browsers that can't use new contexts (Eg. browsers with extensions,
+which don't run in new contexts), browsers that can't be reset, and
+browsers that were reused MAX_REUSES times are quit, and then replaced.
+
+Launches update global config values (sb_config). Background launches
+save and restore those values, and checkout() applies the values of the
+launch of the browser, as if it had been launched by the test itself.
+
+Usage:
+    driver = browser_pool.checkout(launcher, **driver_kwargs)
+    ...
+    if not browser_pool.checkin(driver):
+        driver.quit()  # (Not from the pool)
+
+(Enabled with settings.WARM_BROWSER_POOL_SIZE > 0)"""
+import atexit
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from seleniumbase.config import settings
+
+MAX_REUSES = 25  # Browsers are replaced after being used by this many tests
+UNSHARED_OPTIONS = ("test_id",)  # Options that don't change the browser
+LAUNCH_GLOBALS = (  # The sb_config values that are set by launches
+    "_ext_dirs",
+    "_cdp_launched",
+    "_cdp_browser",
+    "_cdp_locale",
+    "_cdp_mobile_mode",
+    "_cdp_proxy",
+    "ad_block_on",
+    "disable_csp",
+    "multi_proxy",
+)
+MISSING = object()  # (For sb_config values that weren't set)
+
+shared_pool = None
+shared_pool_lock = threading.Lock()
+
+
+def get_signature(driver_kwargs):
+    """Returns a hashable key for the launch options of a browser."""
+    return tuple(
+        sorted(
+            (key, repr(value))
+            for key, value in driver_kwargs.items()
+            if key not in UNSHARED_OPTIONS
+        )
+    )
+
+
+def get_launch_globals():
+    """Returns the sb_config values that are set by launches."""
+    from seleniumbase import config as sb_config
+
+    return {
+        name: getattr(sb_config, name, MISSING) for name in LAUNCH_GLOBALS
+    }
+
+
+def set_launch_globals(values, only_if=None):
+    """Sets the sb_config values that are set by launches.
+    If only_if is set, only values that still match it are changed."""
+    from seleniumbase import config as sb_config
+
+    for name, value in values.items():
+        if only_if and getattr(sb_config, name, MISSING) is not only_if[name]:
+            continue  # (Changed by another thread)
+        if value is MISSING:
+            with suppress(Exception):
+                delattr(sb_config, name)
+        else:
+            setattr(sb_config, name, value)
+
+
+def use_new_browser_context(driver, old_context_id=None, size=None):
+    """Moves a Chromium browser to a new window in a new (empty) browser
+    context, and then disposes the old context (which closes its windows).
+    If there's no old context, the windows of the default context close.
+    Returns the id of the new context, or None if it couldn't be created."""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+    try:
+        if not size:
+            size = driver.get_window_size()
+        context_id = driver.execute_cdp_cmd(
+            "Target.createBrowserContext", {}
+        )["browserContextId"]
+        target_id = driver.execute_cdp_cmd(
+            "Target.createTarget",
+            {
+                "url": "about:blank",
+                "browserContextId": context_id,
+                "newWindow": True,
+                "width": size["width"],
+                "height": size["height"],
+            },
+        )["targetId"]
+        driver.switch_to.window(target_id)  # The handle is the target id
+    except Exception:
+        return None
+    with suppress(Exception):
+        if old_context_id:
+            driver.execute_cdp_cmd(
+                "Target.disposeBrowserContext",
+                {"browserContextId": old_context_id},
+            )
+        else:
+            targets = driver.execute_cdp_cmd("Target.getTargets", {})
+            for target in targets["targetInfos"]:
+                if (
+                    target["type"] == "page"
+                    and target.get("browserContextId") != context_id
+                ):
+                    driver.execute_cdp_cmd(
+                        "Target.closeTarget",
+                        {"targetId": target["targetId"]},
+                    )
+    return context_id
+
+
+def quit_driver(driver):
+    with suppress(Exception):
+        driver.quit()
+
+
+class BrowserPool:
+    def __init__(self, size):
+        self.size = size
+        self.idle = collections.defaultdict(list)  # {signature: [drivers]}
+        self.pending = collections.Counter()  # {signature: launches}
+        self.checked_out = {}  # {driver: signature}
+        self.uses = {}  # {driver: number of tests that used it}
+        self.launches = {}  # {driver: (launch globals, window size)}
+        self.contexts = {}  # {driver: browser context id (after a reset)}
+        self.closed = False
+        self.__lock = threading.Lock()
+        # Launches are serialized. (They update global config values.)
+        self.__launch_lock = threading.Lock()
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sb-browser-pool"
+        )
+
+    def __launch(self, launcher, driver_kwargs, background=False):
+        with self.__launch_lock:
+            if background:
+                saved_globals = get_launch_globals()
+            launch_globals = None
+            try:
+                driver = launcher(**driver_kwargs)
+                launch_globals = get_launch_globals()
+            finally:
+                if background:
+                    # (The test thread keeps the values of its own launch)
+                    set_launch_globals(
+                        saved_globals, only_if=launch_globals
+                    )
+        size = None
+        with suppress(Exception):
+            size = driver.get_window_size()
+        with self.__lock:
+            self.launches[driver] = (launch_globals, size)
+        return driver
+
+    def __forget(self, driver):
+        with self.__lock:
+            self.uses.pop(driver, None)
+            self.launches.pop(driver, None)
+            self.contexts.pop(driver, None)
+
+    def __reset(self, driver):
+        """Resets a browser for the next test. Returns True if done.
+        (With a new browser context, which only Chromium browsers have.)"""
+        with self.__lock:
+            launch_globals, size = self.launches.get(driver, (None, None))
+            old_context_id = self.contexts.get(driver)
+        if (
+            not launch_globals
+            or launch_globals["_ext_dirs"] not in (None, MISSING, [])
+            or getattr(driver, "_is_using_auth", False)
+        ):
+            return False  # (Extensions don't run in new browser contexts)
+        context_id = use_new_browser_context(driver, old_context_id, size)
+        if not context_id:
+            return False
+        with self.__lock:
+            self.contexts[driver] = context_id
+        return True
+
+    def __prelaunch(self, signature, launcher, driver_kwargs):
+        driver = None
+        try:
+            driver = self.__launch(launcher, driver_kwargs, background=True)
+        except Exception:
+            pass  # The next checkout launches the browser in the foreground
+        finally:
+            with self.__lock:
+                self.pending[signature] -= 1
+                if driver and (
+                    self.closed or len(self.idle[signature]) >= self.size
+                ):
+                    extra_driver = driver
+                    driver = None
+                else:
+                    extra_driver = None
+                if driver:
+                    self.idle[signature].append(driver)
+                    self.uses[driver] = 0
+        if extra_driver:
+            self.__forget(extra_driver)
+            quit_driver(extra_driver)
+
+    def __refill(self, signature, launcher, driver_kwargs):
+        with self.__lock:
+            if self.closed:
+                return
+            missing = (
+                self.size
+                - len(self.idle[signature])
+                - self.pending[signature]
+            )
+            for x in range(missing):
+                self.pending[signature] += 1
+                self.__executor.submit(
+                    self.__prelaunch, signature, launcher, driver_kwargs
+                )
+
+    def checkout(self, launcher, **driver_kwargs):
+        """Returns a warm browser with matching options (or launches one).
+        The pool gets refilled in the background."""
+        signature = get_signature(driver_kwargs)
+        driver = None
+        with self.__lock:
+            if self.idle[signature]:
+                driver = self.idle[signature].pop(0)
+        if not driver:
+            driver = self.__launch(launcher, driver_kwargs)
+        with self.__lock:
+            self.uses.setdefault(driver, 0)
+            self.checked_out[driver] = signature
+            launch_globals = self.launches.get(driver, (None, None))[0]
+        if launch_globals:
+            set_launch_globals(launch_globals)
+        if hasattr(driver, "_round_trips"):
+            driver._round_trips = 0  # (Don't count the previous test)
+        self.__refill(signature, launcher, driver_kwargs)
+        return driver
+
+    def checkin(self, driver):
+        """Returns a browser to the pool after a test. (Or quits it.)
+        Returns False if the browser didn't come from the pool."""
+        with self.__lock:
+            signature = self.checked_out.pop(driver, None)
+            if signature is None:
+                return False
+            uses = self.uses.pop(driver, 0) + 1
+            keep = (
+                not self.closed
+                and uses < MAX_REUSES
+                and len(self.idle[signature]) < self.size
+            )
+        if keep and self.__reset(driver):
+            with self.__lock:
+                self.idle[signature].append(driver)
+                self.uses[driver] = uses
+            return True
+        self.__forget(driver)
+        quit_driver(driver)
+        return True
+
+    def close(self):
+        """Quits all idle browsers. (Checked-out browsers are quit later.)"""
+        with self.__lock:
+            self.closed = True
+        self.__executor.shutdown(wait=True)
+        with self.__lock:
+            drivers = [d for idle in self.idle.values() for d in idle]
+            self.idle.clear()
+        for driver in drivers:
+            self.__forget(driver)
+            quit_driver(driver)
+
+
+def is_enabled():
+    return getattr(settings, "WARM_BROWSER_POOL_SIZE", 0) > 0
+
+
+def get_pool():
+    """Returns the browser pool of this process (created on first use)."""
+    global shared_pool
+    with shared_pool_lock:
+        if not shared_pool:
+            shared_pool = BrowserPool(settings.WARM_BROWSER_POOL_SIZE)
+            atexit.register(shared_pool.close)
+        return shared_pool
+
+
+def checkout(launcher, **driver_kwargs):
+    return get_pool().checkout(launcher, **driver_kwargs)
+
+
+def checkin(driver):
+    if not shared_pool:
+        return False
+    return shared_pool.checkin(driver)
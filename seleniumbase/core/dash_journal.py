@@ -0,0 +1,122 @@
+"""An append-only journal of Dashboard results for multi-process runs.
+
+When tests run in parallel (pytest -n N), each process appends the results
+that it changed as one JSON line, without a lock. (Small appends to a file
+opened with O_APPEND don't interleave.) Each process keeps the byte offset
+of what it already read, and merges only the new lines into its results.
+The dashboard.html file is then rebuilt at a bounded rate (not every test),
+and it's replaced atomically so that readers never see a partial file."""
+import json
+import os
+import time
+
+HTML_REBUILD_INTERVAL = 1.0  # Min seconds between rebuilds of the HTML
+FIELDS = ("_results", "_display_id", "_duration", "_d_t_log_path")
+
+
+class DashJournal:
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0  # The position after the last line that was read
+
+    def append(self, entry):
+        """Appends an entry (a dict) as a single line to the journal."""
+        data = (json.dumps(entry) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def has_new_entries(self):
+        try:
+            return os.path.getsize(self.path) > self.offset
+        except OSError:
+            return False
+
+    def read_new_entries(self):
+        """Returns the entries that were added since the last read.
+        (A line that isn't complete yet is left for the next read.)"""
+        if not self.has_new_entries():
+            return []
+        with open(self.path, mode="rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+        end = data.rfind(b"\n")
+        if end == -1:
+            return []
+        self.offset += end + 1
+        entries = []
+        for line in data[:end].splitlines():
+            if line.strip():
+                entries.append(json.loads(line.decode("utf-8")))
+        return entries
+
+    def merge_into(self, config):
+        """Applies the new entries to the Dashboard data of sb_config."""
+        for entry in self.read_new_entries():
+            for field in FIELDS:
+                getattr(config, field).update(entry.get(field, {}))
+            for test_id in entry.get("removed", []):
+                for field in FIELDS:
+                    getattr(config, field).pop(test_id, None)
+
+
+def snapshot(config):
+    """Returns copies of the Dashboard data of sb_config."""
+    return {field: dict(getattr(config, field)) for field in FIELDS}
+
+
+def get_changes(before, config):
+    """Returns a journal entry with the data that changed since the
+    snapshot was taken. (Returns None if nothing changed.)"""
+    entry = {}
+    changed = False
+    for field in FIELDS:
+        current = getattr(config, field)
+        updates = {
+            key: value for key, value in current.items()
+            if key not in before[field] or before[field][key] != value
+        }
+        entry[field] = updates
+        changed = changed or bool(updates)
+    removed = [key for key in before["_results"] if key not in config._results]
+    if removed:
+        entry["removed"] = removed
+        changed = True
+    if not changed:
+        return None
+    return entry
+
+
+def get_counts(results):
+    """Returns (passed, failed, skipped, untested) counts of the results.
+    (Unknown results are counted as skipped, which matches the Dashboard.)"""
+    num_passed = 0
+    num_failed = 0
+    num_untested = 0
+    for value in results.values():
+        if value == "Passed":
+            num_passed += 1
+        elif value == "Failed":
+            num_failed += 1
+        elif value == "Untested":
+            num_untested += 1
+    num_skipped = len(results) - num_passed - num_failed - num_untested
+    return (num_passed, num_failed, num_skipped, num_untested)
+
+
+def is_rebuild_due(html_path, interval=HTML_REBUILD_INTERVAL):
+    """Returns True if the HTML file wasn't updated in the last interval."""
+    try:
+        return time.time() - os.path.getmtime(html_path) >= interval
+    except OSError:
+        return True
+
+
+def write_atomically(file_path, text):
+    """Writes to a temp file, and then replaces the file with it."""
+    temp_path = "%s.%s.tmp" % (file_path, os.getpid())
+    with open(temp_path, mode="w+", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_path, file_path)
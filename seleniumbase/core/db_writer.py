@@ -0,0 +1,221 @@
+"""A background writer for DB reporting. (With "--with-db_reporting")
+
+Each process (Eg. each worker of "pytest -n N") keeps one connection to the
+DB, which is opened on first use and then reused, instead of connecting
+(and authenticating) for every query. Queries are queued by the test thread
+and run on a writer thread in batches: consecutive queries with the same SQL
+are sent together with cursor.executemany(), which makes multi-row INSERTs.
+Queries still run in the same order that they were queued.
+
+If settings.DB_SQLITE_FILE is set, the results are saved to that local
+SQLite file instead (with the tables of create_db_tables.sql), so that DB
+reporting can be used (and tested) without a MySQL server.
+
+Usage:
+    db_writer.write(query, params)
+    ...
+    db_writer.flush()  # Waits until all queued queries have run"""
+import atexit
+import itertools
+import os
+import queue
+import re
+import threading
+import time
+from contextlib import suppress
+from seleniumbase.config import settings
+
+MAX_PENDING = 1000  # If more queries are pending, write() waits for the DB
+MAX_BATCH = 100  # The max number of queries that are run together
+RECONNECT_COOLDOWN = 10  # SECONDS (The wait to connect again after a fail)
+SQL_TABLES_FILE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "create_db_tables.sql"
+)
+
+shared_writer = None
+shared_writer_lock = threading.Lock()
+
+
+def get_sqlite_file():
+    return getattr(settings, "DB_SQLITE_FILE", None)
+
+
+def get_sqlite_tables():
+    """Returns the statements of create_db_tables.sql for SQLite.
+    (Comments and MySQL table options are removed.)"""
+    with open(SQL_TABLES_FILE, mode="r", encoding="utf-8") as f:
+        lines = [
+            line for line in f.read().splitlines()
+            if not line.strip().startswith("#")
+        ]
+    statements = []
+    for statement in "\n".join(lines).split(";"):
+        statement = statement.strip()
+        if not statement:
+            continue
+        statement = re.sub(r"\)\s*ENGINE=[^)]*$", ")", statement)
+        statement = statement.replace(
+            "CREATE TABLE ", "CREATE TABLE IF NOT EXISTS ", 1
+        )
+        statements.append(statement)
+    return statements
+
+
+def get_sqlite_query(query):
+    """Converts the %(name)s params of a MySQL query to :name params."""
+    return re.sub(r"%\((\w+)\)s", r":\1", query)
+
+
+def get_sqlite_connection(db_file):
+    """Returns a connection to the SQLite file. (Creates the tables.)"""
+    import sqlite3
+
+    conn = sqlite3.connect(db_file, timeout=30)
+    for statement in get_sqlite_tables():
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+class DbWriter:
+    def __init__(self, max_pending=MAX_PENDING):
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.conn = None
+        self.is_sqlite = False
+        self.__thread = None
+        self.__pid = None
+        self.__lock = threading.Lock()
+        self.__warned = False
+        self.__connect_error = None
+        self.__connect_error_time = 0
+
+    def __start(self):
+        with self.__lock:
+            if (
+                self.__thread
+                and self.__thread.is_alive()
+                and self.__pid == os.getpid()
+            ):
+                return
+            if self.__pid != os.getpid():
+                # (A forked process doesn't have the thread of its parent,
+                # and it can't share the DB connection of its parent.)
+                self.queue = queue.Queue(maxsize=self.queue.maxsize)
+                self.conn = None
+                self.__connect_error = None
+            self.__pid = os.getpid()
+            self.__thread = threading.Thread(
+                target=self.__run, name="sb-db-writer", daemon=True
+            )
+            self.__thread.start()
+
+    def __connect(self):
+        if self.conn is None:
+            if self.__connect_error:
+                if (
+                    time.time() - self.__connect_error_time
+                    < RECONNECT_COOLDOWN
+                ):
+                    # (Don't wait for the connect retries for every query)
+                    raise self.__connect_error
+                self.__connect_error = None  # (Try to connect again)
+            try:
+                db_file = get_sqlite_file()
+                if db_file:
+                    self.conn = get_sqlite_connection(db_file)
+                    self.is_sqlite = True
+                else:
+                    from seleniumbase.core import mysql
+
+                    self.conn = mysql.get_connection()
+                    self.is_sqlite = False
+            except Exception as e:
+                self.__connect_error = e
+                self.__connect_error_time = time.time()
+                raise
+        return self.conn
+
+    def __close(self):
+        if self.conn is not None:
+            with suppress(Exception):
+                self.conn.close()
+        self.conn = None
+
+    def __get_batch(self):
+        items = [self.queue.get()]
+        while len(items) < MAX_BATCH:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def __run(self):
+        while True:
+            items = self.__get_batch()
+            try:
+                self.batches += 1
+                for query, group in itertools.groupby(
+                    items, key=lambda item: item[0]
+                ):
+                    params_list = [params for _, params in group]
+                    try:
+                        self.__execute_many(query, params_list)
+                        self.written += len(params_list)
+                    except Exception as e:
+                        self.failed += len(params_list)
+                        if not self.__warned:
+                            self.__warned = True
+                            print("\nDB reporting failed: %s" % e)
+            finally:
+                for item in items:
+                    self.queue.task_done()
+
+    def __execute_many(self, query, params_list):
+        """Runs the query for each params. Reconnects once if it fails."""
+        for attempt in range(2):
+            conn = self.__connect()
+            try:
+                if self.is_sqlite:
+                    conn.executemany(get_sqlite_query(query), params_list)
+                    conn.commit()
+                else:
+                    with conn.cursor() as cursor:
+                        cursor.executemany(query, params_list)
+                return
+            except Exception:
+                self.__close()
+                if attempt > 0:
+                    raise
+
+    def write(self, query, params):
+        """Queues a query (with its params dict) to run on the DB."""
+        self.__start()
+        self.queue.put((query, params))
+
+    def flush(self):
+        """Waits until all queued queries have run."""
+        if self.__thread and self.__pid == os.getpid():
+            self.queue.join()
+
+
+def get_writer():
+    """Returns the DbWriter of this process (created on first use)."""
+    global shared_writer
+    with shared_writer_lock:
+        if not shared_writer:
+            shared_writer = DbWriter()
+            atexit.register(shared_writer.flush)
+        return shared_writer
+
+
+def write(query, params):
+    get_writer().write(query, params)
+
+
+def flush():
+    if shared_writer:
+        shared_writer.flush()
@@ -1,8 +1,14 @@
+import ctypes
+import ctypes.util
 import os
+import re
+import select
 import shutil
+import sys
 import time
 from seleniumbase.config import settings
 from seleniumbase.fixtures import constants
+from seleniumbase.fixtures import poll_utils
 
 # The "downloads_folder" is a folder for saving downloaded files.
 # Works for downloads initiated by Chromium and Firefox WebDriver clicks.
@@ -15,10 +21,151 @@ abs_path = os.path.abspath(".")
 downloads_path = os.path.join(abs_path, DOWNLOADS_DIR)
 
 
+# Browsers write partial downloads to temporary files, and then rename them.
+# (Eg. Chromium uses "*.crdownload", and Firefox uses "*.part" files.)
+PARTIAL_DOWNLOAD_EXTENSIONS = (".crdownload", ".part", ".download")
+# inotify events: IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY_MASK = 0x8 | 0x80 | 0x100 | 0x200
+
+
 def get_downloads_folder():
     return downloads_path
 
 
+def is_partial_download(file_name):
+    return file_name.endswith(PARTIAL_DOWNLOAD_EXTENSIONS)
+
+
+def is_download_complete(file_path):
+    """Returns True if the file exists with its final name, and if the
+    browser isn't still writing to a partial file for it."""
+    if is_partial_download(file_path) or not os.path.isfile(file_path):
+        return False
+    for extension in PARTIAL_DOWNLOAD_EXTENSIONS:
+        if os.path.exists(file_path + extension):
+            return False
+    return True
+
+
+def find_completed_download(folder, file=None, regex=None):
+    """Returns the path of the first completed download that matches
+    the file name (or the regex). Returns None if none was found."""
+    if file:
+        file_path = os.path.join(folder, file)
+        if is_download_complete(file_path):
+            return file_path
+        return None
+    try:
+        file_names = os.listdir(folder)
+    except OSError:
+        return None
+    for file_name in sorted(file_names):
+        if re.match(regex, file_name) and not is_partial_download(file_name):
+            file_path = os.path.join(folder, file_name)
+            if is_download_complete(file_path):
+                return file_path
+    return None
+
+
+class DownloadWatcher:
+    """Waits for changes in a downloads folder.
+    On Linux, inotify wakes up the waiter as soon as a file is created,
+    renamed, or closed after writing. On other systems (or if the folder
+    doesn't exist yet), wait() returns False, so callers poll instead."""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.fd = None
+        self.__libc = None
+        if sys.platform.startswith("linux"):
+            try:
+                self.__libc = ctypes.CDLL(
+                    ctypes.util.find_library("c") or "libc.so.6",
+                    use_errno=True,
+                )
+                self.__libc.inotify_init1
+            except Exception:
+                self.__libc = None
+        self.__add_watch()
+
+    def __add_watch(self):
+        if self.fd is not None or not self.__libc:
+            return
+        if not os.path.isdir(self.folder):
+            return
+        fd = self.__libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            self.__libc = None
+            return
+        wd = self.__libc.inotify_add_watch(
+            fd, os.fsencode(self.folder), INOTIFY_MASK
+        )
+        if wd < 0:
+            os.close(fd)
+            self.__libc = None
+            return
+        self.fd = fd
+
+    def wait(self, timeout):
+        """Blocks until the folder changes (or until the timeout).
+        Returns False if it can't wait for events. (Then poll instead.)"""
+        self.__add_watch()
+        if self.fd is None:
+            return False
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if readable:
+            try:
+                while os.read(self.fd, 65536):
+                    pass
+            except (BlockingIOError, OSError):
+                pass
+        return True
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def wait_for_download_complete(
+    folder, file=None, regex=None, timeout=settings.LARGE_TIMEOUT
+):
+    """Waits for a download to complete in the folder, where the download
+    is identified by the file name (or by a filename regex).
+    Returns a dict with the "path", "size" (in bytes), "seconds" (waited),
+    and "throughput" (bytes/second while waiting) of the completed file.
+    Returns None if the download didn't complete within the timeout."""
+    with DownloadWatcher(folder) as watcher:
+        poller = poll_utils.PollScheduler(
+            timeout,
+            name="wait_for_download_complete",
+            # Return periodically to allow checking the test time limit
+            waiter=lambda remaining: watcher.wait(min(remaining, 1)),
+        )
+        for x in poller:
+            file_path = find_completed_download(folder, file, regex)
+            if file_path:
+                seconds = time.time() - poller.start_time
+                size = os.path.getsize(file_path)
+                throughput = None
+                if x > 0 and seconds > 0:
+                    # (Unknown if the download was done before the wait)
+                    throughput = size / seconds
+                return {
+                    "path": file_path,
+                    "size": size,
+                    "seconds": round(seconds, 3),
+                    "throughput": throughput,
+                }
+    return None
+
+
 def reset_downloads_folder():
     """Clears the downloads folder.
     If settings.ARCHIVE_EXISTING_DOWNLOADS is set to True, archives it."""
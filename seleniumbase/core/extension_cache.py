@@ -0,0 +1,129 @@
+"""A content-addressed cache of unpacked Chromium extensions.
+
+Extensions are unpacked (or generated) once into a folder whose name
+includes a hash of the extension contents, and then launches reference
+that folder with "--load-extension". Nothing is re-encoded per launch,
+unlike chrome_options.add_extension(), which base64-encodes the whole zip
+into the capabilities. Proxy extensions get one folder per set of proxy
+settings/credentials, so parallel tests with different proxies never share
+(or overwrite) the same folder.
+
+Folders are built under a temporary name and then renamed into place,
+which is atomic. If another process wins the race, its folder is used.
+That way, no interprocess lock is needed, even with "pytest -n N"."""
+import hashlib
+import os
+import shutil
+import threading
+import zipfile
+from contextlib import suppress
+from seleniumbase.fixtures import constants
+
+EXT_CACHE_DIR = os.path.join(constants.Files.DOWNLOADS_FOLDER, "ext_cache")
+HASH_LENGTH = 16  # The number of hex digits of the hash in folder names
+
+zip_hashes = {}  # {(zip_path, size, mtime): hash} (Avoids re-hashing zips)
+zip_hashes_lock = threading.Lock()
+
+
+def get_cache_folder():
+    return os.path.join(os.path.abspath("."), EXT_CACHE_DIR)
+
+
+def get_file_hash(file_path):
+    """Returns the hash of a file. (Cached until the file changes.)"""
+    stat = os.stat(file_path)
+    key = (file_path, stat.st_size, stat.st_mtime)
+    with zip_hashes_lock:
+        if key in zip_hashes:
+            return zip_hashes[key]
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    file_hash = digest.hexdigest()[:HASH_LENGTH]
+    with zip_hashes_lock:
+        zip_hashes[key] = file_hash
+    return file_hash
+
+
+def get_files_hash(files):
+    """Returns the hash of {file_name: content} files."""
+    digest = hashlib.sha256()
+    for file_name in sorted(files.keys()):
+        digest.update(file_name.encode("utf-8") + b"\0")
+        digest.update(files[file_name].encode("utf-8") + b"\0")
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def _publish_folder(folder, build):
+    """Calls build(temp_folder), and then renames it to the folder.
+    Returns the folder, which might have been built by another process."""
+    if os.path.isdir(folder):
+        return folder
+    os.makedirs(os.path.dirname(folder), exist_ok=True)
+    temp_folder = "%s.tmp.%s.%s" % (
+        folder, os.getpid(), threading.get_ident()
+    )
+    try:
+        os.makedirs(temp_folder)
+        build(temp_folder)
+        os.rename(temp_folder, folder)
+    except OSError:
+        if not os.path.isdir(folder):
+            raise
+    finally:
+        if os.path.exists(temp_folder):
+            with suppress(Exception):
+                shutil.rmtree(temp_folder)
+    return folder
+
+
+def get_unpacked_extension(zip_path, name=None):
+    """Returns the folder with the unpacked contents of an extension zip.
+    (The zip file is only extracted if its contents weren't seen before.)"""
+    zip_path = os.path.realpath(zip_path)
+    if not name:
+        name = os.path.splitext(os.path.basename(zip_path))[0]
+    folder = os.path.join(
+        get_cache_folder(), "%s_%s" % (name, get_file_hash(zip_path))
+    )
+
+    def build(temp_folder):
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            zip_ref.extractall(temp_folder)
+
+    return _publish_folder(folder, build)
+
+
+def get_generated_extension(name, files):
+    """Returns the folder of an extension made from {file_name: content}.
+    Extensions with the same files share the same folder."""
+    folder = os.path.join(
+        get_cache_folder(), "%s_%s" % (name, get_files_hash(files))
+    )
+
+    def build(temp_folder):
+        for file_name, content in files.items():
+            file_path = os.path.join(temp_folder, file_name)
+            with open(file_path, mode="w", encoding="utf-8") as f:
+                f.write(content)
+
+    return _publish_folder(folder, build)
+
+
+def get_proxy_extension(
+    proxy_string,
+    proxy_user,
+    proxy_pass,
+    proxy_scheme="http",
+    bypass_list=None,
+):
+    """Returns the folder of the proxy extension for the proxy settings.
+    (The folder name only has a hash of the settings/credentials.)"""
+    from seleniumbase.core import proxy_helper
+
+    files = proxy_helper.get_proxy_ext_files(
+        proxy_string, proxy_user, proxy_pass, proxy_scheme, bypass_list
+    )
+    return get_generated_extension("proxy", files)
@@ -0,0 +1,253 @@
+"""A persistent startup cache and a profiler for browser launches.
+
+Before launching a browser, get_driver() detects the browser version and
+the driver version by running "<binary> --version" in subprocesses (or in
+PowerShell on Windows). Those probes can take a second or more, and they
+were repeated for every test in every worker. Now the results are saved in
+LAUNCH_CACHE_FILE, keyed by the real path of the binary, and are reused for
+as long as the binary keeps the same mtime and size. (Updating a browser or
+downloading a new driver changes those, which invalidates the entry.)
+(The UC patch status of uc_driver is kept in a sidecar file by the patcher.)
+
+The cache file is rewritten atomically (a temp file is renamed into place),
+so parallel workers never see a partial file. If two workers save at the
+same moment, one entry may be lost, which only means one extra probe.
+
+With "--launch-profile", a per-phase timing breakdown is printed after each
+browser launch, so that cold-start regressions are visible.
+
+Usage:
+    version = launch_cache.get_browser_version_from_os("google-chrome")
+    output = launch_cache.get_version_output(driver_path)
+    with launch_cache.phase("driver download"):
+        ..."""
+import functools
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager, suppress
+from seleniumbase import config as sb_config
+from seleniumbase import drivers  # webdriver storage folder for SeleniumBase
+from seleniumbase.core import detect_b_ver
+
+DRIVER_DIR = os.path.dirname(os.path.realpath(drivers.__file__))
+LAUNCH_CACHE_FILE = os.path.join(DRIVER_DIR, "launch_cache.json")
+MAX_ENTRIES = 100  # The oldest entries are removed after this many
+IS_WINDOWS = sys.platform in ["win32", "win64", "x64"]
+
+entries = None  # {"kind|real_path": {"mtime": ns, "size": n, "value": x}}
+entries_lock = threading.Lock()
+current_profile = None
+
+
+def get_file_stamp(path):
+    """Returns (real_path, mtime_ns, size), or None if there's no file."""
+    try:
+        real_path = os.path.realpath(path)
+        stat = os.stat(real_path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return real_path, stat.st_mtime_ns, stat.st_size
+
+
+def _load_entries():
+    with suppress(Exception):
+        with open(LAUNCH_CACHE_FILE, mode="r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    return {}
+
+
+def _save_entries(data):
+    temp_file = "%s.tmp.%s.%s" % (
+        LAUNCH_CACHE_FILE, os.getpid(), threading.get_ident()
+    )
+    try:
+        with open(temp_file, mode="w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(temp_file, LAUNCH_CACHE_FILE)
+    except Exception:
+        with suppress(Exception):
+            os.remove(temp_file)  # (Read-only installs don't get a cache)
+
+
+def get_cached(kind, path):
+    """Returns the cached value for the binary, or None if there isn't a
+    valid one. (A value is only valid while the binary is unchanged.)"""
+    global entries
+    stamp = get_file_stamp(path)
+    if not stamp:
+        return None
+    real_path, mtime, size = stamp
+    with entries_lock:
+        if entries is None:
+            entries = _load_entries()
+        entry = entries.get("%s|%s" % (kind, real_path))
+    if (
+        isinstance(entry, dict)
+        and entry.get("mtime") == mtime
+        and entry.get("size") == size
+    ):
+        return entry.get("value")
+    return None
+
+
+def set_cached(kind, path, value):
+    """Saves a value for the binary. (Also merges in entries that other
+    processes saved since this process loaded the cache file.)"""
+    global entries
+    stamp = get_file_stamp(path)
+    if not stamp:
+        return
+    real_path, mtime, size = stamp
+    key = "%s|%s" % (kind, real_path)
+    with entries_lock:
+        data = _load_entries()
+        data.pop(key, None)  # (Re-inserted last, so it's the newest)
+        data[key] = {"mtime": mtime, "size": size, "value": value}
+        while len(data) > MAX_ENTRIES:
+            data.pop(next(iter(data)))
+        entries = data
+        _save_entries(data)
+
+
+def clear_cache():
+    global entries
+    with entries_lock:
+        entries = {}
+        with suppress(Exception):
+            os.remove(LAUNCH_CACHE_FILE)
+
+
+def get_browser_version_from_binary(binary_location):
+    """A cached detect_b_ver.get_browser_version_from_binary()"""
+    version = get_cached("browser", binary_location)
+    if version:
+        record_cache_hit("browser version")
+        return version
+    with phase("browser version"):
+        version = detect_b_ver.get_browser_version_from_binary(
+            binary_location
+        )
+    if version:
+        set_cached("browser", binary_location, version)
+    return version
+
+
+def get_browser_version_from_os(browser_type):
+    """A cached detect_b_ver.get_browser_version_from_os()
+    Entries are keyed by the default binary location of the browser.
+    (If that can't be found, the version isn't cached.)"""
+    binary_location = None
+    with suppress(Exception):
+        binary_location = detect_b_ver.get_binary_location(browser_type)
+    version = None
+    if binary_location:
+        version = get_cached("browser-os", binary_location)
+    if version:
+        record_cache_hit("browser version")
+        return version
+    with phase("browser version"):
+        version = detect_b_ver.get_browser_version_from_os(browser_type)
+    if version and binary_location:
+        set_cached("browser-os", binary_location, version)
+    return version
+
+
+def get_version_output(driver_path):
+    """Returns the decoded output of: "<driver_path>" --version
+    (Cached until the driver changes.) Raises an exception on failure."""
+    output = get_cached("driver", driver_path)
+    if output:
+        record_cache_hit("driver version")
+        return output
+    with phase("driver version"):
+        output = subprocess.check_output(
+            '"%s" --version' % driver_path, shell=True
+        )
+    if IS_WINDOWS:
+        output = output.decode("latin1")
+    else:
+        output = output.decode("utf-8")
+    set_cached("driver", driver_path, output)
+    return output
+
+
+class LaunchProfile:
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.phases = {}  # {name: [seconds, calls, cache_hits]}
+
+    def add(self, name, seconds, cache_hit=False):
+        if name not in self.phases:
+            self.phases[name] = [0.0, 0, 0]
+        self.phases[name][0] += seconds
+        self.phases[name][1] += 1
+        if cache_hit:
+            self.phases[name][2] += 1
+
+    def get_report(self, browser_name=None):
+        total = time.perf_counter() - self.start_time
+        title = "Launch profile"
+        if browser_name:
+            title += " (%s)" % browser_name
+        lines = ["%s: %.3fs total" % (title, total)]
+        measured = 0.0
+        for name, (seconds, calls, cache_hits) in self.phases.items():
+            measured += seconds
+            details = "%s call%s" % (calls, "s" if calls != 1 else "")
+            if cache_hits:
+                details += ", %s cached" % cache_hits
+            label = (name + " ").ljust(36, ".")
+            lines.append("  %s %.3fs  (%s)" % (label, seconds, details))
+        label = "other (options, browser start) ".ljust(36, ".")
+        lines.append("  %s %.3fs" % (label, max(total - measured, 0.0)))
+        return "\n".join(lines)
+
+
+def is_profiling():
+    return bool(getattr(sb_config, "launch_profile", False))
+
+
+def record_cache_hit(name):
+    if current_profile:
+        current_profile.add(name, 0.0, cache_hit=True)
+
+
+@contextmanager
+def phase(name):
+    """Adds the time of the block to the launch profile (if profiling)."""
+    if not current_profile:
+        yield
+        return
+    profile = current_profile
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(name, time.perf_counter() - start_time)
+
+
+def profiled(get_driver):
+    """Prints the launch profile after get_driver() (with --launch-profile)
+    Nested launches (Eg. the CDP Mode of a profiled launch) aren't split."""
+    @functools.wraps(get_driver)
+    def wrapper(*args, **kwargs):
+        global current_profile
+        if not is_profiling() or current_profile:
+            return get_driver(*args, **kwargs)
+        current_profile = LaunchProfile()
+        try:
+            return get_driver(*args, **kwargs)
+        finally:
+            profile = current_profile
+            current_profile = None
+            browser_name = kwargs.get("browser_name") or kwargs.get("browser")
+            if not browser_name and args:
+                browser_name = args[0]
+            print("\n" + profile.get_report(browser_name))
+    return wrapper
@@ -5,6 +5,7 @@ import time
 from contextlib import suppress
 from seleniumbase import config as sb_config
 from seleniumbase.config import settings
+from seleniumbase.core import artifact_writer
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import shared_utils
 
@@ -12,6 +13,7 @@ python3_11_or_newer = False
 if sys.version_info >= (3, 11):
     python3_11_or_newer = True
 py311_patch2 = constants.PatchPy311.PATCH
+archived_logs = None  # The archived_logs/ folder of this run (if archiving)
 
 
 def __is_cdp_swap_needed(driver):
@@ -19,6 +21,45 @@ def __is_cdp_swap_needed(driver):
     return shared_utils.is_cdp_swap_needed(driver)
 
 
+def __is_multithreaded():
+    arg_join = " ".join(sys.argv)
+    return ("-n" in sys.argv) or ("-n=" in arg_join) or (arg_join == "-c")
+
+
+def __get_archived_logs(log_path):
+    """Returns the folder that logs of this run are archived to."""
+    global archived_logs
+    if not archived_logs:
+        saved_folder = "%s/../%s/" % (log_path, constants.Logs.SAVED)
+        archived_folder = os.path.realpath(saved_folder) + "/"
+        archived_logs = "%slogs_%s" % (archived_folder, int(time.time()))
+    return archived_logs
+
+
+def __get_archive_copy_path(file_path):
+    """If logs are archived, files in latest_logs/ are also written to the
+    archive as they're saved. Returns the archive path of the file."""
+    if (
+        not settings.ARCHIVE_EXISTING_LOGS
+        and not getattr(sb_config, "archive_logs", None)
+    ) or __is_multithreaded():
+        return None
+    log_path = os.path.realpath(constants.Logs.LATEST)
+    real_path = os.path.realpath(file_path)
+    if not real_path.startswith(log_path + os.sep):
+        return None
+    return os.path.join(
+        __get_archived_logs(log_path), os.path.relpath(real_path, log_path)
+    )
+
+
+def __write_log_file(file_path, data):
+    """Data is written to the file by the background artifact writer."""
+    artifact_writer.write(
+        file_path, data, copy_path=__get_archive_copy_path(file_path)
+    )
+
+
 def log_screenshot(test_logpath, driver, screenshot=None, get=False):
     screenshot_name = settings.SCREENSHOT_NAME
     screenshot_path = os.path.join(test_logpath, screenshot_name)
@@ -34,19 +75,16 @@ def log_screenshot(test_logpath, driver, screenshot=None, get=False):
     try:
         if not screenshot:
             element = driver.find_element("tag name", "body")
-            screenshot = element.screenshot_as_base64
+            screenshot = element.screenshot_as_png
         if screenshot != screenshot_warning:
-            with open(screenshot_path, mode="wb") as file:
-                file.write(screenshot)
-            with suppress(Exception):
-                shared_utils.make_writable(screenshot_path)
+            __write_log_file(screenshot_path, screenshot)
         else:
             print("WARNING: %s" % screenshot_warning)
         if get:
             return screenshot
     except Exception:
         try:
-            driver.get_screenshot_as_file(screenshot_path)
+            __write_log_file(screenshot_path, driver.get_screenshot_as_png())
         except Exception:
             print("WARNING: %s" % screenshot_warning)
 
@@ -291,11 +329,7 @@ def log_test_failure_data(test, test_logpath, driver, browser, url=None):
     if not os.path.exists(test_logpath):
         with suppress(Exception):
             os.makedirs(test_logpath)
-    with suppress(Exception):
-        log_file = open(basic_file_path, mode="w+", encoding="utf-8")
-        log_file.writelines("\r\n".join(data_to_save))
-        log_file.close()
-        shared_utils.make_writable(basic_file_path)
+    __write_log_file(basic_file_path, "\r\n".join(data_to_save))
 
 
 def log_skipped_test_data(test, test_logpath, driver, browser, reason):
@@ -346,11 +380,7 @@ def log_skipped_test_data(test, test_logpath, driver, browser, reason):
     data_to_save.append(" * Skip Reason: %s" % reason)
     data_to_save.append("")
     file_path = os.path.join(test_logpath, "skip_reason.txt")
-    with suppress(Exception):
-        log_file = open(file_path, mode="w+", encoding="utf-8")
-        log_file.writelines("\r\n".join(data_to_save))
-        log_file.close()
-        shared_utils.make_writable(file_path)
+    __write_log_file(file_path, "\r\n".join(data_to_save))
 
 
 def log_page_source(test_logpath, driver, source=None):
@@ -381,11 +411,7 @@ def log_page_source(test_logpath, driver, source=None):
         with suppress(Exception):
             os.makedirs(test_logpath)
     html_file_path = os.path.join(test_logpath, html_file_name)
-    with suppress(Exception):
-        html_file = open(html_file_path, mode="w+", encoding="utf-8")
-        html_file.write(page_source)
-        html_file.close()
-        shared_utils.make_writable(html_file_path)
+    __write_log_file(html_file_path, page_source)
 
 
 def get_test_id(test):
@@ -513,9 +539,10 @@ def copytree(src, dst, symlinks=False, ignore=None):
 
 
 def archive_logs_if_set(log_path, archive_logs=False):
-    """Handle Logging"""
-    arg_join = " ".join(sys.argv)
-    if ("-n" in sys.argv) or ("-n=" in arg_join) or (arg_join == "-c"):
+    """Handle Logging. (Log files that were already archived as they
+    were written are skipped. Other files are copied now.)"""
+    artifact_writer.flush()
+    if __is_multithreaded():
         return  # Skip if multithreaded
     if log_path.endswith("/"):
         log_path = log_path[:-1]
@@ -535,13 +562,12 @@ def archive_logs_if_set(log_path, archive_logs=False):
                         os.makedirs(archived_folder)
                     except Exception:
                         pass  # Only reachable during multi-threaded runs
-                time_id = str(int(time.time()))
-                archived_logs = "%slogs_%s" % (archived_folder, time_id)
-                copytree(log_path, archived_logs)
+                copytree(log_path, __get_archived_logs(log_path))
 
 
 def log_folder_setup(log_path, archive_logs=False):
     """Clean up logs to prepare for another run"""
+    artifact_writer.flush()
     if log_path.endswith("/"):
         log_path = log_path[:-1]
     if log_path.startswith("/"):
@@ -584,6 +610,7 @@ def log_folder_setup(log_path, archive_logs=False):
 
 
 def clear_empty_logs():
+    artifact_writer.flush()
     latest_logs_dir = os.path.join(os.getcwd(), constants.Logs.LATEST) + os.sep
     archived_folder = os.path.join(os.getcwd(), constants.Logs.SAVED) + os.sep
     if os.path.exists(latest_logs_dir) and not os.listdir(latest_logs_dir):
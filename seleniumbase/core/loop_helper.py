@@ -0,0 +1,123 @@
+"""Runs the CDP Mode event loop on a dedicated daemon thread.
+
+By default, the sync CDP API calls loop.run_until_complete() on the thread
+of the caller, which means that the loop (and the CDP event listener) only
+runs while a sync method is in progress. With a LoopThread, the loop runs
+all the time on its own thread, and sync methods submit coroutines to it.
+Events are processed continuously, and multiple Python threads can call
+methods at the same time (Eg. to drive different tabs of one browser).
+
+Usage:
+    loop_thread = loop_helper.LoopThread(loop)
+    result = loop_thread.run_until_complete(tab.evaluate("document.title"))
+
+The loop thread must be closed when the browser quits. (See close_on_quit())
+
+(Enabled for CDP Mode with settings.USE_CDP_LOOP_THREAD = True)"""
+import asyncio
+import threading
+from contextlib import suppress
+
+
+class LoopThread:
+    """A wrapper for an event loop that runs forever on a daemon thread.
+    Has the run_until_complete() method of loops, so it can replace them.
+    Other attributes are taken from the loop itself."""
+
+    def __init__(self, loop=None):
+        if not loop:
+            loop = asyncio.new_event_loop()
+        self.loop = loop
+        self.thread = threading.Thread(
+            target=self.__run_forever, name="sb-cdp-loop", daemon=True
+        )
+        self.__started = threading.Event()
+        self.thread.start()
+        self.__started.wait()
+
+    def __run_forever(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self.__started.set)
+        self.loop.run_forever()
+
+    def __getattr__(self, name):
+        return getattr(self.loop, name)
+
+    def in_loop_thread(self):
+        return threading.current_thread() is self.thread
+
+    def run_until_complete(self, future, timeout=None):
+        """Runs the coroutine (or future) on the loop thread,
+        and then blocks until the result is ready (or the timeout)."""
+        if self.in_loop_thread():
+            raise RuntimeError(
+                "Cannot block on the loop thread! (Use await instead.)"
+            )
+        if not asyncio.iscoroutine(future):
+            future = self.__await(future)
+        return asyncio.run_coroutine_threadsafe(
+            future, self.loop
+        ).result(timeout)
+
+    async def __await(self, future):
+        return await future
+
+    def is_running(self):
+        return self.loop.is_running()
+
+    def stop(self, timeout=5):
+        """Stops the loop, and waits for the loop thread to end."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if not self.in_loop_thread():
+            self.thread.join(timeout)
+
+    async def __cancel_tasks(self):
+        tasks = [
+            task for task in asyncio.all_tasks()
+            if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self):
+        """Cancels the remaining tasks (Eg. event listeners), stops the loop,
+        and then closes it. (Does nothing if the loop is already closed.)"""
+        if self.loop.is_closed():
+            return
+        if self.loop.is_running() and not self.in_loop_thread():
+            with suppress(Exception):
+                self.run_until_complete(self.__cancel_tasks(), timeout=5)
+        self.stop()
+        if not self.loop.is_closed() and not self.loop.is_running():
+            self.loop.close()
+
+
+def close_on_quit(driver, loop):
+    """If the loop is a LoopThread, it gets closed when the driver quits.
+    (Otherwise, its thread would keep running after every test.)"""
+    if not isinstance(loop, LoopThread):
+        return
+    original_quit = driver.quit
+
+    def quit(*args, **kwargs):
+        try:
+            return original_quit(*args, **kwargs)
+        finally:
+            loop.close()
+
+    driver.quit = quit
+
+
+def get_raw_loop(loop):
+    """Returns the event loop itself if wrapped by a LoopThread."""
+    if isinstance(loop, LoopThread):
+        return loop.loop
+    return loop
+
+
+async def gather(*coros):
+    """Same as asyncio.gather(), but the tasks are created by the loop
+    that runs it (which might be running on a different thread)."""
+    return await asyncio.gather(*coros)
@@ -16,20 +16,14 @@ PROXY_DIR_PATH = os.path.join(DOWNLOADS_DIR, "proxy_ext_dir")
 PROXY_DIR_LOCK = os.path.join(DOWNLOADS_DIR, "proxy_dir.lock")
 
 
-def create_proxy_ext(
+def get_proxy_ext_files(
     proxy_string,
     proxy_user,
     proxy_pass,
     proxy_scheme="http",
     bypass_list=None,
-    zip_it=True,
 ):
-    """Implementation of https://stackoverflow.com/a/35293284 for
-    https://stackoverflow.com/questions/12848327/
-    (Run Selenium on a proxy server that requires authentication.)
-    Solution involves creating & adding a Chromium extension at runtime.
-    CHROMIUM-ONLY! *** Only Chrome and Edge browsers are supported. ***
-    """
+    """Returns the files of the proxy extension: {file_name: content}"""
     background_js = None
     if not bypass_list:
         bypass_list = ""
@@ -123,6 +117,28 @@ def create_proxy_ext(
         """"minimum_chrome_version":"88.0.0"\n"""
         """}"""
     )
+    return {"background.js": background_js, "manifest.json": manifest_json}
+
+
+def create_proxy_ext(
+    proxy_string,
+    proxy_user,
+    proxy_pass,
+    proxy_scheme="http",
+    bypass_list=None,
+    zip_it=True,
+):
+    """Implementation of https://stackoverflow.com/a/35293284 for
+    https://stackoverflow.com/questions/12848327/
+    (Run Selenium on a proxy server that requires authentication.)
+    Solution involves creating & adding a Chromium extension at runtime.
+    CHROMIUM-ONLY! *** Only Chrome and Edge browsers are supported. ***
+    """
+    ext_files = get_proxy_ext_files(
+        proxy_string, proxy_user, proxy_pass, proxy_scheme, bypass_list
+    )
+    background_js = ext_files["background.js"]
+    manifest_json = ext_files["manifest.json"]
     abs_path = os.path.abspath(".")
     downloads_path = os.path.join(abs_path, DOWNLOADS_DIR)
     if not os.path.exists(downloads_path):
@@ -145,8 +161,6 @@ def create_proxy_ext(
             f.write(manifest_json)
         with suppress(Exception):
             shared_utils.make_writable(manifest_json)
-        proxy_host = proxy_string.split(":")[0]
-        proxy_port = proxy_string.split(":")[1]
         background_file = os.path.join(proxy_ext_dir, "background.js")
         with open(background_file, mode="w") as f:
             f.write(background_js)
@@ -1,20 +1,51 @@
-"""Methods for uploading/managing files on Amazon S3."""
+"""Methods for uploading/managing files on Amazon S3.
 
-already_uploaded_files = []
+Log files are uploaded in the background by a bounded thread pool, which
+is shared by all tests of the process, so the next test can start while
+the files of the last test are still uploading. (Large files are uploaded
+in parts, concurrently.) All buckets share one S3 client per set of
+credentials, and pending uploads are finished before the process exits.
 
+Content types are detected from file names. With settings.S3_GZIP_UPLOADS,
+text files (Eg. html, txt, json) are gzipped while being uploaded (a chunk
+at a time, without a compressed copy of the whole file in memory), and are
+then served with "Content-Encoding: gzip". With settings.S3_ENDPOINT_URL,
+files are uploaded to an S3-compatible server (Eg. a moto server or MinIO)
+instead of Amazon S3."""
+import atexit
+import bisect
+import io
+import mimetypes
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from seleniumbase.config import settings
 
-class S3LoggingBucket(object):
-    """A class for uploading log files from tests to Amazon S3.
-    Those files can then be shared easily."""
-    from seleniumbase.config import settings
+MAX_UPLOAD_THREADS = 8  # The max number of files that upload at once
+MULTIPART_THRESHOLD = 8 * 1024 * 1024  # Larger files are uploaded in parts
+GZIP_TYPES = ("text/", "application/json", "application/javascript")
+GZIP_CHUNK_SIZE = 256 * 1024  # The size of the chunks that get compressed
 
-    def __init__(
-        self,
-        log_bucket=settings.S3_LOG_BUCKET,
-        bucket_url=settings.S3_BUCKET_URL,
-        selenium_access_key=settings.S3_SELENIUM_ACCESS_KEY,
-        selenium_secret_key=settings.S3_SELENIUM_SECRET_KEY,
-    ):
+already_uploaded_files = []  # (Kept sorted)
+already_uploaded_names = set()
+uploaded_files_lock = threading.Lock()
+shared_sessions = {}  # {(access_key, secret_key): (session, client)}
+shared_sessions_lock = threading.Lock()
+shared_executor = None
+shared_executor_pid = None
+shared_executor_lock = threading.Lock()
+pending_uploads = set()
+upload_errors = []
+
+
+def get_session_and_client(access_key, secret_key):
+    """Returns the shared boto3 session and S3 client for the credentials.
+    (S3 clients are thread-safe, so all threads can use the same one.)"""
+    key = (access_key, secret_key)
+    with shared_sessions_lock:
+        if key in shared_sessions:
+            return shared_sessions[key]
         import fasteners
         from seleniumbase.fixtures import constants
         from seleniumbase.fixtures import shared_utils
@@ -28,52 +59,189 @@ class S3LoggingBucket(object):
             except Exception:
                 shared_utils.pip_install("boto3")
                 import boto3
-        self.conn = boto3.Session(
-            aws_access_key_id=selenium_access_key,
-            aws_secret_access_key=selenium_secret_key,
+        session = boto3.Session(
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+        )
+        client = session.client(
+            "s3", endpoint_url=getattr(settings, "S3_ENDPOINT_URL", None)
+        )
+        shared_sessions[key] = (session, client)
+        return shared_sessions[key]
+
+
+def get_executor():
+    """Returns the upload thread pool of this process."""
+    global shared_executor
+    global shared_executor_pid
+    with shared_executor_lock:
+        if not shared_executor or shared_executor_pid != os.getpid():
+            # (A forked process doesn't have the threads of its parent)
+            if not shared_executor:
+                atexit.register(wait_for_uploads)
+            shared_executor = ThreadPoolExecutor(
+                max_workers=MAX_UPLOAD_THREADS,
+                thread_name_prefix="sb-s3-upload",
+            )
+            shared_executor_pid = os.getpid()
+            pending_uploads.clear()
+        return shared_executor
+
+
+def _upload_done(future):
+    with shared_executor_lock:
+        pending_uploads.discard(future)
+    error = future.exception()
+    if error:
+        if not upload_errors:
+            print("\nS3 upload failed: %s" % error)
+        upload_errors.append(error)
+
+
+def submit_upload(function, *args, **kwargs):
+    """Runs the upload function in the background. Returns the Future."""
+    future = get_executor().submit(function, *args, **kwargs)
+    with shared_executor_lock:
+        pending_uploads.add(future)
+    future.add_done_callback(_upload_done)
+    return future
+
+
+def wait_for_uploads():
+    """Waits until all background uploads of this process are done."""
+    if shared_executor_pid != os.getpid():
+        return
+    with shared_executor_lock:
+        futures = list(pending_uploads)
+    for future in futures:
+        try:
+            future.result()
+        except Exception:
+            pass  # (Already reported)
+
+
+def get_content_type(file_name):
+    content_type = mimetypes.guess_type(file_name)[0]
+    return content_type or "text/plain"
+
+
+def is_gzip_type(content_type):
+    return content_type.startswith(GZIP_TYPES)
+
+
+class GzipReader(io.RawIOBase):
+    """A file object that reads a file as gzip data, compressing the file
+    a chunk at a time while the data is being read. (For upload_fileobj())"""
+
+    def __init__(self, file_path, chunk_size=GZIP_CHUNK_SIZE):
+        super().__init__()
+        self.file = open(file_path, "rb")
+        self.chunk_size = chunk_size
+        # (wbits=31 makes a gzip header and trailer)
+        self.compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+        self.buffer = bytearray()
+        self.eof = False
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while not self.eof and (size is None or size < 0 or (
+            len(self.buffer) < size
+        )):
+            chunk = self.file.read(self.chunk_size)
+            if chunk:
+                self.buffer += self.compressor.compress(chunk)
+            else:
+                self.buffer += self.compressor.flush()
+                self.eof = True
+        if size is None or size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+class S3LoggingBucket(object):
+    """A class for uploading log files from tests to Amazon S3.
+    Those files can then be shared easily."""
+    from seleniumbase.config import settings
+
+    def __init__(
+        self,
+        log_bucket=settings.S3_LOG_BUCKET,
+        bucket_url=settings.S3_BUCKET_URL,
+        selenium_access_key=settings.S3_SELENIUM_ACCESS_KEY,
+        selenium_secret_key=settings.S3_SELENIUM_SECRET_KEY,
+    ):
+        self.conn, self.client = get_session_and_client(
+            selenium_access_key, selenium_secret_key
         )
         self.bucket = log_bucket
         self.bucket_url = bucket_url
 
     def get_key(self, file_name):
         """Create a new S3 connection instance with the given name."""
-        return self.conn.resource("s3").Object(self.bucket, file_name)
+        return self.conn.resource(
+            "s3", endpoint_url=getattr(settings, "S3_ENDPOINT_URL", None)
+        ).Object(self.bucket, file_name)
 
     def get_bucket(self):
         """Return the bucket being used."""
         return self.bucket
 
+    def __upload(self, file_name, file_path, content_type):
+        from boto3.s3.transfer import TransferConfig
+
+        extra_args = {"ACL": "public-read", "ContentType": content_type}
+        config = TransferConfig(multipart_threshold=MULTIPART_THRESHOLD)
+        if getattr(settings, "S3_GZIP_UPLOADS", False) and (
+            is_gzip_type(content_type)
+        ):
+            extra_args["ContentEncoding"] = "gzip"
+            with GzipReader(file_path) as data:
+                self.client.upload_fileobj(
+                    data, self.bucket, file_name,
+                    ExtraArgs=extra_args, Config=config,
+                )
+        else:
+            self.client.upload_file(
+                file_path, self.bucket, file_name,
+                ExtraArgs=extra_args, Config=config,
+            )
+
+    def upload_file_async(self, file_name, file_path):
+        """Upload a given file from the file_path to the bucket
+        with the new name/path file_name, in the background.
+        Returns a Future. (See wait_for_uploads())"""
+        return submit_upload(
+            self.__upload, file_name, file_path, get_content_type(file_name)
+        )
+
     def upload_file(self, file_name, file_path):
         """Upload a given file from the file_path to the bucket
         with the new name/path file_name."""
-        upload_key = self.get_key(file_name)
-        content_type = "text/plain"
-        if file_name.endswith(".html"):
-            content_type = "text/html"
-        elif file_name.endswith(".jpg"):
-            content_type = "image/jpeg"
-        elif file_name.endswith(".png"):
-            content_type = "image/png"
-        upload_key.Bucket().upload_file(
-            file_path,
-            file_name,
-            ExtraArgs={"ACL": "public-read", "ContentType": content_type},
-        )
+        self.upload_file_async(file_name, file_path).result()
 
     def upload_index_file(
         self, test_address, timestamp, data_path, save_data_to_logs
     ):
         """Create an index.html file with links to all the log files
-        that were just uploaded."""
-        import os
-
-        global already_uploaded_files
-        already_uploaded_files = list(set(already_uploaded_files))
-        already_uploaded_files.sort()
+        that were just uploaded. (The index uploads in the background.)"""
+        with uploaded_files_lock:
+            uploaded_files = list(already_uploaded_files)
         file_name = "%s/%s/index.html" % (test_address, timestamp)
-        index = self.get_key(file_name)
         index_str = []
-        for completed_file in already_uploaded_files:
+        for completed_file in uploaded_files:
             index_str.append(
                 "<a href='" + self.bucket_url + ""
                 "%s'>%s</a>" % (completed_file, completed_file)
@@ -81,16 +249,15 @@ class S3LoggingBucket(object):
         index_page = str("<br>".join(index_str))
         save_data_to_logs(index_page, "index.html")
         file_path = os.path.join(data_path, "index.html")
-        index.Bucket().upload_file(
-            file_path,
-            file_name,
-            ExtraArgs={"ACL": "public-read", "ContentType": "text/html"},
-        )
+        submit_upload(self.__upload, file_name, file_path, "text/html")
         return "%s%s" % (self.bucket_url, file_name)
 
     def save_uploaded_file_names(self, files):
         """Keep a record of all file names that have been uploaded.
         Upload log files related to each test after its execution.
         Once done, use already_uploaded_files to create an index file."""
-        global already_uploaded_files  # noqa
-        already_uploaded_files.extend(files)
+        with uploaded_files_lock:
+            for file_name in files:
+                if file_name not in already_uploaded_names:
+                    already_uploaded_names.add(file_name)
+                    bisect.insort(already_uploaded_files, file_name)
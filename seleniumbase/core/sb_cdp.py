@@ -12,14 +12,98 @@ from contextlib import suppress
 from filelock import FileLock
 from seleniumbase import config as sb_config
 from seleniumbase.config import settings
+from seleniumbase.core import download_helper
+from seleniumbase.core import loop_helper
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import js_utils
 from seleniumbase.fixtures import page_utils
+from seleniumbase.fixtures import poll_utils
 from seleniumbase.fixtures import shared_utils
 from seleniumbase.undetected.cdp_driver import cdp_util
+from seleniumbase.undetected.cdp_driver import element as cdp_element
 from seleniumbase.undetected.cdp_driver import tab as cdp_tab
 
 
+def _sync_element_method(name, cdp_method=None):
+    """Returns an Element method that calls CDPMethods.__<cdp_method>()
+    with the element, which runs the async version with the event loop."""
+    mangled_name = "_CDPMethods__%s" % (cdp_method or name)
+
+    def sync_method(self, *args, **kwargs):
+        return getattr(self._sync_api, mangled_name)(self, *args, **kwargs)
+
+    sync_method.__name__ = name
+    return sync_method
+
+
+class SyncElement(cdp_element.Element):
+    """An Element with the sync methods of CDP Mode. (Eg. element.click())
+    Elements are converted in place (by swapping the class), which means
+    that no objects (or closures) are created per element."""
+    __slots__ = ()
+    clear_input = _sync_element_method("clear_input")
+    click = _sync_element_method("click")
+    flash = _sync_element_method("flash")
+    focus = _sync_element_method("focus")
+    gui_click = _sync_element_method("gui_click")
+    highlight_overlay = _sync_element_method("highlight_overlay")
+    is_in_viewport = _sync_element_method("is_in_viewport")
+    mouse_click = _sync_element_method("mouse_click")
+    click_with_offset = _sync_element_method(
+        "click_with_offset", "mouse_click_with_offset_async"
+    )
+    click_and_hold = _sync_element_method(
+        "click_and_hold", "mouse_click_and_hold"
+    )
+    mouse_drag = _sync_element_method("mouse_drag")
+    mouse_move = _sync_element_method("mouse_move")
+    press_keys = _sync_element_method("press_keys")
+    query_selector = _sync_element_method("query_selector")
+    querySelector = query_selector
+    query_selector_all = _sync_element_method("query_selector_all")
+    querySelectorAll = query_selector_all
+    remove_from_dom = _sync_element_method("remove_from_dom")
+    save_screenshot = _sync_element_method("save_screenshot")
+    save_to_dom = _sync_element_method("save_to_dom")
+    scroll_into_view = _sync_element_method("scroll_into_view")
+    select_option = _sync_element_method("select_option")
+    send_file = _sync_element_method("send_file")
+    send_keys = _sync_element_method("send_keys")
+    set_text = _sync_element_method("set_text")
+    set_value = _sync_element_method("set_value")
+    type = _sync_element_method("type")
+    get_position = _sync_element_method("get_position")
+    get_html = _sync_element_method("get_html")
+    get_js_attributes = _sync_element_method("get_js_attributes")
+    get_attribute = _sync_element_method("get_attribute")
+    get_parent = _sync_element_method("get_parent")
+
+    def __load_tree(self):
+        # Elements from shallow queries load the document tree on first use
+        if self._tree is None and self._sync_api:
+            self._sync_api.loop.run_until_complete(self.update())
+
+    @property
+    def parent(self):
+        self.__load_tree()
+        return super().parent
+
+    @property
+    def children(self):
+        self.__load_tree()
+        return super().children
+
+    @property
+    def text(self):
+        self.__load_tree()
+        return super().text
+
+    @property
+    def text_all(self):
+        self.__load_tree()
+        return super().text_all
+
+
 class CDPMethods():
     def __init__(self, loop, page, driver):
         self.loop = loop
@@ -70,66 +154,10 @@ class CDPMethods():
     def __add_sync_methods(self, element):
         if not element:
             return element
-        element.clear_input = lambda: self.__clear_input(element)
-        element.click = lambda: self.__click(element)
-        element.flash = lambda *args, **kwargs: self.__flash(
-            element, *args, **kwargs
-        )
-        element.focus = lambda: self.__focus(element)
-        element.gui_click = (
-            lambda *args, **kwargs: self.__gui_click(element, *args, **kwargs)
-        )
-        element.highlight_overlay = lambda: self.__highlight_overlay(element)
-        element.is_in_viewport = lambda: self.__is_in_viewport(element)
-        element.mouse_click = lambda: self.__mouse_click(element)
-        element.click_with_offset = (
-            lambda *args, **kwargs: self.__mouse_click_with_offset_async(
-                element, *args, **kwargs
-            )
-        )
-        element.click_and_hold = (
-            lambda *args, **kwargs: (
-                self.__mouse_click_and_hold(element, *args, **kwargs)
-            )
-        )
-        element.mouse_drag = (
-            lambda destination: self.__mouse_drag(element, destination)
-        )
-        element.mouse_move = lambda: self.__mouse_move(element)
-        element.press_keys = lambda text: self.__press_keys(element, text)
-        element.query_selector = (
-            lambda selector: self.__query_selector(element, selector)
-        )
-        element.querySelector = element.query_selector
-        element.query_selector_all = (
-            lambda selector: self.__query_selector_all(element, selector)
-        )
-        element.querySelectorAll = element.query_selector_all
-        element.remove_from_dom = lambda: self.__remove_from_dom(element)
-        element.save_screenshot = (
-            lambda *args, **kwargs: self.__save_screenshot(
-                element, *args, **kwargs)
-        )
-        element.save_to_dom = lambda: self.__save_to_dom(element)
-        element.scroll_into_view = lambda: self.__scroll_into_view(element)
-        element.select_option = lambda: self.__select_option(element)
-        element.send_file = (
-            lambda *file_paths: self.__send_file(element, *file_paths)
-        )
-        element.send_keys = lambda text, **kwargs: self.__send_keys(
-            element, text, **kwargs
-        )
-        element.set_text = lambda value: self.__set_text(element, value)
-        element.set_value = lambda value: self.__set_value(element, value)
-        element.type = lambda text: self.__type(element, text)
-        element.get_position = lambda: self.__get_position(element)
-        element.get_html = lambda: self.__get_html(element)
-        element.get_js_attributes = lambda: self.__get_js_attributes(element)
-        element.get_attribute = (
-            lambda attribute: self.__get_attribute(element, attribute)
-        )
-        # element.get_parent() should come last
-        element.get_parent = lambda: self.__get_parent(element)
+        if type(element) is cdp_element.Element:
+            # Same slots, so the class can be swapped in place
+            element.__class__ = SyncElement
+        element._sync_api = self
         return element
 
     def get(self, url, **kwargs):
@@ -142,6 +170,28 @@ class CDPMethods():
         if hasattr(sb_config, "_cdp_proxy") and sb_config._cdp_proxy:
             load_timeout = 90.0
             wait_timeout = 75.0
+        url_protocol = url.split(":")[0]
+        safe_url = True
+        if url_protocol not in ["about", "data", "chrome"]:
+            safe_url = False
+        wait_until = None
+        if not safe_url and not kwargs:
+            wait_until = settings.CDP_MODE_WAIT_UNTIL
+        if wait_until:
+            # Returns when the page reaches the milestone. (No fixed sleeps)
+            try:
+                task = self.page.get(url, wait_until=wait_until)
+                self.loop.run_until_complete(
+                    asyncio.wait_for(task, timeout=load_timeout)
+                )
+            except asyncio.TimeoutError:
+                print("Timeout loading %s" % url)
+            except RuntimeError:
+                self.loop.run_until_complete(
+                    self.page.get(url, wait_until=wait_until)
+                )
+            self.__slow_mode_pause_if_set()
+            return
         try:
             task = self.page.get(url, **kwargs)
             self.loop.run_until_complete(
@@ -153,10 +203,6 @@ class CDPMethods():
             self.loop.run_until_complete(
                 self.page.get(url, **kwargs)
             )
-        url_protocol = url.split(":")[0]
-        safe_url = True
-        if url_protocol not in ["about", "data", "chrome"]:
-            safe_url = False
         if not safe_url:
             time.sleep(constants.UC.CDP_MODE_OPEN_WAIT)
             if shared_utils.is_windows():
@@ -1959,25 +2005,10 @@ class CDPMethods():
         downloads_path = os.path.join(abs_path, downloads_folder)
         if not timeout:
             timeout = settings.LARGE_TIMEOUT
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
         downloaded_file_path = os.path.join(downloads_path, file)
-        found = False
-        for x in range(int(timeout)):
-            shared_utils.check_if_time_limit_exceeded()
-            try:
-                self.assert_true(
-                    os.path.exists(downloaded_file_path),
-                    "File [%s] was not found in the downloads folder [%s]!"
-                    % (file, downloads_path),
-                )
-                found = True
-                break
-            except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
-                    break
-                time.sleep(1)
+        found = download_helper.wait_for_download_complete(
+            downloads_path, file=file, timeout=timeout
+        )
         if not found and not os.path.exists(downloaded_file_path):
             plural = "s"
             if timeout == 1:
@@ -1990,6 +2021,32 @@ class CDPMethods():
             from seleniumbase.common.exceptions import NoSuchFileException
             raise NoSuchFileException(message)
 
+    def wait_for_download_complete(self, file, timeout=None):
+        """Waits for a download to complete in the [Downloads Folder].
+        (The file must have its final name, and no partial download file.)
+        Returns a dict with the "path", "size" (bytes), "seconds" (waited),
+        and "throughput" (bytes/second) of the download."""
+        downloads_path = os.path.join(
+            os.path.abspath("."), constants.Files.DOWNLOADS_FOLDER
+        )
+        if not timeout:
+            timeout = settings.LARGE_TIMEOUT
+        result = download_helper.wait_for_download_complete(
+            downloads_path, file=file, timeout=timeout
+        )
+        if not result:
+            plural = "s"
+            if timeout == 1:
+                plural = ""
+            message = (
+                "Download of {%s} did not complete in the downloads folder "
+                "{%s} after %s second%s!"
+                % (file, downloads_path, timeout, plural)
+            )
+            from seleniumbase.common.exceptions import NoSuchFileException
+            raise NoSuchFileException(message)
+        return result
+
     def get_path_of_downloaded_file(self, file):
         """This assumes the default location of SeleniumBase downloads,
         which is the "./downloaded_files/" folder where scripts run."""
@@ -2337,6 +2394,8 @@ class CDPMethods():
             )
             time.sleep(0.3)
         driver.quit()
+        if isinstance(self.loop, loop_helper.LoopThread):
+            self.loop.close()  # (Stops the loop thread)
 
     def _on_a_cf_turnstile_page(self, source=None):
         if not source or len(source) < 400:
@@ -3105,8 +3164,7 @@ class CDPMethods():
     def wait_for_text(self, text, selector="body", timeout=None):
         if not timeout:
             timeout = settings.SMALL_TIMEOUT
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
+        poller = poll_utils.PollScheduler(timeout, name="cdp.wait_for_text")
         text = text.strip()
         element = None
         failure = False
@@ -3122,15 +3180,11 @@ class CDPMethods():
             message = msg % (selector, timeout, plural)
         if failure:
             raise Exception(message)
-        for i in range(int(timeout * 10)):
+        for i in poller:
             with suppress(Exception):
                 element = self.find_element(selector, timeout=0.1)
             if text in element.text_all:
                 return True
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
         message = (
             "Expected text substring {%s} for {%s} was not found!\n"
             " (Actual text was {%s})"
@@ -3142,15 +3196,12 @@ class CDPMethods():
         if not timeout:
             timeout = settings.SMALL_TIMEOUT
         text = text.strip()
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
-        for i in range(int(timeout * 10)):
+        poller = poll_utils.PollScheduler(
+            timeout, name="cdp.wait_for_text_not_visible"
+        )
+        for i in poller:
             if not self.is_text_visible(text, selector):
                 return True
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
         plural = "s"
         if timeout == 1:
             plural = ""
@@ -3175,10 +3226,12 @@ class CDPMethods():
             message = msg % (selector, timeout, plural)
         if failure:
             raise Exception(message)
-        for i in range(30):
+        poller = poll_utils.PollScheduler(
+            3, name="cdp.wait_for_element_visible"
+        )
+        for i in poller:
             if self.is_element_visible(selector):
                 return self.select(selector)
-            time.sleep(0.1)
         raise Exception("Element {%s} was not visible!" % selector)
 
     def wait_for_element(self, selector, **kwargs):
@@ -3189,17 +3242,14 @@ class CDPMethods():
         """Wait for element to not be visible on page. (May still be in DOM)"""
         if not timeout:
             timeout = settings.SMALL_TIMEOUT
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
-        for i in range(int(timeout * 10)):
+        poller = poll_utils.PollScheduler(
+            timeout, name="cdp.wait_for_element_not_visible"
+        )
+        for i in poller:
             if not self.is_element_present(selector):
                 return True
             elif not self.is_element_visible(selector):
                 return True
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
         plural = "s"
         if timeout == 1:
             plural = ""
@@ -3212,15 +3262,12 @@ class CDPMethods():
         """Wait for element to not be present in the DOM."""
         if not timeout:
             timeout = settings.SMALL_TIMEOUT
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
-        for i in range(int(timeout * 10)):
+        poller = poll_utils.PollScheduler(
+            timeout, name="cdp.wait_for_element_absent"
+        )
+        for i in poller:
             if not self.is_element_present(selector):
                 return True
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
         plural = "s"
         if timeout == 1:
             plural = ""
@@ -3268,19 +3315,16 @@ class CDPMethods():
                 selectors.append(arg)
         if not selectors:
             raise Exception("The selectors list was empty!")
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
+        poller = poll_utils.PollScheduler(
+            timeout, name="cdp.wait_for_any_of_elements_visible"
+        )
         any_present = False
-        for i in range(int(timeout * 10)):
+        for i in poller:
             for selector in selectors:
                 if self.is_element_visible(selector):
                     return self.select(selector)
                 if self.is_element_present(selector):
                     any_present = True
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
         plural = "s"
         if timeout == 1:
             plural = ""
@@ -3341,16 +3385,13 @@ class CDPMethods():
                 selectors.append(arg)
         if not selectors:
             raise Exception("The selectors list was empty!")
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
-        for i in range(int(timeout * 10)):
+        poller = poll_utils.PollScheduler(
+            timeout, name="cdp.wait_for_any_of_elements_present"
+        )
+        for i in poller:
             for selector in selectors:
                 if self.is_element_present(selector):
                     return self.select(selector)
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
         plural = "s"
         if timeout == 1:
             plural = ""
@@ -3395,10 +3436,10 @@ class CDPMethods():
             message = msg % (selector, timeout, plural)
         if failure:
             raise Exception(message)
-        for i in range(30):
+        poller = poll_utils.PollScheduler(3, name="cdp.assert_element_visible")
+        for i in poller:
             if self.is_element_visible(selector):
                 return True
-            time.sleep(0.1)
         raise Exception("Element {%s} was not visible!" % selector)
 
     def assert_element_present(self, selector, timeout=None):
@@ -3504,8 +3545,9 @@ class CDPMethods():
     def assert_exact_text(self, text, selector="body", timeout=None):
         if not timeout:
             timeout = settings.SMALL_TIMEOUT
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
+        poller = poll_utils.PollScheduler(
+            timeout, name="cdp.assert_exact_text"
+        )
         text = text.strip()
         element = None
         failure = False
@@ -3521,7 +3563,7 @@ class CDPMethods():
             message = msg % (selector, timeout, plural)
         if failure:
             raise Exception(message)
-        for i in range(int(timeout * 10)):
+        for i in poller:
             with suppress(Exception):
                 element = self.select(selector, timeout=0.1)
             if (
@@ -3529,10 +3571,6 @@ class CDPMethods():
                 and text.strip() == element.text_all.strip()
             ):
                 return True
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
         message = (
             "Expected exact text {%s} for {%s} was not found! "
             "(Actual text was {%s})"
@@ -3877,4 +3915,6 @@ class Chrome(CDPMethods):
             pass
         except Exception:
             pass
+        if settings.USE_CDP_LOOP_THREAD:
+            loop = loop_helper.LoopThread(loop)
         super().__init__(loop, page, driver)
@@ -101,6 +101,20 @@ def set_settings(settings_file):
             settings.WAIT_FOR_RSC_ON_CLICKS = override_settings[key]
         elif key == "WAIT_FOR_ANGULARJS":
             settings.WAIT_FOR_ANGULARJS = override_settings[key]
+        elif key == "USE_OBSERVER_WAITS":
+            settings.USE_OBSERVER_WAITS = override_settings[key]
+        elif key == "BATCH_ACTION_PROBES":
+            settings.BATCH_ACTION_PROBES = override_settings[key]
+        elif key == "USE_CDP_LOOP_THREAD":
+            settings.USE_CDP_LOOP_THREAD = override_settings[key]
+        elif key == "WARM_BROWSER_POOL_SIZE":
+            settings.WARM_BROWSER_POOL_SIZE = override_settings[key]
+        elif key == "USE_CDP_DOM_MIRROR":
+            settings.USE_CDP_DOM_MIRROR = override_settings[key]
+        elif key == "USE_CDP_SHALLOW_QUERIES":
+            settings.USE_CDP_SHALLOW_QUERIES = override_settings[key]
+        elif key == "CDP_MODE_WAIT_UNTIL":
+            settings.CDP_MODE_WAIT_UNTIL = override_settings[key]
         elif key == "DEFAULT_DEMO_MODE_TIMEOUT":
             settings.DEFAULT_DEMO_MODE_TIMEOUT = override_settings[key]
         elif key == "HIGHLIGHTS":
@@ -155,6 +169,8 @@ def set_settings(settings_file):
             settings.DB_PASSWORD = override_settings[key]
         elif key == "DB_SCHEMA":
             settings.DB_SCHEMA = override_settings[key]
+        elif key == "DB_SQLITE_FILE":
+            settings.DB_SQLITE_FILE = override_settings[key]
         elif key == "S3_LOG_BUCKET":
             settings.S3_LOG_BUCKET = override_settings[key]
         elif key == "S3_BUCKET_URL":
@@ -163,6 +179,10 @@ def set_settings(settings_file):
             settings.S3_SELENIUM_ACCESS_KEY = override_settings[key]
         elif key == "S3_SELENIUM_SECRET_KEY":
             settings.S3_SELENIUM_SECRET_KEY = override_settings[key]
+        elif key == "S3_ENDPOINT_URL":
+            settings.S3_ENDPOINT_URL = override_settings[key]
+        elif key == "S3_GZIP_UPLOADS":
+            settings.S3_GZIP_UPLOADS = override_settings[key]
         elif key == "ENCRYPTION_KEY":
             settings.ENCRYPTION_KEY = override_settings[key]
         elif key == "OBFUSCATION_START_TOKEN":
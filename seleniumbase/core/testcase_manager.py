@@ -1,10 +1,17 @@
-from seleniumbase.core.mysql import DatabaseManager
+from seleniumbase.core import db_writer
 
 
 class TestcaseManager:
+    """Saves test results to the DB. The queries are queued, and then run
+    in batches on one connection per process. (See core/db_writer.py)"""
+
     def __init__(self, database_env):
         self.database_env = database_env
 
+    def flush(self):
+        """Waits until all queued queries have run."""
+        db_writer.flush()
+
     def insert_execution_data(self, execution_query_payload):
         """Inserts a test execution row into the database.
         Returns the execution guid.
@@ -15,9 +22,7 @@ class TestcaseManager:
                    (guid, execution_start, total_execution_time, username)
                    VALUES (%(guid)s,%(execution_start_time)s,
                            %(total_execution_time)s,%(username)s)"""
-        DatabaseManager(self.database_env).execute_query(
-            query, execution_query_payload.get_params()
-        )
+        db_writer.write(query, execution_query_payload.get_params())
         return execution_query_payload.guid
 
     def update_execution_data(self, execution_guid, execution_time):
@@ -25,7 +30,7 @@ class TestcaseManager:
         query = """UPDATE test_execution
                    SET total_execution_time=%(execution_time)s
                    WHERE guid=%(execution_guid)s """
-        DatabaseManager(self.database_env).execute_query(
+        db_writer.write(
             query,
             {
                 "execution_guid": execution_guid,
@@ -50,9 +55,7 @@ class TestcaseManager:
                               %(retry_count)s,
                               %(message)s,
                               %(stack_trace)s) """
-        DatabaseManager(self.database_env).execute_query(
-            query, testcase_run_payload.get_params()
-        )
+        db_writer.write(query, testcase_run_payload.get_params())
 
     def update_testcase_data(self, testcase_payload):
         """Updates an existing test run in the database."""
@@ -63,17 +66,13 @@ class TestcaseManager:
                             stack_trace=%(stack_trace)s,
                             message=%(message)s
                             WHERE guid=%(guid)s """
-        DatabaseManager(self.database_env).execute_query(
-            query, testcase_payload.get_params()
-        )
+        db_writer.write(query, testcase_payload.get_params())
 
     def update_testcase_log_url(self, testcase_payload):
         query = """UPDATE test_run_data
                    SET log_url=%(log_url)s
                    WHERE guid=%(guid)s """
-        DatabaseManager(self.database_env).execute_query(
-            query, testcase_payload.get_params()
-        )
+        db_writer.write(query, testcase_payload.get_params())
 
 
 class ExecutionQueryPayload:
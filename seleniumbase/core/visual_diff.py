@@ -0,0 +1,204 @@
+"""Pixel-level comparisons of screenshots for self.check_window().
+
+Images are compared in three stages, from fastest to slowest:
+1. If the PNG files are byte-for-byte identical, nothing changed.
+2. A perceptual hash (dHash) of each image is calculated. If the distance
+   between the hashes is more than HASH_THRESHOLD, the images are changed.
+   (When only that verdict is needed, the pixel diff is skipped.)
+   A small hash distance doesn't mean unchanged: A dHash is too coarse
+   to see small changes, such as one line of text on a large page.
+3. Pixels are compared block by block. A pixel is changed if a color
+   channel differs by more than PIXEL_TOLERANCE (to ignore anti-aliasing).
+   The result includes the ratio of changed pixels to all pixels.
+
+If a diff path is given, a heatmap PNG is saved there, with changed blocks
+highlighted in red over a faded copy of the latest screenshot.
+Uses NumPy if it's installed. Otherwise, only Pillow is used."""
+import os
+
+HASH_SIZE = 8  # dHash uses (HASH_SIZE + 1) x HASH_SIZE grayscale thumbnails
+HASH_THRESHOLD = 0  # Images with a larger dHash distance are "changed"
+BLOCK_SIZE = 16  # The width/height of the blocks in the heatmap (in pixels)
+PIXEL_TOLERANCE = 16  # The max difference of a color channel (out of 255)
+
+
+def is_available():
+    """Returns True if Pillow is installed."""
+    try:
+        import PIL  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+
+def get_dhash(image, hash_size=HASH_SIZE):
+    """Returns the difference hash (dHash) of a PIL image as an int."""
+    from PIL import Image
+
+    thumbnail = image.convert("L").resize(
+        (hash_size + 1, hash_size), Image.LANCZOS
+    )
+    pixels = thumbnail.tobytes()
+    value = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def get_hash_distance(hash_1, hash_2):
+    return bin(hash_1 ^ hash_2).count("1")
+
+
+def _pad_to_size(image, size):
+    """Pads the image with black pixels so that both images align."""
+    from PIL import Image
+
+    if image.size == size:
+        return image
+    padded = Image.new("RGB", size, (0, 0, 0))
+    padded.paste(image, (0, 0))
+    return padded
+
+
+def _get_changed_mask(baseline, latest, pixel_tolerance):
+    """Returns a mode "L" image where changed pixels are 255."""
+    from PIL import ImageChops
+
+    try:
+        import numpy
+    except Exception:
+        numpy = None
+    if numpy is not None:
+        from PIL import Image
+
+        delta = numpy.abs(
+            numpy.asarray(baseline, dtype=numpy.int16)
+            - numpy.asarray(latest, dtype=numpy.int16)
+        ).max(axis=2)
+        changed = (delta > pixel_tolerance).astype(numpy.uint8) * 255
+        return Image.fromarray(changed, mode="L")
+    delta = ImageChops.difference(baseline, latest)
+    channels = delta.split()
+    delta = ImageChops.lighter(
+        ImageChops.lighter(channels[0], channels[1]), channels[2]
+    )
+    return delta.point(lambda x: 255 if x > pixel_tolerance else 0)
+
+
+def _get_block_ratios(mask, block_size):
+    """Returns {(x, y): ratio_of_changed_pixels} for changed blocks."""
+    from PIL import Image
+
+    width, height = mask.size
+    columns = (width + block_size - 1) // block_size
+    rows = (height + block_size - 1) // block_size
+    # Averaging each block (box filter) gives the ratio of changed pixels
+    padded = Image.new("L", (columns * block_size, rows * block_size), 0)
+    padded.paste(mask, (0, 0))
+    averages = padded.resize((columns, rows), Image.BOX)
+    blocks = {}
+    for index, value in enumerate(averages.tobytes()):
+        if value:
+            blocks[(index % columns, index // columns)] = value / 255.0
+    return blocks, columns * rows
+
+
+def save_heatmap(latest, blocks, block_size, diff_path):
+    """Saves a copy of the latest image with changed blocks in red."""
+    from PIL import Image, ImageDraw
+
+    heatmap = Image.blend(
+        latest, Image.new("RGB", latest.size, (255, 255, 255)), 0.6
+    ).convert("RGBA")
+    overlay = Image.new("RGBA", latest.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    for (x, y), ratio in blocks.items():
+        alpha = int(96 + 159 * ratio)
+        draw.rectangle(
+            [
+                x * block_size,
+                y * block_size,
+                (x + 1) * block_size - 1,
+                (y + 1) * block_size - 1,
+            ],
+            fill=(255, 0, 0, alpha),
+        )
+    Image.alpha_composite(heatmap, overlay).convert("RGB").save(diff_path)
+
+
+def compare_images(
+    baseline_path,
+    latest_path,
+    diff_path=None,
+    block_size=BLOCK_SIZE,
+    pixel_tolerance=PIXEL_TOLERANCE,
+    hash_threshold=HASH_THRESHOLD,
+    ratio_needed=True,
+):
+    """Compares the latest PNG to the baseline PNG.
+    Returns a dict with the results:
+    "identical" - True if the files are byte-for-byte identical
+    "unchanged" - True if identical, or if no pixels changed
+    "hash_distance" - the number of dHash bits that differ (0 to 64)
+    "size_changed" - True if the images have different sizes
+    "changed_ratio" - the ratio of changed pixels to all pixels
+    "changed_blocks" / "total_blocks" - the number of blocks
+    "diff_path" - the heatmap path (if saved), or None.
+    If "ratio_needed" is False (and there's no "diff_path"), the pixel diff
+    is skipped for images with different hashes. ("changed_ratio": None)"""
+    results = {
+        "identical": False,
+        "unchanged": False,
+        "hash_distance": 0,
+        "size_changed": False,
+        "changed_ratio": 0.0,
+        "changed_blocks": 0,
+        "total_blocks": 0,
+        "diff_path": None,
+    }
+    if os.path.getsize(baseline_path) == os.path.getsize(latest_path):
+        with open(baseline_path, "rb") as f1, open(latest_path, "rb") as f2:
+            if f1.read() == f2.read():
+                results["identical"] = True
+                results["unchanged"] = True
+                return results
+    from PIL import Image
+
+    with Image.open(baseline_path) as baseline_image:
+        baseline = baseline_image.convert("RGB")
+    with Image.open(latest_path) as latest_image:
+        latest = latest_image.convert("RGB")
+    results["hash_distance"] = get_hash_distance(
+        get_dhash(baseline), get_dhash(latest)
+    )
+    if (
+        not ratio_needed
+        and not diff_path
+        and results["hash_distance"] > hash_threshold
+    ):
+        results["size_changed"] = baseline.size != latest.size
+        results["changed_ratio"] = None
+        return results
+    if baseline.size != latest.size:
+        results["size_changed"] = True
+        size = (
+            max(baseline.size[0], latest.size[0]),
+            max(baseline.size[1], latest.size[1]),
+        )
+        baseline = _pad_to_size(baseline, size)
+        latest = _pad_to_size(latest, size)
+    mask = _get_changed_mask(baseline, latest, pixel_tolerance)
+    changed_pixels = mask.histogram()[255]
+    width, height = mask.size
+    results["changed_ratio"] = changed_pixels / float(width * height)
+    results["unchanged"] = not changed_pixels and not results["size_changed"]
+    blocks, total_blocks = _get_block_ratios(mask, block_size)
+    results["changed_blocks"] = len(blocks)
+    results["total_blocks"] = total_blocks
+    if diff_path and blocks:
+        save_heatmap(latest, blocks, block_size, diff_path)
+        results["diff_path"] = diff_path
+    return results
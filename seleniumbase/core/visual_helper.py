@@ -33,19 +33,33 @@ def get_sbs_head():
     return head
 
 
-def get_sbs_table_row(baseline="baseline.png", diff="baseline_diff.png"):
+def get_sbs_table_row(
+    baseline="baseline.png", diff="baseline_diff.png", heatmap=None
+):
+    heatmap_cell = ""
+    if heatmap:
+        heatmap_cell = '<td><img src="%s" width="100%%" /></td>' % heatmap
     row = (
         '<tbody class="compare results-table-row">'
         '<tr style="background-color: #F4F4FE;">'
         '<td><img src="%s" width="100%%" /></td>'
         '<td><img src="%s" width="100%%" /></td>'
+        "%s"
         "</tr></tbody>"
-        "" % (baseline, diff)
+        "" % (baseline, diff, heatmap_cell)
     )
     return row
 
 
-def get_sbs_table_html(baseline="baseline.png", diff="baseline_diff.png"):
+def get_sbs_table_html(
+    baseline="baseline.png", diff="baseline_diff.png", heatmap=None
+):
+    heatmap_header = ""
+    if heatmap:
+        heatmap_header = (
+            '<th style="background-color: rgba(255, 0, 0, 0.25);"'
+            ' col="heatmap">Pixel Diff Heatmap</th>'
+        )
     table_html = (
         '<table border="3px solid #E6E6E6;" width="100%;" padding: 12px;'
         ' font-size="16px;" text-align="left;" id="results-table"'
@@ -56,9 +70,10 @@ def get_sbs_table_html(baseline="baseline.png", diff="baseline_diff.png"):
         ' col="baseline">Baseline Screenshot</th>'
         '<th style="background-color: rgba(128, 0, 0, 0.25);"'
         ' col="failure">Visual Diff Failure Screenshot</th>'
-        "</tr></thead>"
+        + heatmap_header
+        + "</tr></thead>"
     )
-    row = get_sbs_table_row(baseline, diff)
+    row = get_sbs_table_row(baseline, diff, heatmap)
     table_html += row
     table_html += "</table>"
     return table_html
@@ -93,10 +108,12 @@ def get_sbs_footer():
     return footer
 
 
-def get_sbs_html(baseline="baseline.png", diff="baseline_diff.png"):
+def get_sbs_html(
+    baseline="baseline.png", diff="baseline_diff.png", heatmap=None
+):
     head = get_sbs_head()
     header = get_sbs_header()
-    table_html = get_sbs_table_html(baseline, diff)
+    table_html = get_sbs_table_html(baseline, diff, heatmap)
     footer = get_sbs_footer()
     the_html = (
         '<html lang="en">'
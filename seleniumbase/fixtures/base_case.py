@@ -78,7 +78,10 @@ from seleniumbase.common.exceptions import (
     VisualException,
 )
 from seleniumbase.config import settings
+from seleniumbase.core import artifact_writer
 from seleniumbase.core import browser_launcher
+from seleniumbase.core import browser_pool
+from seleniumbase.core import dash_journal
 from seleniumbase.core import download_helper
 from seleniumbase.core import log_helper
 from seleniumbase.core import session_helper
@@ -143,6 +146,7 @@ class BaseCase(unittest.TestCase):
         self.__will_be_skipped = False
         self.__passed_then_skipped = False
         self.__visual_baseline_copies = []
+        self.__in_new_browser_context = False
         self.__last_url_of_deferred_assert = "about:blank"
         self.__last_page_load_url = "about:blank"
         self.__last_page_screenshot = None
@@ -449,19 +453,35 @@ class BaseCase(unittest.TestCase):
             return
         if self.__needs_minimum_wait() or self.browser == "safari":
             time.sleep(0.05)
-        element = page_actions.wait_for_element_visible(
-            self.driver,
-            selector,
-            by,
-            timeout=timeout,
-            original_selector=original_selector,
-        )
-        self.__demo_mode_highlight_if_active(original_selector, original_by)
-        if scroll and not self.demo_mode and not self.slow_mode:
-            self.__scroll_to_element(element, selector, by)
+        snapshot = None
+        if self.__can_batch_action_probes():
+            # One script call replaces several separate WebDriver calls
+            with suppress(Exception):
+                element = self.driver.find_element(by=by, value=selector)
+                snapshot = js_utils.get_click_snapshot(
+                    self.driver, element, scroll=scroll
+                )
+            if snapshot and not snapshot["visible"]:
+                snapshot = None  # Wait for the element to be visible
+        if not snapshot:
+            element = page_actions.wait_for_element_visible(
+                self.driver,
+                selector,
+                by,
+                timeout=timeout,
+                original_selector=original_selector,
+            )
+            self.__demo_mode_highlight_if_active(
+                original_selector, original_by
+            )
+            if scroll and not self.demo_mode and not self.slow_mode:
+                self.__scroll_to_element(element, selector, by)
         pre_action_url = None
-        with suppress(Exception):
-            pre_action_url = self.driver.current_url
+        if snapshot:
+            pre_action_url = snapshot["url"]
+        else:
+            with suppress(Exception):
+                pre_action_url = self.driver.current_url
         pre_window_count = len(self.driver.window_handles)
         try:
             if (
@@ -476,11 +496,21 @@ class BaseCase(unittest.TestCase):
                 new_tab = False
                 onclick = None
                 with suppress(Exception):
-                    if self.headless and element.tag_name.lower() == "a":
+                    tag_name = None
+                    if snapshot:
+                        tag_name = snapshot["tag"]
+                    elif self.headless:
+                        tag_name = element.tag_name.lower()
+                    if self.headless and tag_name == "a":
                         # Handle a special case of opening a new tab (headless)
-                        href = element.get_attribute("href").strip()
-                        onclick = element.get_attribute("onclick")
-                        target = element.get_attribute("target")
+                        if snapshot:
+                            href = snapshot["href"].strip()
+                            onclick = snapshot["onclick"]
+                            target = snapshot["target"]
+                        else:
+                            href = element.get_attribute("href").strip()
+                            onclick = element.get_attribute("onclick")
+                            target = element.get_attribute("target")
                         if target == "_blank":
                             new_tab = True
                         if new_tab and self.__looks_like_a_page_url(href):
@@ -631,6 +661,10 @@ class BaseCase(unittest.TestCase):
                         )
                         self.__element_click(element)
         latest_window_count = len(self.driver.window_handles)
+        post_snapshot = None
+        if snapshot and latest_window_count == pre_window_count:
+            with suppress(Exception):
+                post_snapshot = js_utils.get_post_action_snapshot(self.driver)
         if (
             latest_window_count > pre_window_count
             and (
@@ -649,7 +683,15 @@ class BaseCase(unittest.TestCase):
             # If a click closes the active window,
             # switch to the last one if it exists.
             self.switch_to_window(-1)
-        if settings.WAIT_FOR_RSC_ON_CLICKS:
+        if post_snapshot and not settings.WAIT_FOR_RSC_ON_CLICKS:
+            # The batched version of the "else" block below
+            if post_snapshot["angular"]:
+                with suppress(Exception):
+                    self.wait_for_angularjs(timeout=settings.MINI_TIMEOUT)
+            if post_snapshot["url"] != pre_action_url:
+                self.__ad_block_as_needed()
+                self.__disable_beforeunload_as_needed()
+        elif settings.WAIT_FOR_RSC_ON_CLICKS:
             if not self.undetectable:
                 with suppress(Exception):
                     self.wait_for_ready_state_complete()
@@ -4366,7 +4408,7 @@ class BaseCase(unittest.TestCase):
                 "Valid options = {%s}" % (browser, valid_browsers)
             )
         # Launch a web browser
-        new_driver = browser_launcher.get_driver(
+        driver_kwargs = dict(
             browser_name=browser_name,
             headless=headless,
             locale_code=locale_code,
@@ -4425,6 +4467,18 @@ class BaseCase(unittest.TestCase):
             device_pixel_ratio=d_p_r,
             browser=browser_name,
         )
+        if (
+            browser_pool.is_enabled()
+            and not undetectable
+            and not user_data_dir
+        ):
+            # Check out a warm browser (pre-launched in the background)
+            new_driver = browser_pool.checkout(
+                browser_launcher.get_driver, **driver_kwargs
+            )
+        else:
+            new_driver = browser_launcher.get_driver(**driver_kwargs)
+        shared_utils.add_round_trip_counter(new_driver)
         self._drivers_list.append(new_driver)
         self._drivers_browser_map[new_driver] = browser_name
         if switch_to:
@@ -7663,15 +7717,22 @@ class BaseCase(unittest.TestCase):
             self.__requests_timeout = timeout
         broken_links = []
         if multithreaded:
-            from multiprocessing.dummy import Pool as ThreadPool
-
-            pool = ThreadPool(10)
-            results = pool.map(self.__get_link_if_404_error, links)
-            pool.close()
-            pool.join()
-            for result in results:
-                if result:
-                    broken_links.append(result)
+            from seleniumbase.fixtures import link_checker
+
+            link_timeout = self.__requests_timeout or 5
+            if link_timeout < 1:
+                link_timeout = 1
+            checker = link_checker.get_link_checker()
+            status_codes = checker.get_status_codes(
+                links, timeout=link_timeout
+            )
+            for link in links:
+                # Verify 404s again to be sure. (Without the cache)
+                if (
+                    status_codes[link] == 404
+                    and self.__get_link_if_404_error(link)
+                ):
+                    broken_links.append(link)
         else:
             broken_links = []
             for link in links:
@@ -8353,25 +8414,10 @@ class BaseCase(unittest.TestCase):
             timeout = settings.LARGE_TIMEOUT
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
         downloaded_file_path = self.get_path_of_downloaded_file(file, browser)
-        found = False
-        for x in range(int(timeout)):
-            shared_utils.check_if_time_limit_exceeded()
-            try:
-                self.assertTrue(
-                    os.path.exists(downloaded_file_path),
-                    "File [%s] was not found in the downloads folder [%s]!"
-                    % (file, df),
-                )
-                found = True
-                break
-            except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
-                    break
-                time.sleep(1)
+        found = download_helper.wait_for_download_complete(
+            df, file=file, timeout=timeout
+        )
         if not found and not os.path.exists(downloaded_file_path):
             plural = "s"
             if timeout == 1:
@@ -8396,6 +8442,40 @@ class BaseCase(unittest.TestCase):
                     self.driver, messenger_post, self.message_duration
                 )
 
+    def wait_for_download_complete(self, file, timeout=None, browser=False):
+        """Waits for a download to complete in the [Downloads Folder].
+        (The file must have its final name, and no partial download file.)
+        Returns a dict with the "path", "size" (bytes), "seconds" (waited),
+        and "throughput" (bytes/second) of the download. Throughput is None
+        if the download was already complete when the wait began.
+        @Params
+        file - The filename of the downloaded file.
+        timeout - The time (seconds) to wait for the download to complete.
+        browser - If True, uses the path set by click-initiated downloads.
+                  If False, uses the self.download_file(file_url) path.
+                  Those paths are usually the same. (browser-dependent)."""
+        self.__check_scope()
+        df = self.get_downloads_folder()
+        if browser:
+            df = self.get_browser_downloads_folder()
+        if not timeout:
+            timeout = settings.LARGE_TIMEOUT
+        if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
+            timeout = self.__get_new_timeout(timeout)
+        result = download_helper.wait_for_download_complete(
+            df, file=file, timeout=timeout
+        )
+        if not result:
+            plural = "s"
+            if timeout == 1:
+                plural = ""
+            message = (
+                "Download of {%s} did not complete in the downloads folder "
+                "{%s} after %s second%s!" % (file, df, timeout, plural)
+            )
+            page_actions.timeout_exception("NoSuchFileException", message)
+        return result
+
     def assert_downloaded_file_regex(self, regex, timeout=None, browser=False):
         """Assert the filename regex exists in SeleniumBase's Downloads Folder.
         Uses Python regex via the "re" library for string-matching on the name.
@@ -8410,28 +8490,12 @@ class BaseCase(unittest.TestCase):
             timeout = settings.LARGE_TIMEOUT
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
-        found = False
         df = self.get_downloads_folder()
         if browser:
             df = self.get_browser_downloads_folder()
-        for x in range(int(timeout)):
-            shared_utils.check_if_time_limit_exceeded()
-            try:
-                matches = [fn for fn in os.listdir(df) if re.match(regex, fn)]
-                self.assertTrue(
-                    len(matches) >= 1,
-                    "Regex [%s] was not found in the downloads folder [%s]!"
-                    % (regex, df),
-                )
-                found = True
-                break
-            except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
-                    break
-                time.sleep(1)
+        found = download_helper.wait_for_download_complete(
+            df, regex=regex, timeout=timeout
+        )
         if not found:
             plural = "s"
             if timeout == 1:
@@ -8981,6 +9045,23 @@ class BaseCase(unittest.TestCase):
             chromium = True
         return chromium
 
+    def get_round_trip_count(self):
+        """Returns the number of WebDriver commands sent by the current driver
+        since it was launched (or since calling reset_round_trip_count()).
+        Each command is a round trip to the driver (or to the Grid server).
+        Useful for measuring the cost of actions in tests. Example:
+            self.reset_round_trip_count()
+            self.click("button")
+            self.assert_true(self.get_round_trip_count() <= 8)"""
+        self.__check_scope()
+        return getattr(self.driver, "_round_trips", 0)
+
+    def reset_round_trip_count(self):
+        """Resets the count of self.get_round_trip_count() to 0."""
+        self.__check_scope()
+        if hasattr(self.driver, "_round_trips"):
+            self.driver._round_trips = 0
+
     def __fail_if_not_using_chrome(self, method):
         chrome = False
         if "chrome" in self.driver.capabilities:
@@ -10544,6 +10625,9 @@ class BaseCase(unittest.TestCase):
                         selectors.append(selector)
             elif isinstance(arg, str):
                 selectors.append(arg)
+        selectors = self.__wait_for_elements_in_one_script(
+            selectors, by, "present", timeout
+        )
         for selector in selectors:
             if self.__is_shadow_selector(selector):
                 self.__assert_shadow_element_visible(selector)
@@ -10666,6 +10750,10 @@ class BaseCase(unittest.TestCase):
                         selectors.append(selector)
             elif isinstance(arg, str):
                 selectors.append(arg)
+        if not self.demo_mode:
+            selectors = self.__wait_for_elements_in_one_script(
+                selectors, by, "visible", timeout
+            )
         for selector in selectors:
             if self.__is_shadow_selector(selector):
                 self.__assert_shadow_element_visible(selector)
@@ -11601,13 +11689,19 @@ class BaseCase(unittest.TestCase):
             latest_png_path = baseline_copy_tuple[3]
             latest_copy_name = baseline_copy_tuple[4]
             l_c_alt_name = baseline_copy_tuple[5]
+            heatmap_png_path = baseline_copy_tuple[6]
+            heatmap_copy_name = baseline_copy_tuple[7]
+            h_c_alt_name = baseline_copy_tuple[8]
             baseline_copy_path = os.path.join(test_logpath, baseline_copy_name)
             b_c_alt_path = os.path.join(test_logpath, b_c_alt_name)
             latest_copy_path = os.path.join(test_logpath, latest_copy_name)
             l_c_alt_path = os.path.join(test_logpath, l_c_alt_name)
+            heatmap_copy_path = os.path.join(test_logpath, heatmap_copy_name)
+            h_c_alt_path = os.path.join(test_logpath, h_c_alt_name)
             if len(self.__visual_baseline_copies) == 1:
                 baseline_copy_path = b_c_alt_path
                 latest_copy_path = l_c_alt_path
+                heatmap_copy_path = h_c_alt_path
             if (
                 os.path.exists(baseline_path)
                 and not os.path.exists(baseline_copy_path)
@@ -11620,9 +11714,24 @@ class BaseCase(unittest.TestCase):
             ):
                 self.__create_log_path_as_needed(test_logpath)
                 shutil.copy(latest_png_path, latest_copy_path)
+            if not os.path.exists(heatmap_copy_path):
+                self.__save_heatmap(
+                    baseline_path, latest_png_path, heatmap_png_path
+                )
+            if (
+                os.path.exists(heatmap_png_path)
+                and not os.path.exists(heatmap_copy_path)
+            ):
+                self.__create_log_path_as_needed(test_logpath)
+                shutil.copy(heatmap_png_path, heatmap_copy_path)
         if len(self.__visual_baseline_copies) != 1:
             return  # Skip the rest when deferred visual asserts are used
-        the_html = visual_helper.get_sbs_html()
+        heatmap = None
+        if os.path.exists(
+            os.path.join(test_logpath, "baseline_heatmap.png")
+        ):
+            heatmap = "baseline_heatmap.png"
+        the_html = visual_helper.get_sbs_html(heatmap=heatmap)
         file_path = os.path.join(test_logpath, constants.SideBySide.HTML_FILE)
         out_file = open(file_path, mode="w+", encoding="utf-8")
         out_file.writelines(the_html)
@@ -11635,6 +11744,7 @@ class BaseCase(unittest.TestCase):
         baseline=False,
         check_domain=True,
         full_diff=False,
+        tolerance=None,
     ):
         """***  Automated Visual Testing with SeleniumBase  ***
 
@@ -11697,6 +11807,12 @@ class BaseCase(unittest.TestCase):
         include the first differing element in the list comparison.
         Set "full_diff" to True if you want to see the full output.
 
+        If "tolerance" is set (the max ratio of changed pixels, Eg. 0.01),
+        the latest screenshot is also compared to the baseline screenshot
+        pixel by pixel, which can fail the test (Level-0 only prints it).
+        If Pillow is installed, a heatmap of the changed areas is included
+        in the side_by_side.html file of failures.
+
         Automated Visual Testing with self.check_window() is not very
         effective for websites that have dynamic content that changes
         the layout and structure of web pages. For those, you're much
@@ -11773,12 +11889,13 @@ class BaseCase(unittest.TestCase):
         page_url = self.get_current_url()
         soup = self.get_beautiful_soup()
         html_tags = soup.body.find_all()
+        # Build lists directly (the same as the JSON data of the baseline)
         level_1 = [[tag.name] for tag in html_tags]
-        level_1 = json.loads(json.dumps(level_1))  # Tuples become lists
         level_2 = [[tag.name, sorted(tag.attrs.keys())] for tag in html_tags]
-        level_2 = json.loads(json.dumps(level_2))  # Tuples become lists
-        level_3 = [[tag.name, sorted(tag.attrs.items())] for tag in html_tags]
-        level_3 = json.loads(json.dumps(level_3))  # Tuples become lists
+        level_3 = [
+            [tag.name, [list(item) for item in sorted(tag.attrs.items())]]
+            for tag in html_tags
+        ]
 
         if set_baseline:
             self.save_screenshot(
@@ -11802,17 +11919,28 @@ class BaseCase(unittest.TestCase):
         b_c_alt_name = "baseline.png"
         latest_copy_name = "baseline_diff_%s.png" % name
         l_c_alt_name = "baseline_diff.png"
+        heatmap_png_path = os.path.join(visual_baseline_path, "heatmap.png")
+        heatmap_copy_name = "baseline_heatmap_%s.png" % name
+        h_c_alt_name = "baseline_heatmap.png"
         baseline_copy_tuple = (
             baseline_path, baseline_copy_name, b_c_alt_name,
             latest_png_path, latest_copy_name, l_c_alt_name,
+            heatmap_png_path, heatmap_copy_name, h_c_alt_name,
         )
         self.__visual_baseline_copies.append(baseline_copy_tuple)
 
         is_level_0_failure = False
+        with suppress(Exception):
+            os.remove(heatmap_png_path)  # Remove heatmaps from earlier runs
         if not set_baseline:
             self.save_screenshot(
                 latest_png, visual_baseline_path, selector="body"
             )
+            pixel_diff = None
+            if tolerance is not None:
+                pixel_diff = self.__get_pixel_diff(
+                    baseline_png_path, latest_png_path, heatmap_png_path
+                )
             f = open(page_url_file, "r")
             page_url_data = f.read().strip()
             f.close()
@@ -11844,6 +11972,17 @@ class BaseCase(unittest.TestCase):
                 "\n*\n*** Exception: <Level 3> Visual Diff Failure:\n"
                 "* HTML tag attribute values don't match the baseline!"
             )
+            pixel_failure = None
+            if (
+                tolerance is not None
+                and pixel_diff
+                and pixel_diff["changed_ratio"] > tolerance
+            ):
+                pixel_failure = (
+                    "\n*\n*** Exception: <Pixel> Visual Diff Failure:\n"
+                    "* %.3f%% of pixels changed! (Tolerance: %.3f%%)"
+                    % (pixel_diff["changed_ratio"] * 100, tolerance * 100)
+                )
 
             page_domain = self.get_domain_url(page_url)
             page_data_domain = self.get_domain_url(page_url_data)
@@ -11893,6 +12032,9 @@ class BaseCase(unittest.TestCase):
                             )
                     except Exception as e:
                         print(e)
+                    if pixel_failure:
+                        print(pixel_failure)
+                        is_level_0_failure = True
                     if not full_diff:
                         self.__assert_eq(
                             level_3_data, level_3, level_3_failure
@@ -11904,6 +12046,8 @@ class BaseCase(unittest.TestCase):
                 except Exception as e:
                     print(e)  # Level-0 Dry Run (Only print the differences)
                     is_level_0_failure = True
+            if level != 0 and pixel_failure:
+                self.fail(pixel_failure)
             unittest.TestCase.maxDiff = None  # Reset unittest.TestCase.maxDiff
         # Since the check passed, do not save an extra copy of the baseline
         del self.__visual_baseline_copies[-1]  # .pop() returns the element
@@ -11926,8 +12070,18 @@ class BaseCase(unittest.TestCase):
             ):
                 shutil.copy(baseline_path, baseline_copy_path)
                 shutil.copy(latest_png_path, latest_copy_path)
+            heatmap = None
+            self.__save_heatmap(
+                baseline_path, latest_png_path, heatmap_png_path
+            )
+            if os.path.exists(heatmap_png_path):
+                heatmap = heatmap_copy_name
+                shutil.copy(
+                    heatmap_png_path,
+                    os.path.join(test_logpath, heatmap_copy_name),
+                )
             the_html = visual_helper.get_sbs_html(
-                baseline_copy_name, latest_copy_name
+                baseline_copy_name, latest_copy_name, heatmap
             )
             alpha_n_d_name = "".join([x if x.isalnum() else "_" for x in name])
             side_by_side_name = "side_by_side_%s.html" % alpha_n_d_name
@@ -11936,6 +12090,73 @@ class BaseCase(unittest.TestCase):
             out_file.writelines(the_html)
             out_file.close()
 
+    def __use_new_browser_context(self):
+        """For reused sessions with "--crumbs" on Chromium browsers:
+        Moves to a new window in a new (empty) browser context, and then
+        disposes the context of the previous test (which closes its windows).
+        No cookies, storage, cache, or service workers carry over.
+        Returns False if browser contexts can't be used for the session.
+        (Extensions, such as the proxy-auth one, don't run in new contexts.)"""
+        self.__in_new_browser_context = False
+        driver = self.driver
+        if (
+            not hasattr(driver, "execute_cdp_cmd")
+            or not self.is_chromium()
+            or self.undetectable
+            or self.recorder_ext
+            or getattr(sb_config, "_ext_dirs", None)
+            or getattr(driver, "_is_using_auth", False)
+        ):
+            return False
+        old_context_id = getattr(sb_config, "_rs_browser_context_id", None)
+        context_id = browser_pool.use_new_browser_context(
+            driver, old_context_id
+        )
+        if not context_id:
+            return False
+        sb_config._rs_browser_context_id = context_id
+        self.__in_new_browser_context = True
+        return True
+
+    def __get_pixel_diff(
+        self, baseline_png_path, latest_png_path, heatmap_png_path
+    ):
+        """Compares the latest screenshot to the baseline pixel by pixel.
+        (For check_window() with a tolerance. Installs Pillow if needed.)"""
+        from seleniumbase.core import visual_diff
+
+        if not visual_diff.is_available():
+            pip_find_lock = fasteners.InterProcessLock(
+                constants.PipInstall.FINDLOCK
+            )
+            with pip_find_lock:
+                with suppress(Exception):
+                    shared_utils.make_writable(constants.PipInstall.FINDLOCK)
+                if not visual_diff.is_available():
+                    shared_utils.pip_install("Pillow")
+        return visual_diff.compare_images(
+            baseline_png_path, latest_png_path, diff_path=heatmap_png_path
+        )
+
+    def __save_heatmap(
+        self, baseline_png_path, latest_png_path, heatmap_png_path
+    ):
+        """Saves the heatmap of a failed check_window() if it's missing.
+        (Only if Pillow is installed. Failures are ignored.)"""
+        from seleniumbase.core import visual_diff
+
+        if (
+            os.path.exists(heatmap_png_path)
+            or not os.path.exists(baseline_png_path)
+            or not os.path.exists(latest_png_path)
+            or not visual_diff.is_available()
+        ):
+            return
+        with suppress(Exception):
+            visual_diff.compare_images(
+                baseline_png_path, latest_png_path, diff_path=heatmap_png_path
+            )
+
     ############
 
     def __get_new_timeout(self, timeout):
@@ -12209,6 +12430,7 @@ class BaseCase(unittest.TestCase):
         check_domain=True,
         full_diff=False,
         fs=False,
+        tolerance=None,
     ):
         """A non-terminating assertion for the check_window() method.
         Failures will be saved until the process_deferred_asserts()
@@ -12226,6 +12448,7 @@ class BaseCase(unittest.TestCase):
                 baseline=baseline,
                 check_domain=check_domain,
                 full_diff=full_diff,
+                tolerance=tolerance,
             )
             return True
         except Exception:
@@ -12317,6 +12540,7 @@ class BaseCase(unittest.TestCase):
         check_domain=True,
         full_diff=False,
         fs=False,
+        tolerance=None,
     ):
         """Same as self.deferred_check_window()"""
         return self.deferred_check_window(
@@ -12326,6 +12550,7 @@ class BaseCase(unittest.TestCase):
             check_domain=check_domain,
             full_diff=full_diff,
             fs=fs,
+            tolerance=tolerance,
         )
 
     def process_delayed_asserts(self, print_only=False):
@@ -14769,6 +14994,42 @@ class BaseCase(unittest.TestCase):
                             return True
         return False
 
+    def __wait_for_elements_in_one_script(
+        self, selectors, by, condition, timeout
+    ):
+        """Waits for multiple elements at once, with one script per check.
+        Returns the selectors that still need to be checked one at a time.
+        (Shadow selectors, link text selectors, etc. aren't covered here.)"""
+        if len(selectors) < 2 or self.__is_cdp_swap_needed():
+            return selectors
+        batch = []
+        originals = []
+        others = []
+        for selector in selectors:
+            if self.__is_shadow_selector(selector):
+                others.append(selector)
+                continue
+            new_selector, new_by = self.__recalculate_selector(selector, by)
+            if new_by not in (By.CSS_SELECTOR, By.XPATH) or (
+                new_by == By.XPATH
+                and not page_utils.is_xpath_selector(new_selector)
+            ):
+                others.append(selector)
+                continue
+            batch.append(new_selector)
+            originals.append(selector)
+        if len(batch) < 2:
+            return selectors
+        page_actions.wait_for_elements(
+            self.driver,
+            batch,
+            by=By.CSS_SELECTOR,
+            condition=condition,
+            timeout=timeout,
+            original_selectors=originals,
+        )
+        return others
+
     def __recalculate_selector(self, selector, by, xp_ok=True):
         """Use autodetection to return the correct selector with "by" updated.
         If "xp_ok" is False, don't call convert_css_to_xpath(), which is
@@ -14793,6 +15054,18 @@ class BaseCase(unittest.TestCase):
             with suppress(Exception):
                 self.switch_to_window(current_window)
 
+    def __can_batch_action_probes(self):
+        """Batched probes use JS that only applies to Chromium browsers.
+        (Also skipped for modes that do extra work around each action.)"""
+        return (
+            getattr(settings, "BATCH_ACTION_PROBES", None)
+            and not self.undetectable
+            and not self.demo_mode
+            and not self.slow_mode
+            and not self.__needs_minimum_wait()
+            and self.browser in ["chrome", "edge"]
+        )
+
     def __needs_minimum_wait(self):
         if (
             self.page_load_strategy == "none"
@@ -16135,12 +16408,14 @@ class BaseCase(unittest.TestCase):
                     url = self.get_current_url()
                     if url is not None:
                         has_url = True
-                    if len(self.driver.window_handles) > 1:
+                    if self._crumbs and self.__use_new_browser_context():
+                        pass  # The new browser context has a clean state
+                    elif len(self.driver.window_handles) > 1:
                         while len(self.driver.window_handles) > 1:
                             self.switch_to_window(-1)
                             self.driver.close()
                         self.switch_to_window(0)
-                    if self._crumbs:
+                    if self._crumbs and not self.__in_new_browser_context:
                         if self.binary_location == "chs":
                             self.delete_session_storage()
                         else:
@@ -16239,6 +16514,7 @@ class BaseCase(unittest.TestCase):
             self._default_driver = self.driver
             if self._reuse_session:
                 sb_config.shared_driver = self.driver
+                sb_config._rs_browser_context_id = None
             if len(self._drivers_list) == 0:
                 # The user is overriding self.get_new_driver()
                 # (Otherwise this code shouldn't be reachable)
@@ -16500,7 +16776,8 @@ class BaseCase(unittest.TestCase):
                     )
                 ):
                     if not delay_driver_quit:
-                        driver.quit()
+                        if not browser_pool.checkin(driver):
+                            driver.quit()
                     else:
                         # Save it for later to quit it later.
                         sb_config._sb_pdb_driver = driver
@@ -16669,16 +16946,8 @@ class BaseCase(unittest.TestCase):
                 pass  # Only reachable during multi-threaded runs
 
     def _process_dashboard_entry(self, has_exception, init=False):
-        if self._multithreaded:
-            self.dash_lock = fasteners.InterProcessLock(
-                constants.Dashboard.LOCKFILE
-            )
-            with self.dash_lock:
-                with suppress(Exception):
-                    shared_utils.make_writable(constants.Dashboard.LOCKFILE)
-                self.__process_dashboard(has_exception, init)
-        else:
-            self.__process_dashboard(has_exception, init)
+        # (Multi-process runs use the lock-free journal)
+        self.__process_dashboard(has_exception, init)
 
     def __process_dashboard(self, has_exception, init=False):
         """SeleniumBase Dashboard Processing"""
@@ -16695,23 +16964,12 @@ class BaseCase(unittest.TestCase):
         ):
             return  # Handle case where "pytest --pdb" marks failures as Passed
         if self._multithreaded:
-            existing_res = sb_config._results  # For recording "Skipped" tests
-            abs_path = os.path.abspath(".")
-            dash_json_loc = constants.Dashboard.DASH_JSON
-            dash_jsonpath = os.path.join(abs_path, dash_json_loc)
-            if not init and os.path.exists(dash_jsonpath):
-                with open(dash_jsonpath, "r") as f:
-                    dash_json = f.read().strip()
-                dash_data, d_id, dash_rt, tlp, d_stats = json.loads(dash_json)
-                num_passed, num_failed, num_skipped, num_untested = d_stats
-                sb_config._results = dash_data
-                sb_config._display_id = d_id
-                sb_config._duration = dash_rt  # Dashboard Run Time
-                sb_config._d_t_log_path = tlp  # Test Log Path
-                sb_config.item_count_passed = num_passed
-                sb_config.item_count_failed = num_failed
-                sb_config.item_count_skipped = num_skipped
-                sb_config.item_count_untested = num_untested
+            # For recording "Skipped" tests
+            existing_res = dict(sb_config._results)
+            # Merge the results that other processes added to the journal
+            journal = self.__get_dash_journal()
+            journal.merge_into(sb_config)
+            dash_data = dash_journal.snapshot(sb_config)
         if len(sb_config._extra_dash_entries) > 0:
             # First take care of existing entries from non-SeleniumBase tests
             for test_id in sb_config._extra_dash_entries:
@@ -16833,6 +17091,56 @@ class BaseCase(unittest.TestCase):
                 sb_config.item_count_untested -= 1
         else:
             pass  # Only initialize the Dashboard on the first processing
+        if dud2 in sb_config._results.keys():
+            sb_config._results.pop(dud2)
+        if not self._multithreaded:
+            self.__create_dashboard_html(log_dir, ft_id)
+            return
+        changes = dash_journal.get_changes(dash_data, sb_config)
+        if changes:
+            journal.append(changes)
+        self.__set_dashboard_counts()
+        abs_path = os.path.abspath(".")
+        file_path = os.path.join(abs_path, "dashboard.html")
+        if (
+            not init
+            and sb_config.item_count_untested > 0
+            and not getattr(sb_config, "_is_last_item", False)
+            and not dash_journal.is_rebuild_due(file_path)
+        ):
+            # The HTML is rebuilt at a bounded rate, except after the last
+            # test of each process. (So the final results always get in.)
+            return
+        self.__create_dashboard_html(log_dir, ft_id)
+        while journal.has_new_entries():
+            # If other processes finished the run in the meantime,
+            # then make sure that the final results are the last ones.
+            journal.merge_into(sb_config)
+            self.__set_dashboard_counts()
+            if sb_config.item_count_untested > 0:
+                break
+            self.__create_dashboard_html(log_dir, ft_id)
+
+    def __get_dash_journal(self):
+        if not getattr(sb_config, "_dash_journal", None):
+            abs_path = os.path.abspath(".")
+            journal_loc = constants.Dashboard.DASH_JOURNAL
+            journal_path = os.path.join(abs_path, journal_loc)
+            with suppress(Exception):
+                os.makedirs(os.path.dirname(journal_path), exist_ok=True)
+            sb_config._dash_journal = dash_journal.DashJournal(journal_path)
+        return sb_config._dash_journal
+
+    def __set_dashboard_counts(self):
+        """Multi-process runs count the merged results of all processes."""
+        (
+            sb_config.item_count_passed,
+            sb_config.item_count_failed,
+            sb_config.item_count_skipped,
+            sb_config.item_count_untested,
+        ) = dash_journal.get_counts(sb_config._results)
+
+    def __create_dashboard_html(self, log_dir, ft_id):
         num_passed = sb_config.item_count_passed
         num_failed = sb_config.item_count_failed
         num_skipped = sb_config.item_count_skipped
@@ -16906,8 +17214,6 @@ class BaseCase(unittest.TestCase):
         the_passed_hl = []  # Passed and has logs
         the_passed_nl = []  # Passed and no logs
         the_untested = []
-        if dud2 in sb_config._results.keys():
-            sb_config._results.pop(dud2)
         for key in sb_config._results.keys():
             t_res = sb_config._results[key]
             t_dur = sb_config._duration[key]
@@ -17038,22 +17344,14 @@ class BaseCase(unittest.TestCase):
         )
         abs_path = os.path.abspath(".")
         file_path = os.path.join(abs_path, "dashboard.html")
-        out_file = open(file_path, mode="w+", encoding="utf-8")
-        out_file.writelines(the_html)
-        out_file.close()
-        sb_config._dash_html = the_html
         if self._multithreaded:
-            d_stats = (num_passed, num_failed, num_skipped, num_untested)
-            _results = sb_config._results
-            _display_id = sb_config._display_id
-            _rt = sb_config._duration  # Run Time (RT)
-            _tlp = sb_config._d_t_log_path  # Test Log Path (TLP)
-            dash_json = json.dumps((_results, _display_id, _rt, _tlp, d_stats))
-            dash_json_loc = constants.Dashboard.DASH_JSON
-            dash_jsonpath = os.path.join(abs_path, dash_json_loc)
-            dash_json_file = open(dash_jsonpath, mode="w+", encoding="utf-8")
-            dash_json_file.writelines(dash_json)
-            dash_json_file.close()
+            # Other processes may be reading (or writing) the file
+            dash_journal.write_atomically(file_path, the_html)
+        else:
+            out_file = open(file_path, mode="w+", encoding="utf-8")
+            out_file.writelines(the_html)
+            out_file.close()
+        sb_config._dash_html = the_html
 
     def __activate_behave_post_mortem_debug_mode(self):
         """Activate Post Mortem Debug Mode for failing tests that use Behave"""
@@ -17465,15 +17763,8 @@ class BaseCase(unittest.TestCase):
                                 self.__last_page_source,
                             )
                 if self.dashboard:
-                    if self._multithreaded:
-                        with self.dash_lock:
-                            with suppress(Exception):
-                                shared_utils.make_writable(
-                                    constants.Dashboard.LOCKFILE
-                                )
-                            self.__process_dashboard(has_exception)
-                    else:
-                        self.__process_dashboard(has_exception)
+                    # (Multi-process runs use the lock-free journal)
+                    self.__process_dashboard(has_exception)
                 if self._final_debug:
                     self.__activate_debug_mode_in_teardown()
                 # (Pytest) Finally close all open browser windows
@@ -17505,6 +17796,7 @@ class BaseCase(unittest.TestCase):
                 s3_bucket = S3LoggingBucket()
                 guid = str(uuid.uuid4().hex)
                 path = os.path.join(self.log_path, test_id)
+                artifact_writer.flush()  # (The log files are needed now)
                 uploaded_files = []
                 for logfile in os.listdir(path):
                     logfile_name = "%s/%s/%s" % (
@@ -17512,7 +17804,8 @@ class BaseCase(unittest.TestCase):
                         test_id,
                         logfile.split(path)[-1],
                     )
-                    s3_bucket.upload_file(
+                    # (Files upload in the background)
+                    s3_bucket.upload_file_async(
                         logfile_name, "%s" % os.path.join(path, logfile)
                     )
                     uploaded_files.append(logfile_name)
@@ -112,7 +112,7 @@ class Dashboard:
     # LIVE_JS = "https://seleniumbase.io/cdn/js/live.js#html"
     LIVE_JS = "assets/live.js#html"  # Generated before tests
     LOCKFILE = Files.DOWNLOADS_FOLDER + "/dashboard.lock"
-    DASH_JSON = Files.DOWNLOADS_FOLDER + "/dashboard.json"
+    DASH_JOURNAL = Files.DOWNLOADS_FOLDER + "/dashboard.jsonl"
     DASH_PIE = Files.DOWNLOADS_FOLDER + "/dash_pie.json"
 
     def get_dash_pie_1():
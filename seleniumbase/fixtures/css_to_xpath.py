@@ -1,5 +1,6 @@
 """Convert CSS selectors into XPath selectors"""
 from cssselect.xpath import GenericTranslator
+from seleniumbase.fixtures import selector_cache
 
 
 class ConvertibleToCssTranslator(GenericTranslator):
@@ -47,11 +48,15 @@ class ConvertibleToCssTranslator(GenericTranslator):
         return left.join("//", right)
 
 
+_translator = ConvertibleToCssTranslator()
+
+
+@selector_cache.cached
 def convert_css_to_xpath(css):
     """Convert CSS Selectors to XPath Selectors.
     Example:
         convert_css_to_xpath('button:contains("Next")')
         Output => "//button[contains(., 'Next')]"
     """
-    xpath = ConvertibleToCssTranslator().css_to_xpath(css)
+    xpath = _translator.css_to_xpath(css)
     return xpath
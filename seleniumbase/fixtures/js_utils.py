@@ -10,6 +10,7 @@ from seleniumbase import config as sb_config
 from seleniumbase.config import settings
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import css_to_xpath
+from seleniumbase.fixtures import poll_utils
 from seleniumbase.fixtures import shared_utils
 from seleniumbase.fixtures import xpath_to_css
 
@@ -33,11 +34,10 @@ def wait_for_ready_state_complete(driver, timeout=settings.LARGE_TIMEOUT):
         return
     if getattr(settings, "SKIP_JS_WAITS", None):
         return
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        if sb_config.time_limit and not sb_config.recorder_mode:
-            shared_utils.check_if_time_limit_exceeded()
+    poller = poll_utils.PollScheduler(
+        timeout, name="wait_for_ready_state_complete"
+    )
+    for x in poller:
         try:
             ready_state = execute_script(driver, "return document.readyState;")
         except WebDriverException:
@@ -47,11 +47,6 @@ def wait_for_ready_state_complete(driver, timeout=settings.LARGE_TIMEOUT):
         if ready_state == "complete":
             time.sleep(0.002)
             return True
-        else:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
     return False  # readyState stayed "interactive" (Not "complete")
 
 
@@ -366,25 +361,199 @@ def wait_for_css_query_selector(
     selector = remove_extra_slashes(selector)
     selector = optimize_selector(selector)
     script = """return document.querySelector('%s');""" % selector
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
+    poller = poll_utils.PollScheduler(
+        timeout, name="wait_for_css_query_selector"
+    )
+    for x in poller:
         try:
             element = execute_script(driver, script)
             if element:
                 return element
         except Exception:
             element = None
-        if not element:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
     raise NoSuchElementException(
         "Element {%s} was not present after %s seconds!" % (selector, timeout)
     )
 
 
+# JS functions for finding [selector, by] targets, and checking visibility.
+# (Shared by the observer waits and by the multi-element reports.)
+ELEMENT_CHECK_FUNCTIONS = """
+        function find(t) {
+            if (t[1] === "xpath") {
+                return document.evaluate(
+                    t[0], document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                ).singleNodeValue;
+            }
+            return document.querySelector(t[0]);
+        }
+        function isVisible(el) {
+            if (!el || !el.isConnected) { return false; }
+            if (typeof el.checkVisibility === "function") {
+                if (!el.checkVisibility(
+                    {opacityProperty: true, visibilityProperty: true}
+                )) { return false; }
+            } else {
+                var style = window.getComputedStyle(el);
+                if (style.display === "none" ||
+                    style.visibility === "hidden" ||
+                    style.opacity === "0") { return false; }
+            }
+            return el.getClientRects().length > 0;
+        }
+"""
+
+
+def get_observer_wait_script():
+    """Returns an async script that waits for a condition to be met on the
+    page. Instead of polling from Python, a MutationObserver (throttled to
+    one check per animation frame) re-checks the condition on DOM changes.
+    Resolves with "initial" if the condition was already met, "changed" if
+    it became met while waiting, or "" if the timeout was reached first."""
+    return (
+        """var targets = arguments[0], condition = arguments[1],
+        opts = arguments[2], timeout = arguments[3],
+        done = arguments[arguments.length - 1];
+        """
+        + ELEMENT_CHECK_FUNCTIONS
+        + """
+        function getText(el) {
+            var tag = el.tagName.toLowerCase();
+            if (tag === "input" || tag === "textarea") {
+                return el.value || "";
+            }
+            return el.innerText || "";
+        }
+        function hasText(el) {
+            if (!isVisible(el)) { return false; }
+            var text = getText(el);
+            if (condition.indexOf("exact_text") !== -1) {
+                return text.trim() === opts.text.trim();
+            }
+            return text.indexOf(opts.text) !== -1;
+        }
+        function hasAttribute(el) {
+            if (!el || !el.hasAttribute(opts.attribute)) { return false; }
+            if (opts.value === null) { return true; }
+            return el.getAttribute(opts.attribute) === opts.value;
+        }
+        function check1(el) {
+            switch (condition) {
+                case "present": return !!el;
+                case "absent": return !el;
+                case "visible": return isVisible(el);
+                case "not_visible": return !isVisible(el);
+                case "clickable": return isVisible(el) && !el.disabled;
+                case "text": return !!el && hasText(el);
+                case "exact_text": return !!el && hasText(el);
+                case "text_not_visible": return !el || !hasText(el);
+                case "exact_text_not_visible": return !el || !hasText(el);
+                case "non_empty_text":
+                    return isVisible(el) && getText(el).trim().length > 0;
+                case "attribute": return hasAttribute(el);
+                case "attribute_not_present": return !hasAttribute(el);
+            }
+            return true;
+        }
+        function check() {
+            try {
+                for (var i = 0; i < targets.length; i++) {
+                    if (check1(find(targets[i]))) { return true; }
+                }
+            } catch (e) {}
+            return false;
+        }
+        if (check()) { done("initial"); return; }
+        var finished = false, scheduled = false, timer = null;
+        var observer = new MutationObserver(schedule);
+        function finish(result) {
+            if (finished) { return; }
+            finished = true;
+            observer.disconnect();
+            clearTimeout(timer);
+            clearInterval(interval);
+            done(result);
+        }
+        function recheck() {
+            scheduled = false;
+            if (!finished && check()) { finish("changed"); }
+        }
+        function schedule() {
+            if (scheduled) { return; }
+            scheduled = true;
+            if (document.hidden) { setTimeout(recheck, 16); }
+            else { requestAnimationFrame(recheck); }
+        }
+        observer.observe(document.documentElement || document, {
+            childList: true, subtree: true,
+            attributes: true, characterData: true
+        });
+        /* Catch changes that do not mutate the DOM (eg. CSS transitions) */
+        var interval = setInterval(schedule, 250);
+        timer = setTimeout(function() {
+            finish(check() ? "changed" : "");
+        }, timeout);"""
+    )
+
+
+def wait_for_condition_with_observer(
+    driver, selector, by, condition, timeout, text=None,
+    attribute=None, value=None,
+):
+    """Waits up to "timeout" seconds in the browser for the given condition
+    to be met for the element of the selector, using a DOM MutationObserver.
+    "selector" can also be a list of selectors (for "any of" conditions),
+    in which case "by" can be None to detect CSS / XPath per selector.
+    Returns "initial", "changed", or "" (see get_observer_wait_script()).
+    Returns None if the observer can't be used for this selector or page,
+    in which case the caller should fall back to regular polling."""
+    if isinstance(selector, (list, tuple)):
+        selectors = selector
+    else:
+        selectors = [selector]
+    targets = []
+    for selector in selectors:
+        if by == By.XPATH or (
+            not by
+            and (selector.startswith("/") or selector.startswith("("))
+        ):
+            targets.append([selector, By.XPATH])
+        elif not by or by == By.TAG_NAME:
+            targets.append([selector, By.CSS_SELECTOR])
+        elif by in [By.CSS_SELECTOR, By.ID, By.CLASS_NAME, By.NAME]:
+            css_selector = convert_to_css_selector(selector, by)
+            targets.append([css_selector, By.CSS_SELECTOR])
+        else:
+            return None  # Link text is handled by regular polling
+    opts = {"text": text, "attribute": attribute, "value": value}
+    timeout_ms = max(int(timeout * 1000.0), 0)
+    try:
+        return driver.execute_async_script(
+            get_observer_wait_script(), targets, condition, opts, timeout_ms
+        )
+    except Exception:
+        return None
+
+
+def get_elements_report(driver, targets):
+    """Checks all the [selector, by] targets (CSS or XPath) in one script.
+    Returns a list with a [present, visible] pair for each target.
+    (An invalid selector is reported as not present.)"""
+    script = (
+        """var targets = arguments[0], report = [];"""
+        + ELEMENT_CHECK_FUNCTIONS
+        + """
+        for (var i = 0; i < targets.length; i++) {
+            var el = null;
+            try { el = find(targets[i]); } catch (e) {}
+            report.push([!!el, isVisible(el)]);
+        }
+        return report;"""
+    )
+    return driver.execute_script(script, targets)
+
+
 def is_valid_by(by):
     return by in [
         "css selector", "class name", "id", "name",
@@ -1291,6 +1460,69 @@ def get_scroll_distance_to_element(driver, element):
         return 0
 
 
+def get_click_snapshot(driver, element, scroll=True):
+    """Batches the probes done before a click into a single script call.
+    (Optionally scrolls to the element first, like scroll_to_element().)
+    Returns a dict with: "visible", "tag", "href", "onclick", "target",
+    "rect" (x, y, width, height), and "url" (the current page URL)."""
+    script = """
+        var el = arguments[0], scroll = arguments[1], yOffset = arguments[2];
+        if (scroll) {
+            if (typeof el.scrollIntoViewIfNeeded === "function") {
+                el.scrollIntoViewIfNeeded(true);
+            } else {
+                // The same scroll as __old_scroll_to_element()
+                var box = el.getBoundingClientRect();
+                var left = box.left + window.scrollX;
+                var y = Math.max(box.top + window.scrollY - yOffset, 0);
+                var x = Math.max(left - 400, 0);
+                if (left + box.width <= window.innerWidth) { x = 0; }
+                window.scrollTo(x, y);
+            }
+        }
+        var visible = el.isConnected && el.getClientRects().length > 0;
+        if (visible && typeof el.checkVisibility === "function") {
+            visible = el.checkVisibility(
+                {opacityProperty: true, visibilityProperty: true}
+            );
+        } else if (visible) {
+            var style = window.getComputedStyle(el);
+            visible = (style.display !== "none" &&
+                style.visibility !== "hidden" && style.opacity !== "0");
+        }
+        var rect = el.getBoundingClientRect();
+        var tag = el.tagName.toLowerCase();
+        var href = el.getAttribute("href");
+        if (href !== null && typeof el.href === "string") { href = el.href; }
+        return {
+            visible: visible,
+            tag: tag,
+            href: href,
+            onclick: el.getAttribute("onclick"),
+            target: el.getAttribute("target"),
+            rect: {
+                x: rect.x, y: rect.y,
+                width: rect.width, height: rect.height
+            },
+            url: window.location.href
+        };"""
+    return driver.execute_script(
+        script, element, scroll, constants.Scroll.Y_OFFSET
+    )
+
+
+def get_post_action_snapshot(driver):
+    """Batches the probes done after an action into a single script call.
+    Returns a dict with: "url", and "angular" (whether AngularJS
+    is on the page, which means more waiting may be needed)."""
+    script = """
+        return {
+            url: window.location.href,
+            angular: !!window.angular
+        };"""
+    return driver.execute_script(script)
+
+
 def scroll_to_element(driver, element):
     if driver.capabilities["browserName"].lower() == "firefox":
         return __old_scroll_to_element(driver, element)
@@ -0,0 +1,171 @@
+"""A pooled link checker for assert_no_404_errors() and related methods.
+
+Instead of calling requests.head() with a new connection for every link,
+links are checked by a shared requests.Session, which keeps connections
+alive per host. Links are checked in parallel by a shared thread pool,
+with a limit on the number of concurrent requests per host, so that one
+server isn't flooded. If a server doesn't support HEAD requests, the link
+is checked again with a GET request (without downloading the body).
+
+Status codes are cached for the whole session, so that links shared by
+multiple pages (Eg. CSS, JS, and images) are only checked once.
+(Connection errors and timeouts are not cached. Those return a 404.)
+Single links (self.get_link_status_code()) don't use this checker:
+Those are checked again on every call, with a HEAD request only.
+
+Usage:
+    checker = link_checker.get_link_checker()
+    status_codes = checker.get_status_codes(links)  # {link: status_code}"""
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+MAX_WORKERS = 32  # The max number of links checked at the same time
+MAX_PER_HOST = 8  # The max number of concurrent requests per host
+MAX_CACHED_LINKS = 20000  # The max number of status codes kept in the cache
+HEAD_FALLBACK_CODES = (400, 403, 405, 501)  # Retry HEAD with GET for these
+
+shared_checker = None
+shared_checker_lock = threading.Lock()
+
+
+class LinkChecker:
+    def __init__(self, max_workers=MAX_WORKERS, max_per_host=MAX_PER_HOST):
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_per_host,
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.cache = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__host_limits = {}
+        self.__executor = None
+
+    def __get_host_limit(self, link):
+        host = urlsplit(link).netloc
+        with self.__lock:
+            if host not in self.__host_limits:
+                self.__host_limits[host] = threading.BoundedSemaphore(
+                    self.max_per_host
+                )
+            return self.__host_limits[host]
+
+    def __get_executor(self):
+        with self.__lock:
+            if not self.__executor:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="sb-link-checker",
+                )
+            return self.__executor
+
+    def __get_cached(self, key):
+        with self.__lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return self.cache[key]
+            self.misses += 1
+            return None
+
+    def __set_cached(self, key, status_code):
+        with self.__lock:
+            self.cache[key] = status_code
+            self.cache.move_to_end(key)
+            while len(self.cache) > MAX_CACHED_LINKS:
+                self.cache.popitem(last=False)
+
+    def __request(self, method, link, allow_redirects, timeout, verify):
+        response = self.session.request(
+            method,
+            link,
+            allow_redirects=allow_redirects,
+            timeout=timeout,
+            verify=verify,
+            stream=True,  # Don't download the body of GET requests
+        )
+        response.close()  # Release the connection back to the pool
+        return response.status_code
+
+    def get_status_code(
+        self, link, allow_redirects=False, timeout=5, verify=False
+    ):
+        """Get the status code of a link. (Cached after the first check.)
+        If the timeout is exceeded, will return a 404.
+        If "verify" is False, will ignore certificate errors."""
+        key = (link, allow_redirects, verify)
+        status_code = self.__get_cached(key)
+        if status_code is not None:
+            return status_code
+        try:
+            with self.__get_host_limit(link):
+                status_code = self.__request(
+                    "HEAD", link, allow_redirects, timeout, verify
+                )
+                if status_code in HEAD_FALLBACK_CODES:
+                    status_code = self.__request(
+                        "GET", link, allow_redirects, timeout, verify
+                    )
+        except Exception:
+            return 404
+        self.__set_cached(key, status_code)
+        return status_code
+
+    def get_status_codes(
+        self, links, allow_redirects=False, timeout=5, verify=False
+    ):
+        """Checks links in parallel. Returns a dict: {link: status_code}"""
+        links = list(dict.fromkeys(links))  # Remove duplicates (keep order)
+        if not links:
+            return {}
+        executor = self.__get_executor()
+        futures = [
+            executor.submit(
+                self.get_status_code, link, allow_redirects, timeout, verify
+            )
+            for link in links
+        ]
+        return {
+            link: future.result() for link, future in zip(links, futures)
+        }
+
+    def get_stats(self):
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.cache),
+            }
+
+    def clear_cache(self):
+        with self.__lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        with self.__lock:
+            executor = self.__executor
+            self.__executor = None
+        if executor:
+            executor.shutdown(wait=True)
+        self.session.close()
+
+
+def get_link_checker():
+    """Returns the LinkChecker that is shared by the whole process."""
+    global shared_checker
+    with shared_checker_lock:
+        if not shared_checker:
+            shared_checker = LinkChecker()
+        return shared_checker
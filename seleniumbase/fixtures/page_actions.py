@@ -34,7 +34,9 @@ from seleniumbase.common.exceptions import LinkTextNotFoundException
 from seleniumbase.common.exceptions import TextNotVisibleException
 from seleniumbase.config import settings
 from seleniumbase.fixtures import constants
+from seleniumbase.fixtures import js_utils
 from seleniumbase.fixtures import page_utils
+from seleniumbase.fixtures import poll_utils
 from seleniumbase.fixtures import shared_utils
 
 
@@ -270,6 +272,40 @@ def timeout_exception(exception, message):
     raise exc(msg)
 
 
+def _get_poller(
+    driver,
+    selector,
+    by,
+    condition,
+    timeout,
+    name=None,
+    ignore_test_time_limit=False,
+    **kwargs,
+):
+    """Returns the PollScheduler for the checks of a wait_for_*() method.
+    If settings.USE_OBSERVER_WAITS is True, waits in the browser between
+    checks until the DOM changes to meet the condition (or until timeout),
+    instead of sleeping. If the observer can't be used, it sleeps instead.
+    (The condition is always verified again by the WebDriver check.)"""
+    def observer_wait(remaining):
+        # Return periodically to allow checking the test time limit
+        result = js_utils.wait_for_condition_with_observer(
+            driver, selector, by, condition, min(remaining, 5), **kwargs
+        )
+        # If "initial", the observer and WebDriver disagree: Poll instead.
+        return result is not None and result != "initial"
+
+    waiter = None
+    if getattr(settings, "USE_OBSERVER_WAITS", None):
+        waiter = observer_wait
+    return poll_utils.PollScheduler(
+        timeout,
+        name=name,
+        ignore_test_time_limit=ignore_test_time_limit,
+        waiter=waiter,
+    )
+
+
 def hover_and_click(
     driver,
     hover_selector,
@@ -292,11 +328,12 @@ def hover_and_click(
     js_click - the option to use js_click() instead of click() on the last part
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    poller = poll_utils.PollScheduler(
+        timeout, name="hover_and_click", ignore_test_time_limit=True
+    )
     element = driver.find_element(by=hover_by, value=hover_selector)
     hover = ActionChains(driver).move_to_element(element)
-    for x in range(int(timeout * 10)):
+    for x in poller:
         try:
             hover.perform()
             element = driver.find_element(by=click_by, value=click_selector)
@@ -306,10 +343,7 @@ def hover_and_click(
                 element.click()
             return element
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -332,20 +366,18 @@ def hover_element_and_click(
     Similar to hover_and_click(), but assumes top element is already found.
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    poller = poll_utils.PollScheduler(
+        timeout, name="hover_element_and_click", ignore_test_time_limit=True
+    )
     hover = ActionChains(driver).move_to_element(element)
-    for x in range(int(timeout * 10)):
+    for x in poller:
         try:
             hover.perform()
             element = driver.find_element(by=click_by, value=click_selector)
             element.click()
             return element
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -365,10 +397,13 @@ def hover_element_and_double_click(
     timeout=settings.SMALL_TIMEOUT,
 ):
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    poller = poll_utils.PollScheduler(
+        timeout,
+        name="hover_element_and_double_click",
+        ignore_test_time_limit=True,
+    )
     hover = ActionChains(driver).move_to_element(element)
-    for x in range(int(timeout * 10)):
+    for x in poller:
         try:
             hover.perform()
             element_2 = driver.find_element(by=click_by, value=click_selector)
@@ -378,10 +413,7 @@ def hover_element_and_double_click(
             actions.perform()
             return element_2
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -418,19 +450,17 @@ def wait_for_element_present(
     """
     _reconnect_if_disconnected(driver)
     element = None
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        if not ignore_test_time_limit:
-            shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "present", timeout,
+        name="wait_for_element_present",
+        ignore_test_time_limit=ignore_test_time_limit
+    )
+    for x in poller:
         try:
             element = driver.find_element(by=by, value=selector)
             return element
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -479,11 +509,12 @@ def wait_for_element_visible(
     _reconnect_if_disconnected(driver)
     element = None
     is_present = False
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        if not ignore_test_time_limit:
-            shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "visible", timeout,
+        name="wait_for_element_visible",
+        ignore_test_time_limit=ignore_test_time_limit
+    )
+    for x in poller:
         try:
             element = driver.find_element(by=by, value=selector)
             is_present = True
@@ -493,10 +524,7 @@ def wait_for_element_visible(
                 element = None
                 raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -563,10 +591,11 @@ def wait_for_text_visible(
     is_present = False
     full_text = None
     text = str(text)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "text", timeout, name="wait_for_text_visible",
+        text=text
+    )
+    for x in poller:
         full_text = None
         try:
             element = driver.find_element(by=by, value=selector)
@@ -609,10 +638,7 @@ def wait_for_text_visible(
                     element = None
                     raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -674,10 +700,11 @@ def wait_for_exact_text_visible(
     is_present = False
     actual_text = None
     text = str(text)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "exact_text", timeout,
+        name="wait_for_exact_text_visible", text=text
+    )
+    for x in poller:
         actual_text = None
         try:
             element = driver.find_element(by=by, value=selector)
@@ -719,10 +746,7 @@ def wait_for_exact_text_visible(
                     element = None
                     raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -784,11 +808,12 @@ def wait_for_any_of_elements_visible(
     _reconnect_if_disconnected(driver)
     element = None
     any_present = False
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        if not ignore_test_time_limit:
-            shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selectors, None, "visible", timeout,
+        name="wait_for_any_of_elements_visible",
+        ignore_test_time_limit=ignore_test_time_limit
+    )
+    for x in poller:
         try:
             for selector in selectors:
                 by = "css selector"
@@ -804,10 +829,7 @@ def wait_for_any_of_elements_visible(
                     pass
             raise Exception("Nothing found yet!")
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -863,11 +885,12 @@ def wait_for_any_of_elements_present(
         raise Exception("`selectors` cannot be an empty list!")
     _reconnect_if_disconnected(driver)
     element = None
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        if not ignore_test_time_limit:
-            shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selectors, None, "present", timeout,
+        name="wait_for_any_of_elements_present",
+        ignore_test_time_limit=ignore_test_time_limit
+    )
+    for x in poller:
         try:
             for selector in selectors:
                 by = "css selector"
@@ -880,10 +903,7 @@ def wait_for_any_of_elements_present(
                     pass
             raise Exception("Nothing found yet!")
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -903,6 +923,184 @@ def wait_for_any_of_elements_present(
         return element
 
 
+def get_elements_report(driver, selectors, by="css selector"):
+    """
+    Checks all the selectors with a single script (one round trip).
+    Only CSS Selectors and XPath selectors are supported.
+    @Params
+    driver - the webdriver object (required)
+    selectors - the list of selectors for identifying page elements (required)
+    by - the type of selector being used (Default: "css selector")
+    @Returns
+    A dict: {selector: {"present": bool, "visible": bool}}
+    """
+    targets = []
+    for selector in selectors:
+        selector_by = by
+        if page_utils.is_xpath_selector(selector):
+            selector_by = "xpath"
+        targets.append([selector, selector_by])
+    report = {}
+    results = js_utils.get_elements_report(driver, targets)
+    for selector, result in zip(selectors, results):
+        report[selector] = {"present": result[0], "visible": result[1]}
+    return report
+
+
+def _get_not_displayed(driver, selectors, by="css selector"):
+    """Returns the selectors that WebDriver doesn't see as displayed.
+    (Includes the selectors that WebDriver can't find.)"""
+    not_displayed = []
+    for selector in selectors:
+        selector_by = by
+        if page_utils.is_xpath_selector(selector):
+            selector_by = "xpath"
+        try:
+            element = driver.find_element(by=selector_by, value=selector)
+            if element.is_displayed():
+                continue
+        except Exception:
+            pass
+        not_displayed.append(selector)
+    return not_displayed
+
+
+def wait_for_elements(
+    driver,
+    selectors,
+    by="css selector",
+    condition="visible",
+    timeout=settings.LARGE_TIMEOUT,
+    original_selectors=[],
+    ignore_test_time_limit=False,
+):
+    """
+    Waits for all the elements in the selector list to be visible (or present).
+    Each check covers all remaining selectors with a single script, instead
+    of making WebDriver calls for each selector. WebDriver has the final say:
+    Once the script sees all elements as visible, those are checked again
+    with is_displayed(). (The script can see elements as visible when
+    WebDriver doesn't. Eg. zero-size boxes, or boxes clipped by overflow.)
+    Elements that still seem to be missing at the timeout are checked again
+    with WebDriver before failing.
+    Raises NoSuchElementException if any element does not exist in the HTML
+    within the specified timeout.
+    Raises ElementNotVisibleException if an element exists in the HTML,
+    but is not visible (eg. opacity is "0") within the specified timeout.
+    @Params
+    driver - the webdriver object (required)
+    selectors - the list of selectors for identifying page elements (required)
+    by - the type of selector being used (Default: "css selector")
+    condition - the condition to wait for: "visible" or "present"
+    timeout - the time to wait for elements in seconds
+    original_selectors - handle pre-converted ":contains(TEXT)" selectors
+    ignore_test_time_limit - ignore test time limit (NOT related to timeout)
+    @Returns
+    A dict: {selector: {"present": bool, "visible": bool}}
+    """
+    if not isinstance(selectors, (list, tuple)):
+        raise Exception("`selectors` must be a list or tuple!")
+    if not selectors:
+        raise Exception("`selectors` cannot be an empty list!")
+    if condition not in ("visible", "present"):
+        raise Exception('`condition` must be "visible" or "present"!')
+    _reconnect_if_disconnected(driver)
+    if by not in ("css selector", "xpath"):
+        # Not supported by the script: Check each selector with WebDriver
+        for selector in selectors:
+            if condition == "visible":
+                wait_for_element_visible(
+                    driver, selector, by, timeout=timeout,
+                    ignore_test_time_limit=ignore_test_time_limit,
+                )
+            else:
+                wait_for_element_present(
+                    driver, selector, by, timeout=timeout,
+                    ignore_test_time_limit=ignore_test_time_limit,
+                )
+        return {
+            selector: {"present": True, "visible": condition == "visible"}
+            for selector in selectors
+        }
+    remaining = list(selectors)
+    report = {}
+    confirmed = set()  # The selectors that WebDriver sees as displayed
+    poller = poll_utils.PollScheduler(
+        timeout,
+        name="wait_for_elements",
+        ignore_test_time_limit=ignore_test_time_limit,
+    )
+    for x in poller:
+        try:
+            new_report = get_elements_report(driver, remaining, by=by)
+        except Exception:
+            continue
+        report.update(new_report)
+        remaining = [
+            selector for selector in remaining
+            if not new_report[selector][condition]
+        ]
+        if not remaining and condition == "visible":
+            unconfirmed = [
+                selector for selector in selectors
+                if selector not in confirmed
+            ]
+            remaining = _get_not_displayed(driver, unconfirmed, by=by)
+            for selector in unconfirmed:
+                if selector in remaining:
+                    report[selector]["visible"] = False
+                else:
+                    confirmed.add(selector)
+        if not remaining:
+            return report
+    # The script and WebDriver can disagree: WebDriver has the final say.
+    missing = []
+    not_present = []
+    for selector in remaining:
+        selector_by = by
+        if page_utils.is_xpath_selector(selector):
+            selector_by = "xpath"
+        try:
+            element = driver.find_element(by=selector_by, value=selector)
+        except Exception:
+            not_present.append(selector)
+            missing.append(selector)
+            continue
+        visible = element.is_displayed()
+        if condition == "present" or visible:
+            report[selector] = {"present": True, "visible": visible}
+            continue
+        missing.append(selector)
+    if not missing:
+        return report
+    plural = "s"
+    if timeout == 1:
+        plural = ""
+    if original_selectors and len(original_selectors) == len(selectors):
+        originals = dict(zip(selectors, original_selectors))
+        missing = [originals[selector] for selector in missing]
+        not_present = [originals[selector] for selector in not_present]
+    if not_present:
+        # At least one of the elements does not exist in the HTML
+        message = "Element {%s} was not present after %s second%s!" % (
+            not_present[0],
+            timeout,
+            plural,
+        )
+        if len(missing) > 1:
+            message += " (Missing elements: %s)" % str(missing)
+        timeout_exception(NoSuchElementException, message)
+    # The elements exist in the HTML, but are not visible
+    message = "Element {%s} was not visible after %s second%s!" % (
+        missing[0],
+        timeout,
+        plural,
+    )
+    if len(missing) > 1:
+        message += " (Missing elements: %s)" % str(missing)
+    timeout_exception(ElementNotVisibleException, message)
+
+
 def wait_for_attribute(
     driver,
     selector,
@@ -934,10 +1132,11 @@ def wait_for_attribute(
     element_present = False
     attribute_present = False
     found_value = None
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "attribute", timeout, name="wait_for_attribute",
+        attribute=attribute, value=value
+    )
+    for x in poller:
         try:
             element = driver.find_element(by=by, value=selector)
             element_present = True
@@ -958,10 +1157,7 @@ def wait_for_attribute(
             else:
                 return element
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -1020,10 +1216,11 @@ def wait_for_element_clickable(
     element = None
     is_present = False
     is_visible = False
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "clickable", timeout,
+        name="wait_for_element_clickable"
+    )
+    for x in poller:
         try:
             element = driver.find_element(by=by, value=selector)
             is_present = True
@@ -1038,10 +1235,7 @@ def wait_for_element_clickable(
                 element = None
                 raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -1120,16 +1314,13 @@ def wait_for_element_absent(
         driver.cdp.wait_for_element_absent(selector)
         return True
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "absent", timeout,
+        name="wait_for_element_absent"
+    )
+    for x in poller:
         try:
             driver.find_element(by=by, value=selector)
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
         except Exception:
             return True
     plural = "s"
@@ -1176,18 +1367,14 @@ def wait_for_element_not_visible(
         driver.cdp.wait_for_element_not_visible(selector)
         return True
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "not_visible", timeout,
+        name="wait_for_element_not_visible"
+    )
+    for x in poller:
         try:
             element = driver.find_element(by=by, value=selector)
-            if element.is_displayed():
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
-                    break
-                time.sleep(0.1)
-            else:
+            if not element.is_displayed():
                 return True
         except Exception:
             return True
@@ -1230,16 +1417,13 @@ def wait_for_text_not_visible(
     """
     _reconnect_if_disconnected(driver)
     text = str(text)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "text_not_visible", timeout,
+        name="wait_for_text_not_visible", text=text
+    )
+    for x in poller:
         if not is_text_visible(driver, text, selector, by=by):
             return True
-        now_ms = time.time() * 1000.0
-        if now_ms >= stop_ms:
-            break
-        time.sleep(0.1)
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -1274,16 +1458,13 @@ def wait_for_exact_text_not_visible(
     """
     _reconnect_if_disconnected(driver)
     text = str(text)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "exact_text_not_visible", timeout,
+        name="wait_for_exact_text_not_visible", text=text
+    )
+    for x in poller:
         if not is_exact_text_visible(driver, text, selector, by=by):
             return True
-        now_ms = time.time() * 1000.0
-        if now_ms >= stop_ms:
-            break
-        time.sleep(0.1)
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -1316,12 +1497,13 @@ def wait_for_non_empty_text_visible(
     The web element object that has text
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    poller = _get_poller(
+        driver, selector, by, "non_empty_text", timeout,
+        name="wait_for_non_empty_text_visible"
+    )
     element = None
     visible = None
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    for x in poller:
         try:
             element = None
             visible = False
@@ -1341,10 +1523,6 @@ def wait_for_non_empty_text_visible(
                 return element
         except Exception:
             element = None
-        now_ms = time.time() * 1000.0
-        if now_ms >= stop_ms:
-            break
-        time.sleep(0.1)
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -1394,18 +1572,16 @@ def wait_for_attribute_not_present(
     by - the type of selector being used (Default: "css selector")
     timeout - the time to wait for the element attribute in seconds
     """
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = _get_poller(
+        driver, selector, by, "attribute_not_present", timeout,
+        name="wait_for_attribute_not_present", attribute=attribute,
+        value=value
+    )
+    for x in poller:
         if not is_attribute_present(
             driver, selector, attribute, value=value, by=by
         ):
             return True
-        now_ms = time.time() * 1000.0
-        if now_ms >= stop_ms:
-            break
-        time.sleep(0.1)
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -1573,20 +1749,17 @@ def wait_for_and_switch_to_alert(driver, timeout=settings.LARGE_TIMEOUT):
     timeout - the time to wait for the alert in seconds
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = poll_utils.PollScheduler(
+        timeout, name="wait_for_and_switch_to_alert"
+    )
+    for x in poller:
         try:
             alert = driver.switch_to.alert
             # Raises exception if no alert present
             dummy_variable = alert.text  # noqa
             return alert
         except NoAlertPresentException:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
+            pass
     message = "Alert was not present after %s seconds!" % timeout
     timeout_exception(Exception, message)
 
@@ -1604,10 +1777,8 @@ def switch_to_frame(
     invisible - if True, the iframe can be invisible
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
-    for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+    poller = poll_utils.PollScheduler(timeout, name="switch_to_frame")
+    for x in poller:
         try:
             driver.switch_to.frame(frame)
             return True
@@ -1626,10 +1797,6 @@ def switch_to_frame(
                         element = driver.find_element(by=by, value=frame)
                         driver.switch_to.frame(element)
                         return True
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
-                break
-            time.sleep(0.1)
     plural = "s"
     if timeout == 1:
         plural = ""
@@ -1673,25 +1840,20 @@ def switch_to_window(
     _reconnect_if_disconnected(driver)
     if window == -1:
         window = len(driver.window_handles) - 1
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    poller = poll_utils.PollScheduler(timeout, name="switch_to_window")
     if isinstance(window, int):
         if shared_utils.is_safari(driver):
             # Reversed window_handles on Safari
             window = len(driver.window_handles) - 1 - window
             if window < 0:
                 window = 0
-        for x in range(int(timeout * 10)):
-            shared_utils.check_if_time_limit_exceeded()
+        for x in poller:
             try:
                 window_handle = driver.window_handles[window]
                 __switch_to_window(driver, window_handle, uc_lock=uc_lock)
                 return True
             except IndexError:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
-                    break
-                time.sleep(0.1)
+                pass
         plural = "s"
         if timeout == 1:
             plural = ""
@@ -1703,16 +1865,12 @@ def switch_to_window(
         timeout_exception(Exception, message)
     else:
         window_handle = window
-        for x in range(int(timeout * 10)):
-            shared_utils.check_if_time_limit_exceeded()
+        for x in poller:
             try:
                 __switch_to_window(driver, window_handle, uc_lock=uc_lock)
                 return True
             except NoSuchWindowException:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
-                    break
-                time.sleep(0.1)
+                pass
         plural = "s"
         if timeout == 1:
             plural = ""
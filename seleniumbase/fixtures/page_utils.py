@@ -6,6 +6,8 @@ import requests
 from selenium.webdriver.common.by import By
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import css_to_xpath
+from seleniumbase.fixtures import link_checker
+from seleniumbase.fixtures import selector_cache
 
 
 def get_domain_url(url):
@@ -73,6 +75,12 @@ def recalculate_selector(selector, by, xp_ok=True):
     if _by_type is not str:
         msg = "Expecting a `by` of type: \"<class 'str'>\" (string)!"
         raise Exception('Invalid `by` type: "%s"\n%s' % (_by_type, msg))
+    return _recalculate_selector(selector, by, xp_ok)
+
+
+@selector_cache.cached
+def _recalculate_selector(selector, by, xp_ok):
+    """The cached part of recalculate_selector(). (Inputs were validated.)"""
     if not is_valid_by(by) and is_valid_by(selector):
         selector, by = swap_selector_and_by_if_reversed(selector, by)
     if is_xpath_selector(selector):
@@ -266,7 +274,8 @@ def _get_link_status_code(
     If the timeout is exceeded, will return a 404.
     If "verify" is False, will ignore certificate errors.
     For a list of available status codes, see:
-    https://en.wikipedia.org/wiki/List_of_HTTP_status_codes """
+    https://en.wikipedia.org/wiki/List_of_HTTP_status_codes
+    (Not cached. Bulk checks use link_checker, which caches results.)"""
     status_code = None
     try:
         response = requests.head(
@@ -288,9 +297,10 @@ def _print_unique_links_with_status_codes(page_url, soup):
     Page links include those obtained from:
     "a"->"href", "img"->"src", "link"->"href", and "script"->"src". """
     links = _get_unique_links(page_url, soup)
+    checker = link_checker.get_link_checker()
+    status_codes = checker.get_status_codes(links)
     for link in links:
-        status_code = _get_link_status_code(link)
-        print(link, " -> ", status_code)
+        print(link, " -> ", status_codes[link])
 
 
 def _download_file_to(
@@ -0,0 +1,169 @@
+"""A shared polling scheduler for the wait loops of SeleniumBase.
+
+Instead of checking for a condition at fixed intervals (Eg. every 100ms),
+checks start out a few milliseconds apart, and then the interval backs off
+exponentially up to a cap. This way, short waits return almost immediately,
+and long waits don't hit the browser as often.
+
+Usage:
+    poller = poll_utils.PollScheduler(timeout, name="wait_for_element")
+    for attempt in poller:
+        if condition_is_met():
+            return True
+    raise Exception("Condition not met after %s seconds!" % timeout)
+
+(The loop ends once the timeout is reached, after a final check.)
+Stats from recent waits can be retrieved with poll_utils.get_stats()."""
+import asyncio
+import collections
+import time
+from seleniumbase.fixtures import shared_utils
+
+MIN_INTERVAL = 0.005  # The first interval between checks (in seconds)
+MAX_INTERVAL = 0.2  # The interval between checks never exceeds this value
+BACKOFF_FACTOR = 2.0  # The interval is multiplied by this after each check
+MAX_RECENT_STATS = 200  # The number of recent wait stats to keep
+
+recent_stats = collections.deque(maxlen=MAX_RECENT_STATS)
+totals = {"waits": 0, "timeouts": 0, "checks": 0, "seconds": 0.0}
+
+
+class PollScheduler:
+    def __init__(
+        self,
+        timeout,
+        name=None,
+        ignore_test_time_limit=False,
+        waiter=None,
+        min_interval=None,
+        max_interval=None,
+    ):
+        """
+        @Params
+        timeout - the time to wait for the condition in seconds
+        name - the name of the wait (Eg. the method name) for stats
+        ignore_test_time_limit - ignore test time limit (NOT the timeout)
+        waiter - an optional callable that blocks between checks instead of
+                 sleeping. It receives the remaining time in seconds, and
+                 returns True if it waited. (If False, sleep the interval.)
+        min_interval - the first interval between checks in seconds
+        max_interval - the cap of the interval between checks in seconds
+        """
+        if not timeout or timeout < 0:
+            timeout = 0
+        self.timeout = timeout
+        self.name = name
+        self.ignore_test_time_limit = ignore_test_time_limit
+        self.waiter = waiter
+        self.interval = min_interval or MIN_INTERVAL
+        self.max_interval = max_interval or MAX_INTERVAL
+        self.start_time = time.time()
+        self.stop_time = self.start_time + timeout
+        self.checks = 0
+        self.slept = 0.0
+        self.timed_out = False
+        self.recorded = False
+
+    def remaining(self):
+        """Returns the time left until the timeout (in seconds)."""
+        return max(self.stop_time - time.time(), 0)
+
+    def is_expired(self):
+        return time.time() >= self.stop_time
+
+    def __next_delay(self):
+        delay = min(self.interval, self.remaining())
+        self.interval = min(
+            self.interval * BACKOFF_FACTOR, self.max_interval
+        )
+        return delay
+
+    def __before_check(self):
+        if not self.ignore_test_time_limit:
+            shared_utils.check_if_time_limit_exceeded()
+        self.checks += 1
+
+    def __wait_with_waiter(self):
+        if self.waiter:
+            wait_start = time.time()
+            if self.waiter(self.remaining()):
+                self.slept += time.time() - wait_start
+                return True
+        return False
+
+    def pause(self):
+        """Waits until the next check is due."""
+        if self.__wait_with_waiter():
+            return
+        delay = self.__next_delay()
+        if delay > 0:
+            time.sleep(delay)
+            self.slept += delay
+
+    async def async_pause(self):
+        """Waits until the next check is due, without blocking the loop."""
+        delay = self.__next_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+            self.slept += delay
+
+    def __iter__(self):
+        try:
+            while True:
+                self.__before_check()
+                yield self.checks - 1
+                if self.is_expired():
+                    self.timed_out = True
+                    break
+                self.pause()
+        finally:
+            self.record()
+
+    async def __aiter__(self):
+        try:
+            while True:
+                self.__before_check()
+                yield self.checks - 1
+                if self.is_expired():
+                    self.timed_out = True
+                    break
+                await self.async_pause()
+        finally:
+            self.record()
+
+    @property
+    def stats(self):
+        return {
+            "name": self.name,
+            "timeout": self.timeout,
+            "checks": self.checks,
+            "elapsed": round(time.time() - self.start_time, 4),
+            "slept": round(self.slept, 4),
+            "timed_out": self.timed_out,
+        }
+
+    def record(self):
+        """Saves the stats of this wait. (Called once the wait is over.)"""
+        if self.recorded:
+            return
+        self.recorded = True
+        stats = self.stats
+        recent_stats.append(stats)
+        totals["waits"] += 1
+        totals["checks"] += stats["checks"]
+        totals["seconds"] += stats["elapsed"]
+        if stats["timed_out"]:
+            totals["timeouts"] += 1
+
+
+def get_stats():
+    """Returns a summary of all waits, plus the stats of recent waits."""
+    summary = dict(totals)
+    summary["seconds"] = round(summary["seconds"], 4)
+    summary["recent"] = list(recent_stats)
+    return summary
+
+
+def reset_stats():
+    recent_stats.clear()
+    totals.update({"waits": 0, "timeouts": 0, "checks": 0, "seconds": 0.0})
@@ -0,0 +1,47 @@
+"""A process-wide LRU cache for selector translations.
+
+Selectors get recalculated and converted (Eg. XPath <-> CSS) for every
+action, which means that the same parsing happens over and over again for
+the same selectors. Functions decorated with @selector_cache.cached keep
+their recent results (keyed by the arguments), so that repeated selectors
+are only parsed once per process. (Exceptions are not cached.)
+
+Hits and misses can be retrieved with selector_cache.get_stats()."""
+import functools
+
+MAX_CACHED_SELECTORS = 4096  # The max number of results kept per function
+
+cached_functions = []
+
+
+def cached(func):
+    """Decorator for selector functions that return immutable results."""
+    cached_func = functools.lru_cache(maxsize=MAX_CACHED_SELECTORS)(func)
+    cached_functions.append(cached_func)
+    return cached_func
+
+
+def get_stats():
+    """Returns the hits, misses, and size of each selector cache,
+    plus the totals of all of them."""
+    summary = {"hits": 0, "misses": 0, "size": 0, "functions": {}}
+    for cached_func in cached_functions:
+        info = cached_func.cache_info()
+        name = "%s.%s" % (
+            cached_func.__module__.split(".")[-1], cached_func.__name__
+        )
+        summary["functions"][name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+        }
+        summary["hits"] += info.hits
+        summary["misses"] += info.misses
+        summary["size"] += info.currsize
+    return summary
+
+
+def clear():
+    """Clears all selector caches (and resets the stats)."""
+    for cached_func in cached_functions:
+        cached_func.cache_clear()
@@ -155,6 +155,23 @@ def reconnect_if_disconnected(driver):
             driver.connect()
 
 
+def add_round_trip_counter(driver):
+    """Wraps driver.execute() to count the commands sent to the driver.
+    Every WebDriver command (including WebElement commands) is a round trip
+    to the driver service (or to the Grid server when running remotely).
+    The count is saved as driver._round_trips (reset it by setting to 0)."""
+    if hasattr(driver, "_round_trips") or not hasattr(driver, "execute"):
+        return
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        driver._round_trips += 1
+        return original_execute(driver_command, params)
+
+    driver._round_trips = 0
+    driver.execute = execute
+
+
 def is_cdp_swap_needed(driver):
     """
     When someone is using CDP Mode with a disconnected webdriver,
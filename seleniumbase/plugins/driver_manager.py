@@ -139,6 +139,7 @@ def Driver(
     cft=None,  # Use "Chrome for Testing"
     chs=None,  # Use "Chrome-Headless-Shell"
     use_chromium=None,  # Use base "Chromium"
+    launch_profile=None,  # Print a timing breakdown of each browser launch.
 ) -> sb_driver.DriverMethods:
     """
     * SeleniumBase Driver as a Python Context Manager or a returnable object. *
@@ -232,6 +233,7 @@ def Driver(
     server (str):  Shortcut / Duplicate of "servername".
     guest (bool):  Shortcut / Duplicate of "guest_mode".
     pls (str):  Shortcut / Duplicate of "page_load_strategy".
+    launch_profile (bool):  Print a timing breakdown of each browser launch.
     """
     from seleniumbase import config as sb_config
     from seleniumbase.config import settings
@@ -860,6 +862,12 @@ def Driver(
             remote_debug = True
         else:
             remote_debug = False
+    if launch_profile is None:
+        if "--launch-profile" in sys_argv or "--launch_profile" in sys_argv:
+            launch_profile = True
+        else:
+            launch_profile = False
+    sb_config.launch_profile = launch_profile
     if enable_3d_apis is None:
         if "--enable-3d-apis" in sys_argv or "--enable_3d_apis" in sys_argv:
             enable_3d_apis = True
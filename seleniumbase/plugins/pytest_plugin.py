@@ -132,6 +132,7 @@ def pytest_addoption(parser):
     --external-pdf  (Set Chromium "plugins.always_open_pdf_externally":True.)
     --timeout-multiplier=MULTIPLIER  (Multiplies the default timeout values.)
     --list-fail-page  (After each failing test, list the URL of the failure.)
+    --launch-profile  (Print a timing breakdown of each browser launch.)
     """
     c1 = ""
     c2 = ""
@@ -1431,6 +1432,18 @@ def pytest_addoption(parser):
                 Useful when you don't have access to the latest_logs/
                 folder, such as when running tests in GitHub Actions.""",
     )
+    parser.addoption(
+        "--launch_profile",
+        "--launch-profile",
+        action="store_true",
+        dest="launch_profile",
+        default=False,
+        help="""(For debugging) After each browser launch, print the
+                time spent in each launch phase (browser and driver
+                version checks, driver downloads, UC patching, etc).
+                Version checks are cached between launches, so cached
+                checks are listed with the number of cache hits.""",
+    )
 
     arg_join = " ".join(sys_argv)
     sb_config._browser_shortcut = None
@@ -1873,6 +1886,7 @@ def pytest_configure(config):
     sb_config.external_pdf = config.getoption("external_pdf")
     sb_config.timeout_multiplier = config.getoption("timeout_multiplier")
     sb_config.list_fp = config.getoption("fail_page")
+    sb_config.launch_profile = config.getoption("launch_profile")
     sb_config._is_timeout_changed = False
     sb_config._has_logs = False
     sb_config._fail_page = None
@@ -2160,6 +2174,12 @@ def pytest_collection_finish(session):
                 _fix_html_report(htmlpath)
 
 
+def pytest_runtest_protocol(item, nextitem):
+    """This runs for every test with pytest. (Before the setup phase)"""
+    # With pytest-xdist, only the last test of a process has no next item
+    sb_config._is_last_item = nextitem is None
+
+
 def pytest_runtest_setup(item):
     """This runs before every test with pytest."""
     if "--co" in sys_argv or "--collect-only" in sys_argv:
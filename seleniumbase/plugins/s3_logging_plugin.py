@@ -24,6 +24,7 @@ class S3Logging(Plugin):
 
     def afterTest(self, test):
         """Upload logs to the S3 bucket after tests complete."""
+        from seleniumbase.core import artifact_writer
         from seleniumbase.core.s3_manager import S3LoggingBucket
 
         self.test_id = test.test.id()
@@ -31,13 +32,17 @@ class S3Logging(Plugin):
         guid = str(uuid.uuid4().hex)
         path = os.path.join(self.options.log_path, self.test_id)
         uploaded_files = []
+        artifact_writer.flush()  # Wait until all log files are written
         for logfile in os.listdir(path):
             logfile_name = "%s/%s/%s" % (
                 guid,
                 self.test_id,
                 logfile.split(path)[-1],
             )
-            s3_bucket.upload_file(logfile_name, os.path.join(path, logfile))
+            # (Files upload in the background while the next test runs)
+            s3_bucket.upload_file_async(
+                logfile_name, os.path.join(path, logfile)
+            )
             uploaded_files.append(logfile_name)
         s3_bucket.save_uploaded_file_names(uploaded_files)
         index_file = s3_bucket.upload_index_file(
@@ -137,6 +137,7 @@ def SB(
     highlights=None,  # Number of highlight animations for Demo Mode actions.
     interval=None,  # SECONDS (Autoplay interval for SB Slides & Tour steps.)
     time_limit=None,  # SECONDS (Safely fail tests that exceed the time limit.)
+    launch_profile=None,  # Print a timing breakdown of each browser launch.
 ) -> Generator[BaseCase, Any, None]:
     """
     * SeleniumBase as a Python Context Manager *
@@ -260,6 +261,7 @@ def SB(
     highlights (int):  Number of highlight animations for Demo Mode actions.
     interval (float):  SECONDS (Autoplay interval for SB Slides & Tour steps.)
     time_limit (float):  SECONDS (Safely fail tests that exceed the time limit)
+    launch_profile (bool):  Print a timing breakdown of each browser launch.
     """
     import colorama
     import gc
@@ -1034,6 +1036,11 @@ def SB(
             remote_debug = True
         else:
             remote_debug = False
+    if launch_profile is None:
+        if "--launch-profile" in sys_argv or "--launch_profile" in sys_argv:
+            launch_profile = True
+        else:
+            launch_profile = False
     if enable_3d_apis is None:
         if "--enable-3d-apis" in sys_argv or "--enable_3d_apis" in sys_argv:
             enable_3d_apis = True
@@ -1215,6 +1222,7 @@ def SB(
     sb_config.do_not_track = do_not_track
     sb_config.external_pdf = external_pdf
     sb_config.remote_debug = remote_debug
+    sb_config.launch_profile = launch_profile
     sb_config.settings_file = settings_file
     sb_config.user_data_dir = user_data_dir
     sb_config.chromium_arg = chromium_arg
@@ -1487,13 +1495,19 @@ def SB(
                     hasattr(driver, "cdp")
                     and driver.cdp
                     and hasattr(driver.cdp, "loop")
+                    and not driver.cdp.loop.is_closed()
                 ):
-                    asyncio.set_event_loop(driver.cdp.loop)
+                    from seleniumbase.core import loop_helper
+                    asyncio.set_event_loop(
+                        loop_helper.get_raw_loop(driver.cdp.loop)
+                    )
                     tasks = []
                     for tab in driver.cdp.get_tabs():
                         tasks.append(tab.aclose())
                     tasks.append(driver.cdp.driver.connection.aclose())
-                    driver.cdp.loop.run_until_complete(asyncio.gather(*tasks))
+                    driver.cdp.loop.run_until_complete(
+                        loop_helper.gather(*tasks)
+                    )
                     driver.cdp.loop.close()
         gc.collect()
     if test and test_name and not test_passed and raise_test_failure:
@@ -36,6 +36,14 @@ def get_registered_instances():
     return __registered__instances__
 
 
+def is_running_loop(loop) -> bool:
+    """Returns True if the loop is running on the current thread."""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
 def deconstruct_browser():
     for _ in __registered__instances__:
         if not _.stopped:
@@ -951,7 +959,13 @@ class Browser:
                         loop = asyncio.get_event_loop()
                 if loop.is_closed():
                     return
-                if loop.is_running():
+                if loop.is_running() and not is_running_loop(loop):
+                    # The loop runs on another thread (Eg. a LoopThread)
+                    asyncio.run_coroutine_threadsafe(
+                        self.connection.aclose(), loop
+                    ).result(5)
+                    logger.debug("Closed connection on the loop thread")
+                elif loop.is_running():
                     loop.create_task(self.connection.aclose())
                     logger.debug("Closed connection with create_task()")
                 else:
@@ -1232,7 +1246,6 @@ class CookieJar:
         #     return
         # if connection.websocket.closed:
         #     return
-        cookies = await self.get_all(requests_cookie_format=False)
         included_cookies = []
         for cookie in cookies:
             for match in pattern.finditer(str(cookie.__dict__)):
@@ -1294,9 +1307,8 @@ class CookieJar:
             break
         else:
             connection = self._browser.connection
-        cookies = await connection.send(cdp.network.get_cookies())
-        if cookies:
-            await connection.send(cdp.storage.clear_cookies())
+        # Clearing when there are no cookies is a no-op (no need to check)
+        await connection.send(cdp.storage.clear_cookies())
 
 
 class HTTPApi:
@@ -15,6 +15,7 @@ from seleniumbase import extensions
 from seleniumbase.config import settings
 from seleniumbase.core import detect_b_ver
 from seleniumbase.core import download_helper
+from seleniumbase.core import extension_cache
 from seleniumbase.core import proxy_helper
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import shared_utils
@@ -190,19 +191,6 @@ def __activate_virtual_display_as_needed(
                 __activate_standard_virtual_display()
 
 
-def __set_proxy_filenames():
-    DOWNLOADS_DIR = constants.Files.DOWNLOADS_FOLDER
-    for num in range(1000):
-        PROXY_DIR_PATH = os.path.join(DOWNLOADS_DIR, "proxy_ext_dir_%s" % num)
-        if os.path.exists(PROXY_DIR_PATH):
-            continue
-        proxy_helper.PROXY_DIR_PATH = PROXY_DIR_PATH
-        return
-    # Exceeded upper bound. Use Defaults:
-    PROXY_DIR_PATH = os.path.join(DOWNLOADS_DIR, "proxy_ext_dir")
-    proxy_helper.PROXY_DIR_PATH = PROXY_DIR_PATH
-
-
 def __add_chrome_ext_dir(extension_dir, dir_path):
     # Add dir_path to the existing extension_dir
     option_exists = False
@@ -216,19 +204,6 @@ def __add_chrome_ext_dir(extension_dir, dir_path):
     return extension_dir
 
 
-def __unzip_to_new_folder(zip_file, folder):
-    proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-    with proxy_dir_lock:
-        with suppress(Exception):
-            shared_utils.make_writable(PROXY_DIR_LOCK)
-        if not os.path.exists(folder):
-            import zipfile
-            zip_ref = zipfile.ZipFile(zip_file, "r")
-            os.makedirs(folder)
-            zip_ref.extractall(folder)
-            zip_ref.close()
-
-
 def __add_chrome_proxy_extension(
     extension_dir,
     proxy_string,
@@ -240,49 +215,17 @@ def __add_chrome_proxy_extension(
 ):
     """Implementation of https://stackoverflow.com/a/35293284/7058266
     for https://stackoverflow.com/q/12848327/7058266
-    (Run Selenium on a proxy server that requires authentication.)"""
-    args = " ".join(sys.argv)
-    bypass_list = proxy_bypass_list
-    if (
-        not ("-n" in sys.argv or " -n=" in args or args == "-c")
-        and not multi_proxy
-    ):
-        # Single-threaded
-        proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-        with proxy_dir_lock:
-            proxy_helper.create_proxy_ext(
-                proxy_string,
-                proxy_user,
-                proxy_pass,
-                proxy_scheme,
-                bypass_list,
-                zip_it=False,
-            )
-            proxy_dir_path = proxy_helper.PROXY_DIR_PATH
-            extension_dir = __add_chrome_ext_dir(
-                extension_dir, proxy_dir_path
-            )
-    else:
-        # Multi-threaded
-        proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-        with proxy_dir_lock:
-            with suppress(Exception):
-                shared_utils.make_writable(PROXY_DIR_LOCK)
-            if multi_proxy:
-                __set_proxy_filenames()
-            if not os.path.exists(proxy_helper.PROXY_DIR_PATH):
-                proxy_helper.create_proxy_ext(
-                    proxy_string,
-                    proxy_user,
-                    proxy_pass,
-                    proxy_scheme,
-                    bypass_list,
-                    zip_it=False,
-                )
-            extension_dir = __add_chrome_ext_dir(
-                extension_dir, proxy_helper.PROXY_DIR_PATH
-            )
-    return extension_dir
+    (Run Selenium on a proxy server that requires authentication.)
+    Uses the extension cache, which has one folder per proxy setting."""
+    proxy_dir_path = extension_cache.get_proxy_extension(
+        proxy_string,
+        proxy_user,
+        proxy_pass,
+        proxy_scheme,
+        proxy_bypass_list,
+    )
+    proxy_helper.PROXY_DIR_PATH = proxy_dir_path
+    return __add_chrome_ext_dir(extension_dir, proxy_dir_path)
 
 
 async def start(
@@ -675,16 +618,16 @@ async def start(
         sb_config.ad_block_on = True
         incognito = False
         guest = False
-        ad_block_zip = AD_BLOCK_ZIP_PATH
-        ad_block_dir = os.path.join(DOWNLOADS_FOLDER, "ad_block")
-        __unzip_to_new_folder(ad_block_zip, ad_block_dir)
+        ad_block_dir = extension_cache.get_unpacked_extension(
+            AD_BLOCK_ZIP_PATH
+        )
         extension_dir = __add_chrome_ext_dir(extension_dir, ad_block_dir)
     if disable_csp:
         sb_config.disable_csp = True
         if not incognito and not guest:
-            disable_csp_zip = DISABLE_CSP_ZIP_PATH
-            disable_csp_dir = os.path.join(DOWNLOADS_FOLDER, "disable_csp")
-            __unzip_to_new_folder(disable_csp_zip, disable_csp_dir)
+            disable_csp_dir = extension_cache.get_unpacked_extension(
+                DISABLE_CSP_ZIP_PATH
+            )
             extension_dir = __add_chrome_ext_dir(
                 extension_dir, disable_csp_dir
             )
@@ -862,6 +805,80 @@ def filter_recurse(
                 return result
 
 
+class DomIndex:
+    """
+    An index of the nodes of a document tree (from DOM.getDocument),
+    built in a single pass, for O(1) lookups of nodes by node_id,
+    by backend_node_id, and of the node that contains a node.
+    Covers the same nodes that filter_recurse() visits.
+    Use get_dom_index(doc) to get the cached index of a document.
+    """
+
+    def __init__(self, doc: cdp.dom.Node):
+        self.doc = doc
+        self.by_node_id = {}
+        self.by_backend_id = {}
+        self.parents = {}  # node_id -> The node that has it in .children
+        stack = [(doc, False)]
+        while stack:
+            node, include = stack.pop()
+            if include:
+                self.by_node_id.setdefault(node.node_id, node)
+                self.by_backend_id.setdefault(node.backend_node_id, node)
+            next_nodes = []
+            if include and node.shadow_roots:
+                next_nodes.append((node.shadow_roots[0], False))
+            if node.children:
+                for child in node.children:
+                    self.parents.setdefault(child.node_id, node)
+                    next_nodes.append((child, True))
+            # Reversed so that nodes are indexed in document order
+            stack.extend(reversed(next_nodes))
+
+    def __len__(self):
+        return len(self.by_node_id)
+
+    def get_node(self, node_id) -> cdp.dom.Node | None:
+        return self.by_node_id.get(node_id)
+
+    def get_node_by_backend_id(self, backend_node_id) -> cdp.dom.Node | None:
+        return self.by_backend_id.get(backend_node_id)
+
+    def get_parent(self, node: cdp.dom.Node) -> cdp.dom.Node | None:
+        """Returns the parent node of a node (by the parent_id)."""
+        return self.by_node_id.get(node.parent_id)
+
+
+def get_dom_index(doc: cdp.dom.Node) -> DomIndex:
+    """
+    Returns the DomIndex of a document tree.
+    The index is built on the first call, and then saved on the tree.
+    (Each DOM.getDocument call returns a new tree with a new index.)
+    """
+    index = getattr(doc, "_dom_index", None)
+    if index is None or index.doc is not doc:
+        index = DomIndex(doc)
+        with suppress(Exception):
+            doc._dom_index = index
+    return index
+
+
+def find_node_by_id(doc: T, node_id) -> cdp.dom.Node | None:
+    """Same as filter_recurse(doc, lambda n: n.node_id == node_id)"""
+    if isinstance(doc, Element):
+        return filter_recurse(doc, lambda n: n.node_id == node_id)
+    return get_dom_index(doc).get_node(node_id)
+
+
+def find_node_by_backend_id(doc: T, backend_node_id) -> cdp.dom.Node | None:
+    """Same as filter_recurse() with a backend_node_id predicate."""
+    if isinstance(doc, Element):
+        return filter_recurse(
+            doc, lambda n: n.backend_node_id == backend_node_id
+        )
+    return get_dom_index(doc).get_node_by_backend_id(backend_node_id)
+
+
 def circle(
     x, y=None, radius=10, num=10, dir=0
 ) -> Generator[tuple[float, float], None, None]:
@@ -901,11 +918,16 @@ def circle(
 def remove_from_tree(tree: cdp.dom.Node, node: cdp.dom.Node) -> cdp.dom.Node:
     if not hasattr(tree, "children"):
         raise TypeError("Object should have a .children attribute!")
-    if tree and tree.children:
-        for child in tree.children:
-            if child.backend_node_id == node.backend_node_id:
-                tree.children.remove(child)
-            remove_from_tree(child, node)
+    index = get_dom_index(tree)
+    found = index.get_node_by_backend_id(node.backend_node_id)
+    if found is not None:
+        parent = index.parents.get(found.node_id)
+        if parent is not None and parent.children:
+            parent.children[:] = [
+                child for child in parent.children if child is not found
+            ]
+        # The tree changed, so the index gets rebuilt when needed
+        tree._dom_index = None
     return tree
 
 
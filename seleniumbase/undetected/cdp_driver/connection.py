@@ -7,12 +7,14 @@ import json
 import logging
 import os
 import sys
+import time
 import types
 import warnings
 import websockets
 from websockets.protocol import State
 from seleniumbase.fixtures import constants
 from . import cdp_util as util
+from . import dom_mirror
 from collections.abc import Awaitable, Callable, Generator
 from typing import Any, TypeVar
 import mycdp as cdp
@@ -27,6 +29,7 @@ T = TypeVar("T")
 GLOBAL_DELAY = 0.005
 MAX_SIZE: int = 2**28
 PING_TIMEOUT: int = 1800  # 30 minutes
+EVENT_PREFIX = '{"method":"'
 TargetType = cdp.target.TargetInfo | cdp.target.TargetID
 logging.getLogger("asyncio").setLevel(logging.CRITICAL)
 logger = logging.getLogger("uc.connection")
@@ -439,6 +442,7 @@ class Connection(metaclass=CantTouchThis):
                 self.__count__ = itertools.count(0)
             tx.id = next(self.__count__)
             self.mapper.update({tx.id: tx})
+            self._check_node_id_reset(tx)
             if not _is_update:
                 await self._register_handlers()
             await self.websocket.send(tx.message)
@@ -456,6 +460,87 @@ class Connection(metaclass=CantTouchThis):
         except Exception:
             await self.aclose()
 
+    async def send_many(
+        self,
+        *cdp_objs: Generator[dict[str, Any], dict[str, Any], Any],
+        _is_update=True,
+    ) -> list[Any]:
+        """
+        Send multiple protocol commands back to back (pipelined),
+        without waiting for each response before sending the next one.
+        The browser runs them in order, so this is safe for commands that
+        don't need the results of earlier commands as input.
+        Returns a list with the results, in the same order as the commands.
+        If a command fails in the browser, its ProtocolException is returned
+        in its place, and the results of the other commands are kept.
+        If the connection fails, the results of unfinished commands are None.
+        .. code-block::
+            doc, (search_id, count) = await tab.send_many(
+                cdp.dom.get_document(-1, True),
+                cdp.dom.perform_search(text, True),
+            )
+        :param cdp_objs: The generator objects created by cdp methods
+        :param _is_update: Internal flag (See Connection.send)
+        """
+        if not cdp_objs:
+            return []
+        await self.aopen()
+        if not self.websocket or self.websocket.state is State.CLOSED:
+            return [None] * len(cdp_objs)
+        if self.browser:
+            browser = self.browser
+            if browser.config:
+                if browser.config.expert:
+                    await self._prepare_expert()
+                if browser.config.headless:
+                    await self._prepare_headless()
+        if not self.listener or not self.listener.running:
+            self.listener = Listener(self)
+        try:
+            transactions = []
+            if not self.mapper:
+                self.__count__ = itertools.count(0)
+            for cdp_obj in cdp_objs:
+                tx = Transaction(cdp_obj)
+                tx.connection = self
+                tx.id = next(self.__count__)
+                self.mapper.update({tx.id: tx})
+                self._check_node_id_reset(tx)
+                transactions.append(tx)
+            if not _is_update:
+                await self._register_handlers()
+            for tx in transactions:
+                await self.websocket.send(tx.message)
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    action="ignore",
+                    category=RuntimeWarning,
+                    message=".*coroutine.*",
+                )
+                results = await asyncio.gather(
+                    *transactions, return_exceptions=True
+                )
+        except Exception:
+            await self.aclose()
+            return [None] * len(cdp_objs)
+        transport_failed = False
+        for i, (tx, result) in enumerate(zip(transactions, results)):
+            if isinstance(result, ProtocolException):
+                # (Only this command failed. The connection is fine.)
+                result.message += f"\ncommand:{tx.method}\nparams:{tx.params}"
+            elif isinstance(result, BaseException):
+                transport_failed = True
+                results[i] = None
+        if transport_failed:
+            await self.aclose()
+        return results
+
+    def _check_node_id_reset(self, tx):
+        # DOM.getDocument resets all node ids, so a DOM mirror becomes stale
+        mirror = getattr(self, "_dom_mirror", None)
+        if mirror and tx.method in dom_mirror.NODE_ID_RESETS:
+            mirror.node_ids_reset()
+
     async def _register_handlers(self):
         """
         Ensure that for current (event) handlers, the corresponding
@@ -534,6 +619,21 @@ class Connection(metaclass=CantTouchThis):
             pass
 
 
+def get_event_method(msg: str | bytes) -> str | None:
+    """
+    Returns the method of a CDP event message (Eg. "Network.dataReceived")
+    without parsing the JSON. Chromium puts the "method" key first for
+    events. Returns None if the message doesn't start that way.
+    (Then the full JSON message gets parsed instead.)
+    """
+    if not isinstance(msg, str) or not msg.startswith(EVENT_PREFIX):
+        return None
+    end = msg.find('"', len(EVENT_PREFIX))
+    if end == -1:
+        return None
+    return msg[len(EVENT_PREFIX):end]
+
+
 class Listener:
     def __init__(self, connection: Connection):
         self.connection = connection
@@ -543,6 +643,7 @@ class Listener:
         is_interactive = getattr(sys, "ps1", sys.flags.interactive)
         self._time_before_considered_idle = 0.10 if not is_interactive else 0.75  # noqa
         self.idle = asyncio.Event()
+        self.reset_metrics()
         self.run()
 
     def run(self):
@@ -572,6 +673,59 @@ class Listener:
             return False
         return True
 
+    def _has_handlers(self, method: str) -> bool:
+        """Returns True if any handler exists for the event method."""
+        event_type = cdp.util._event_parsers.get(method)
+        if not event_type:
+            return False
+        return bool(self.connection.handlers.get(event_type))
+
+    def _add_busy_time(self, started: float):
+        elapsed = time.perf_counter() - started
+        self.metrics["busy_time"] += elapsed
+        if elapsed > self.metrics["max_busy_time"]:
+            self.metrics["max_busy_time"] = elapsed
+
+    async def _run_timed(self, coro, queued: float):
+        """Runs a callback coroutine, and records its queue latency."""
+        latency = time.perf_counter() - queued
+        self.metrics["callbacks_queued"] += 1
+        self.metrics["queue_latency"] += latency
+        if latency > self.metrics["max_queue_latency"]:
+            self.metrics["max_queue_latency"] = latency
+        return await coro
+
+    def get_metrics(self) -> dict:
+        """
+        Returns the metrics of the listener loop:
+        the number of messages received, events parsed and events skipped,
+        the time spent processing messages (busy_time, in seconds),
+        and the delay before async callbacks start (queue_latency).
+        """
+        metrics = dict(self.metrics)
+        if metrics["messages"]:
+            metrics["avg_busy_time"] = (
+                metrics["busy_time"] / metrics["messages"]
+            )
+        if metrics["callbacks_queued"]:
+            metrics["avg_queue_latency"] = (
+                metrics["queue_latency"] / metrics["callbacks_queued"]
+            )
+        return metrics
+
+    def reset_metrics(self):
+        self.metrics = {
+            "messages": 0,
+            "responses": 0,
+            "events_parsed": 0,
+            "events_skipped": 0,
+            "busy_time": 0.0,
+            "max_busy_time": 0.0,
+            "callbacks_queued": 0,
+            "queue_latency": 0.0,
+            "max_queue_latency": 0.0,
+        }
+
     async def listener_loop(self):
         while True:
             try:
@@ -597,72 +751,87 @@ class Listener:
                 self.idle.set()
                 break
             self.idle.clear()  # Not "idle" anymore.
-            message = json.loads(msg)
-            if "id" in message:
-                if message["id"] in self.connection.mapper:
-                    tx = self.connection.mapper.pop(message["id"])
-                    logger.debug(
-                        "Got answer for %s (message_id:%d)", tx, message["id"]
-                    )
-                    tx(**message)
-                else:
-                    if message["id"] == -2:
-                        tx = self.connection.mapper.get(-2)
-                        if tx:
-                            tx(**message)
-                        continue
-            else:
-                # Probably an event
-                try:
-                    event = cdp.util.parse_json_event(message)
-                except Exception as e:
-                    logger.info(
-                        "%s: %s during parsing of json from event : %s"
-                        % (type(e).__name__, e.args, message),
-                        exc_info=True,
-                    )
-                    continue
-                except KeyError as e:
-                    logger.info("KeyError: %s" % e, exc_info=True)
+            started = time.perf_counter()
+            self.metrics["messages"] += 1
+            try:
+                # Events without handlers are skipped before parsing JSON.
+                method = get_event_method(msg)
+                if method and not self._has_handlers(method):
+                    self.metrics["events_skipped"] += 1
                     continue
-                try:
-                    if type(event) in self.connection.handlers:
-                        callbacks = self.connection.handlers[type(event)]
+                message = json.loads(msg)
+                if "id" in message:
+                    self.metrics["responses"] += 1
+                    if message["id"] in self.connection.mapper:
+                        tx = self.connection.mapper.pop(message["id"])
+                        logger.debug(
+                            "Got answer for %s (message_id:%d)",
+                            tx,
+                            message["id"],
+                        )
+                        tx(**message)
                     else:
+                        if message["id"] == -2:
+                            tx = self.connection.mapper.get(-2)
+                            if tx:
+                                tx(**message)
+                            continue
+                else:
+                    # Probably an event
+                    if not self._has_handlers(message.get("method")):
+                        self.metrics["events_skipped"] += 1
                         continue
-                    if not len(callbacks):
+                    try:
+                        event = cdp.util.parse_json_event(message)
+                        self.metrics["events_parsed"] += 1
+                    except Exception as e:
+                        logger.info(
+                            "%s: %s during parsing of json from event : %s"
+                            % (type(e).__name__, e.args, message),
+                            exc_info=True,
+                        )
                         continue
-                    for callback in callbacks:
-                        try:
-                            if (
-                                inspect.iscoroutinefunction(callback)
-                                or inspect.iscoroutine(callback)
-                            ):
-                                try:
+                    try:
+                        callbacks = self.connection.handlers[type(event)]
+                        for callback in callbacks:
+                            try:
+                                if (
+                                    inspect.iscoroutinefunction(callback)
+                                    or inspect.iscoroutine(callback)
+                                ):
+                                    try:
+                                        coro = callback(
+                                            event, self.connection
+                                        )
+                                    except TypeError:
+                                        coro = callback(event)
                                     asyncio.create_task(
-                                        callback(event, self.connection)
+                                        self._run_timed(
+                                            coro, time.perf_counter()
+                                        )
                                     )
-                                except TypeError:
-                                    asyncio.create_task(callback(event))
-                            else:
-                                try:
-                                    callback(event, self.connection)
-                                except TypeError:
-                                    callback(event)
-                        except Exception as e:
-                            logger.warning(
-                                "Exception in callback %s for event %s => %s",
-                                callback,
-                                event.__class__.__name__,
-                                e,
-                                exc_info=True,
-                            )
-                            raise
-                except asyncio.CancelledError:
-                    break
-                except Exception:
-                    raise
-                continue
+                                else:
+                                    try:
+                                        callback(event, self.connection)
+                                    except TypeError:
+                                        callback(event)
+                            except Exception as e:
+                                logger.warning(
+                                    "Exception in callback %s "
+                                    "for event %s => %s",
+                                    callback,
+                                    event.__class__.__name__,
+                                    e,
+                                    exc_info=True,
+                                )
+                                raise
+                    except asyncio.CancelledError:
+                        break
+                    except Exception:
+                        raise
+                    continue
+            finally:
+                self._add_busy_time(started)
 
     def __repr__(self):
         s_idle = "[idle]" if self.idle.is_set() else "[busy]"
@@ -0,0 +1,275 @@
+"""
+A local mirror of the DOM of a tab, kept in sync with DOM events.
+The document is fetched once (with DOM.getDocument), and after that,
+DOM mutation events (Eg. DOM.childNodeInserted) are applied to the tree,
+so that queries (and waits) don't need to refetch the whole document.
+Enable with settings.USE_CDP_DOM_MIRROR = True or tab.enable_dom_mirror().
+"""
+from __future__ import annotations
+import logging
+import mycdp as cdp
+import mycdp.dom
+
+logger = logging.getLogger(__name__)
+FRAME_OWNERS = ("IFRAME", "FRAME", "OBJECT", "EMBED", "PORTAL")
+NODE_ID_RESETS = ("DOM.getDocument", "DOM.getFlattenedDocument")
+EVENT_TYPES = (
+    cdp.dom.SetChildNodes,
+    cdp.dom.ChildNodeInserted,
+    cdp.dom.ChildNodeRemoved,
+    cdp.dom.ChildNodeCountUpdated,
+    cdp.dom.AttributeModified,
+    cdp.dom.AttributeRemoved,
+    cdp.dom.CharacterDataModified,
+    cdp.dom.ShadowRootPushed,
+    cdp.dom.ShadowRootPopped,
+    cdp.dom.DocumentUpdated,
+)
+
+
+class DomMirror:
+    """
+    Keeps the tree of DOM.getDocument(-1, True) up-to-date with events.
+    The nodes of the tree are updated in place, so the elements that were
+    created from the tree (and their .parent / .children) stay current.
+    Events are applied in the order they arrive, because the listener
+    runs regular (non-async) handlers before reading the next message.
+    Anything the mirror can't apply exactly (Eg. an event for an unknown
+    node, a new iframe, or DOM.documentUpdated after a navigation) makes
+    the mirror stale, and then the next get_document() refetches the tree.
+    Note: DOM.getDocument resets all node ids in the browser, so while the
+    mirror is enabled, the tab should get the document from the mirror.
+    (Other calls of NODE_ID_RESETS make the mirror stale. See node_ids_reset)
+    """
+
+    def __init__(self, tab):
+        self.tab = tab
+        self.doc = None
+        self.nodes = {}  # node_id -> node (Includes shadow roots and frames)
+        self.pending = set()  # Ids of nodes with children not received yet
+        self.stale = True
+        self.fetches = 0
+        self.events = 0
+        self._listener = None
+        self._fetching = False
+        self._buffer = []
+        self._resets = 0  # The NODE_ID_RESETS calls during a fetch
+
+    async def get_document(self) -> cdp.dom.Node | None:
+        """Returns the mirrored document. (Refetches it if stale.)"""
+        if self._listener is not self.tab.listener:
+            # Events may have been lost while the websocket was reconnected
+            self.stale = True
+        if not self.stale and self.pending:
+            await self._request_pending()
+        if self.stale:
+            await self._fetch()
+        return self.doc
+
+    async def _fetch(self):
+        self._fetching = True
+        self._buffer = []
+        self._resets = 0
+        try:
+            doc = await self.tab.send(cdp.dom.get_document(-1, True))
+        finally:
+            self._fetching = False
+        buffer = self._buffer
+        self._buffer = []
+        if not doc or self._resets > 1:
+            # (Another call reset the node ids of the new tree)
+            self.stale = True
+            return
+        self.doc = doc
+        self.nodes = {}
+        self.pending = set()
+        self.stale = False
+        self.fetches += 1
+        self._listener = self.tab.listener
+        self._add_subtree(doc)
+        # Events that arrived after the response use the ids of the new
+        # tree. (Events from before the response have old ids, and node ids
+        # are never reused, so those are skipped as unknown.)
+        for event in buffer:
+            try:
+                self._apply(event, replay=True)
+            except Exception:
+                self.stale = True
+        self._changed()
+
+    async def _request_pending(self):
+        node_ids = list(self.pending)
+        self.pending.clear()
+        for node_id in node_ids:
+            if self.stale:
+                return
+            if node_id not in self.nodes:
+                continue
+            # The children arrive in a DOM.setChildNodes event,
+            # which is applied before the response is processed.
+            await self.tab.send(cdp.dom.request_child_nodes(node_id, -1, True))
+
+    def node_ids_reset(self):
+        """Called when the tab sends a command that resets all node ids."""
+        if self._fetching:
+            self._resets += 1  # (The fetch of the mirror is one of them)
+        else:
+            self.stale = True
+
+    def _changed(self):
+        # The index of cdp_util.get_dom_index() is rebuilt on the next lookup
+        if self.doc is not None:
+            self.doc._dom_index = None
+
+    def _add_subtree(self, node, parent_id=None, inserted=False):
+        stack = [(node, parent_id)]
+        while stack:
+            node, parent_id = stack.pop()
+            self.nodes[node.node_id] = node
+            if parent_id is not None and node.parent_id is None:
+                node.parent_id = parent_id
+            if node.children is None and node.child_node_count:
+                self.pending.add(node.node_id)
+            if (
+                inserted
+                and node.node_name in FRAME_OWNERS
+                and node.content_document is None
+            ):
+                # (The browser doesn't push the documents of new frames.)
+                self.stale = True
+            for child in node.children or []:
+                stack.append((child, node.node_id))
+            for shadow_root in node.shadow_roots or []:
+                stack.append((shadow_root, node.node_id))
+            if node.content_document:
+                stack.append((node.content_document, node.node_id))
+            if node.template_content:
+                stack.append((node.template_content, node.node_id))
+
+    def _remove_subtree(self, node):
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            self.nodes.pop(node.node_id, None)
+            self.pending.discard(node.node_id)
+            stack.extend(node.children or [])
+            stack.extend(node.shadow_roots or [])
+            if node.content_document:
+                stack.append(node.content_document)
+            if node.template_content:
+                stack.append(node.template_content)
+
+    def _get_node(self, node_id, replay):
+        node = self.nodes.get(node_id)
+        if node is None and not replay:
+            self.stale = True
+        return node
+
+    def handle_event(self, event, connection=None):
+        """The handler of the DOM events. (See EVENT_TYPES)"""
+        self.events += 1
+        if self._fetching:
+            self._buffer.append(event)
+            return
+        if self.stale or self.doc is None:
+            return
+        try:
+            self._apply(event)
+        except Exception:
+            logger.debug("Could not apply %s", event, exc_info=True)
+            self.stale = True
+        self._changed()
+
+    def _apply(self, event, replay=False):
+        if isinstance(event, cdp.dom.DocumentUpdated):
+            self.stale = True
+        elif isinstance(event, cdp.dom.SetChildNodes):
+            parent = self._get_node(event.parent_id, replay)
+            if parent is None:
+                return
+            for child in parent.children or []:
+                self._remove_subtree(child)
+            parent.children = list(event.nodes)
+            parent.child_node_count = len(parent.children)
+            self.pending.discard(parent.node_id)
+            for child in parent.children:
+                self._add_subtree(child, parent.node_id)
+        elif isinstance(event, cdp.dom.ChildNodeInserted):
+            parent = self._get_node(event.parent_node_id, replay)
+            if parent is None:
+                return
+            if parent.children is None:
+                # (Children weren't received yet, so request all of them.)
+                self.pending.add(parent.node_id)
+                return
+            index = 0
+            if event.previous_node_id:
+                for i, child in enumerate(parent.children):
+                    if child.node_id == event.previous_node_id:
+                        index = i + 1
+                        break
+                else:
+                    self.stale = True
+                    return
+            parent.children.insert(index, event.node)
+            parent.child_node_count = len(parent.children)
+            self._add_subtree(event.node, parent.node_id, inserted=True)
+        elif isinstance(event, cdp.dom.ChildNodeRemoved):
+            parent = self._get_node(event.parent_node_id, replay)
+            node = self._get_node(event.node_id, replay)
+            if parent is None or node is None:
+                return
+            if parent.children:
+                parent.children = [
+                    child for child in parent.children if child is not node
+                ]
+                parent.child_node_count = len(parent.children)
+            self._remove_subtree(node)
+        elif isinstance(event, cdp.dom.ChildNodeCountUpdated):
+            node = self._get_node(event.node_id, replay)
+            if node is None:
+                return
+            node.child_node_count = event.child_node_count
+            if node.children is None and event.child_node_count:
+                self.pending.add(node.node_id)
+        elif isinstance(event, cdp.dom.AttributeModified):
+            node = self._get_node(event.node_id, replay)
+            if node is None:
+                return
+            attributes = node.attributes or []
+            for i in range(0, len(attributes) - 1, 2):
+                if attributes[i] == event.name:
+                    attributes[i + 1] = event.value
+                    break
+            else:
+                attributes.extend([event.name, event.value])
+            node.attributes = attributes
+        elif isinstance(event, cdp.dom.AttributeRemoved):
+            node = self._get_node(event.node_id, replay)
+            if node is None or not node.attributes:
+                return
+            attributes = node.attributes
+            for i in range(0, len(attributes) - 1, 2):
+                if attributes[i] == event.name:
+                    del attributes[i:i + 2]
+                    break
+        elif isinstance(event, cdp.dom.CharacterDataModified):
+            node = self._get_node(event.node_id, replay)
+            if node is None:
+                return
+            node.node_value = event.character_data
+        elif isinstance(event, cdp.dom.ShadowRootPushed):
+            host = self._get_node(event.host_id, replay)
+            if host is None:
+                return
+            host.shadow_roots = (host.shadow_roots or []) + [event.root]
+            self._add_subtree(event.root, host.node_id)
+        elif isinstance(event, cdp.dom.ShadowRootPopped):
+            host = self._get_node(event.host_id, replay)
+            root = self._get_node(event.root_id, replay)
+            if host is None or root is None:
+                return
+            host.shadow_roots = [
+                r for r in host.shadow_roots or [] if r is not root
+            ]
+            self._remove_subtree(root)
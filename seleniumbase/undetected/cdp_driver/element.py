@@ -48,6 +48,17 @@ def create(
 
 
 class Element:
+    __slots__ = (
+        "_tab",
+        "_node",
+        "_tree",
+        "_parent",
+        "_remote_object",
+        "_attrs",
+        "_is_highlighted",
+        "_sync_api",  # Set by the sync API of CDP Mode (sb_cdp.py)
+    )
+
     def __init__(
         self, node: cdp.dom.Node, tab: Tab, tree: cdp.dom.Node = None
     ):
@@ -67,6 +78,7 @@ class Element:
         self._tree = tree
         self._parent = None
         self._remote_object = None
+        self._sync_api = None
         self._attrs = ContraDict(silent=True)
         self._make_attrs()
 
@@ -210,16 +222,15 @@ class Element:
             return x
 
     def __setattr__(self, key, value):
+        # Private names are slots. Others are element attributes.
         if key[0] != "_":
-            if key[1:] not in vars(self).keys():
-                self.attrs.__setattr__(key, value)
-                return
+            self.attrs.__setattr__(key, value)
+            return
         super().__setattr__(key, value)
 
     def __setitem__(self, key, value):
         if key[0] != "_":
-            if key[1:] not in vars(self).keys():
-                self.attrs[key] = value
+            self.attrs[key] = value
 
     def __getitem__(self, item):
         return self.attrs.get(item, None)
@@ -237,9 +248,8 @@ class Element:
     async def remove_from_dom_async(self):
         """Removes element from DOM."""
         await self.update()  # Ensure we have latest node_id
-        node = util.filter_recurse(
-            self._tree,
-            lambda node: node.backend_node_id == self.backend_node_id
+        node = util.find_node_by_backend_id(
+            self._tree, self.backend_node_id
         )
         if node:
             await self.tab.send(cdp.dom.remove_node(node.node_id))
@@ -264,11 +274,11 @@ class Element:
             # self._children.clear()
             self._parent = None
         else:
-            doc = await self._tab.send(cdp.dom.get_document(-1, True))
+            doc = await self._tab._get_full_document()
             self._parent = None
         # if self.node_name != "IFRAME":
-        updated_node = util.filter_recurse(
-            doc, lambda n: n.backend_node_id == self._node.backend_node_id
+        updated_node = util.find_node_by_backend_id(
+            doc, self._node.backend_node_id
         )
         if updated_node:
             logger.debug("Node changed, and has now been updated.")
@@ -280,9 +290,7 @@ class Element:
         # self.attrs.clear()
         self._make_attrs()
         if self.node_name != "IFRAME":
-            parent_node = util.filter_recurse(
-                doc, lambda n: n.node_id == self.node.parent_id
-            )
+            parent_node = util.find_node_by_id(doc, self.node.parent_id)
             if not parent_node:
                 # Could happen if node is for example <html>
                 return self
@@ -316,9 +324,7 @@ class Element:
             raise RuntimeError(
                 "Could not get parent since the element has no tree set."
             )
-        parent_node = util.filter_recurse(
-            self.tree, lambda n: n.node_id == self.parent_id
-        )
+        parent_node = util.find_node_by_id(self.tree, self.parent_id)
         if not parent_node:
             return None
         parent_element = create(parent_node, tab=self._tab, tree=self.tree)
@@ -1073,14 +1079,31 @@ class Element:
         )
         return " ".join([n.node_value for n in text_nodes]).strip()
 
+    async def _refresh_node_id(self):
+        """Gets a current node_id for the element, without the tree."""
+        _, node_ids = await self._tab.send_many(
+            cdp.dom.get_document(0),
+            cdp.dom.push_nodes_by_backend_ids_to_frontend(
+                [self.backend_node_id]
+            ),
+        )
+        if node_ids and not isinstance(node_ids, Exception) and node_ids[0]:
+            self._node.node_id = node_ids[0]
+
     async def query_selector_all_async(self, selector: str):
         """Like JS querySelectorAll()"""
-        await self.update()
+        if self.tab._uses_shallow_queries() and self.node_name != "IFRAME":
+            await self._refresh_node_id()
+        else:
+            await self.update()
         return await self.tab.query_selector_all(selector, _node=self)
 
     async def query_selector_async(self, selector: str):
         """Like JS querySelector()"""
-        await self.update()
+        if self.tab._uses_shallow_queries() and self.node_name != "IFRAME":
+            await self._refresh_node_id()
+        else:
+            await self.update()
         return await self.tab.query_selector(selector, self)
 
     async def save_screenshot_async(
@@ -1256,19 +1279,28 @@ class Element:
         """
         if getattr(self, "_is_highlighted", False):
             del self._is_highlighted
-            await self.tab.send(cdp.overlay.hide_highlight())
-            await self.tab.send(cdp.dom.disable())
-            await self.tab.send(cdp.overlay.disable())
+            if self.tab._dom_mirror:
+                # (The DOM domain stays enabled for the DOM mirror.)
+                await self.tab.send_many(
+                    cdp.overlay.hide_highlight(),
+                    cdp.overlay.disable(),
+                )
+                return
+            await self.tab.send_many(
+                cdp.overlay.hide_highlight(),
+                cdp.dom.disable(),
+                cdp.overlay.disable(),
+            )
             return
-        await self.tab.send(cdp.dom.enable())
-        await self.tab.send(cdp.overlay.enable())
         conf = cdp.overlay.HighlightConfig(
             show_info=True, show_extension_lines=True, show_styles=True
         )
-        await self.tab.send(
+        await self.tab.send_many(
+            cdp.dom.enable(),
+            cdp.overlay.enable(),
             cdp.overlay.highlight_node(
                 highlight_config=conf, backend_node_id=self.backend_node_id
-            )
+            ),
         )
         setattr(self, "_is_highlighted", 1)
 
@@ -1400,6 +1432,20 @@ class Element:
 class Position(cdp.dom.Quad):
     """Helper class for element-positioning."""
 
+    __slots__ = (
+        "left",
+        "top",
+        "right",
+        "bottom",
+        "abs_x",
+        "abs_y",
+        "x",
+        "y",
+        "height",
+        "width",
+        "center",
+    )
+
     def __init__(self, points):
         super().__init__(points)
         (
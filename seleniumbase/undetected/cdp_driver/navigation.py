@@ -0,0 +1,174 @@
+"""
+Event-driven navigation waits for the cdp_driver Tab.
+Instead of sleeping for a fixed time after Page.navigate, Tab.get() can
+wait for a milestone of the new document, which is detected with events:
+"domcontentloaded" - Page.lifecycleEvent "DOMContentLoaded"
+"load" - Page.lifecycleEvent "load" (Or Page.frameStoppedLoading)
+"networkidle0" - After load, no requests in flight for NETWORK_IDLE_TIME
+"networkidle2" - After load, no more than 2 requests in flight for that time
+Requests in flight are counted with Network.requestWillBeSent and
+Network.loadingFinished / Network.loadingFailed.
+Navigations that fail (Eg. net::ERR_ABORTED) or that become downloads
+don't commit a new document, so Tab.get() returns for those right away.
+Usage:
+    await tab.get(url, wait_until="load")
+"""
+from __future__ import annotations
+import asyncio
+import time
+import mycdp as cdp
+import mycdp.network
+import mycdp.page
+
+MILESTONES = ("domcontentloaded", "load", "networkidle0", "networkidle2")
+NETWORK_IDLE_TIME = 0.5  # Seconds (The same as in Puppeteer and Playwright)
+IDLE_LIMITS = {"networkidle0": 0, "networkidle2": 2}  # Requests in flight
+DEFAULT_TIMEOUT = 30  # Seconds (If None, wait() may wait forever)
+EVENT_TYPES = (
+    cdp.page.LifecycleEvent,
+    cdp.page.FrameStoppedLoading,
+    cdp.page.DomContentEventFired,
+    cdp.page.LoadEventFired,
+    cdp.network.RequestWillBeSent,
+    cdp.network.LoadingFinished,
+    cdp.network.LoadingFailed,
+)
+
+
+def check_milestone(milestone):
+    if milestone not in MILESTONES:
+        raise ValueError(
+            'wait_until must be one of: "%s"' % '", "'.join(MILESTONES)
+        )
+
+
+class NavigationTracker:
+    """
+    Tracks the lifecycle of documents and the requests in flight of a tab.
+    Events are recorded by loader_id (from the moment the tracker is
+    attached), so the events of a navigation that arrive before the
+    response of Page.navigate are not missed.
+    """
+
+    def __init__(self, tab):
+        self.tab = tab
+        self.loaders = {}  # loader_id -> {Names of lifecycle events}
+        self.frame_loaders = {}  # frame_id -> loader_id (The latest one)
+        self.requests = {}  # request_id -> loader_id (Requests in flight)
+        self.quiet_since = {}  # limit -> The time when it was last reached
+        self.waiting_loader = None
+        self.changed = asyncio.Event()
+        self._attached = False
+        self._update_quiet_times()
+
+    async def attach(self):
+        if self._attached:
+            return
+        for event_type in EVENT_TYPES:
+            self.tab.add_handler(event_type, self.handle_event)
+        self._attached = True
+        await self.tab.send(cdp.page.set_lifecycle_events_enabled(True))
+
+    def detach(self):
+        for event_type in EVENT_TYPES:
+            handlers = self.tab.handlers.get(event_type, [])
+            if self.handle_event in handlers:
+                handlers.remove(self.handle_event)
+        self._attached = False
+
+    def _update_quiet_times(self):
+        for limit in set(IDLE_LIMITS.values()):
+            if len(self.requests) > limit:
+                self.quiet_since[limit] = None
+            elif self.quiet_since.get(limit) is None:
+                self.quiet_since[limit] = time.monotonic()
+
+    def _add_name(self, loader_id, name):
+        if loader_id:
+            self.loaders.setdefault(loader_id, set()).add(name)
+
+    def handle_event(self, event, connection=None):
+        """The handler of the events. (See EVENT_TYPES)"""
+        if isinstance(event, cdp.page.LifecycleEvent):
+            self._add_name(event.loader_id, event.name)
+            if event.name == "init":
+                self.frame_loaders[event.frame_id] = event.loader_id
+                if event.frame_id == self.tab.target_id:
+                    # Requests of the previous document won't finish
+                    self.requests = {
+                        request_id: loader_id
+                        for request_id, loader_id in self.requests.items()
+                        if loader_id == event.loader_id
+                    }
+                    self.loaders = {
+                        event.loader_id: self.loaders[event.loader_id]
+                    }
+                    self.frame_loaders = {event.frame_id: event.loader_id}
+        elif isinstance(event, cdp.page.FrameStoppedLoading):
+            self._add_name(self.frame_loaders.get(event.frame_id), "stopped")
+        elif isinstance(event, cdp.page.DomContentEventFired):
+            self._add_name(self.waiting_loader, "DOMContentLoaded")
+        elif isinstance(event, cdp.page.LoadEventFired):
+            self._add_name(self.waiting_loader, "load")
+        elif isinstance(event, cdp.network.RequestWillBeSent):
+            self.requests[event.request_id] = event.loader_id
+        elif isinstance(event, (
+            cdp.network.LoadingFinished, cdp.network.LoadingFailed
+        )):
+            self.requests.pop(event.request_id, None)
+        self._update_quiet_times()
+        self.changed.set()
+
+    def get_idle_delay(self, loader_id, milestone) -> float | None:
+        """
+        Returns 0 if the milestone of the document was reached.
+        Otherwise, returns the seconds until it can be reached without
+        more events, or None if it can only be reached with more events.
+        """
+        names = self.loaders.get(loader_id, ())
+        if milestone == "domcontentloaded":
+            if "DOMContentLoaded" in names or "load" in names:
+                return 0
+            return None
+        if "load" not in names and "stopped" not in names:
+            return None
+        if milestone == "load":
+            return 0
+        quiet_since = self.quiet_since.get(IDLE_LIMITS[milestone])
+        if quiet_since is None:
+            return None
+        return max(NETWORK_IDLE_TIME - (time.monotonic() - quiet_since), 0)
+
+    async def wait(
+        self, loader_id, milestone="load", timeout=DEFAULT_TIMEOUT
+    ):
+        """
+        Waits until the document of the loader reaches the milestone.
+        Returns False if the timeout was reached first.
+        (Navigations within the same document have no loader_id.)
+        """
+        check_milestone(milestone)
+        if not loader_id:
+            return True
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        self.waiting_loader = loader_id
+        try:
+            while True:
+                self.changed.clear()
+                delay = self.get_idle_delay(loader_id, milestone)
+                if delay == 0:
+                    return True
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    if delay is None or delay > remaining:
+                        delay = remaining
+                try:
+                    await asyncio.wait_for(self.changed.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.waiting_loader = None
@@ -10,14 +10,18 @@ import urllib.parse
 from contextlib import suppress
 from filelock import AsyncFileLock
 from seleniumbase import config as sb_config
+from seleniumbase.config import settings
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import js_utils
 from seleniumbase.fixtures import page_utils
+from seleniumbase.fixtures import poll_utils
 from seleniumbase.fixtures import shared_utils
 from . import browser as cdp_browser
 from . import element
 from . import cdp_util as util
 from .config import PathLike
+from .dom_mirror import DomMirror, EVENT_TYPES as DOM_MIRROR_EVENTS
+from . import navigation
 from .connection import Connection, ProtocolException
 import mycdp as cdp
 
@@ -140,11 +144,76 @@ class Tab(Connection):
         super().__init__(websocket_url, target, browser, **kwargs)
         self.browser = browser
         self._dom = None
+        self._dom_mirror = None
+        self._navigation = None
         self._window_id = None
+        if settings.USE_CDP_DOM_MIRROR:
+            self.enable_dom_mirror()
 
     async def __aenter__(self):
         return self
 
+    def enable_dom_mirror(self) -> DomMirror:
+        """
+        Keeps a local mirror of the DOM, which is updated with DOM events.
+        Queries (and waits) then use the mirror, instead of fetching the
+        whole document (with DOM.getDocument) for each query.
+        """
+        if not self._dom_mirror:
+            self._dom_mirror = DomMirror(self)
+            for event_type in DOM_MIRROR_EVENTS:
+                self.add_handler(event_type, self._dom_mirror.handle_event)
+        return self._dom_mirror
+
+    def disable_dom_mirror(self):
+        if not self._dom_mirror:
+            return
+        for event_type in DOM_MIRROR_EVENTS:
+            with suppress(ValueError):
+                self.handlers[event_type].remove(
+                    self._dom_mirror.handle_event
+                )
+        self._dom_mirror = None
+
+    async def _get_full_document(self) -> cdp.dom.Node:
+        """Returns the document tree, including shadow roots and frames."""
+        if self._dom_mirror:
+            return await self._dom_mirror.get_document()
+        return await self.send(cdp.dom.get_document(-1, True))
+
+    def _uses_shallow_queries(self) -> bool:
+        # (The DOM mirror is already local, so it's used instead.)
+        return settings.USE_CDP_SHALLOW_QUERIES and not self._dom_mirror
+
+    async def _describe_nodes(self, node_ids) -> list[cdp.dom.Node]:
+        """
+        Describes the nodes of a query with DOM.describeNode (pipelined).
+        The nodes only have their attributes and direct children.
+        (The rest is loaded by Element.update())
+        """
+        nodes = await self.send_many(
+            *[cdp.dom.describe_node(node_id=node_id) for node_id in node_ids]
+        )
+        described = []
+        for node_id, node in zip(node_ids, nodes):
+            # (Nodes that were removed since the query have exceptions)
+            if node and not isinstance(node, Exception):
+                node.node_id = node_id  # (Described nodes have no node_id)
+                described.append(node)
+        return described
+
+    async def _get_navigation_tracker(self) -> navigation.NavigationTracker:
+        """Returns the tracker of navigation events. (See Tab.get())"""
+        if not self._navigation:
+            self._navigation = navigation.NavigationTracker(self)
+        await self._navigation.attach()
+        return self._navigation
+
+    async def _disable_dom(self):
+        # (The DOM domain stays enabled for the events of the DOM mirror.)
+        if not self._dom_mirror:
+            await self.send(cdp.dom.disable())
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.aclose()
         if exc_type and exc_val:
@@ -211,26 +280,22 @@ class Tab(Connection):
          Raise timeout exception when after this many seconds nothing is found.
         :type timeout: float,int
         """
-        loop = asyncio.get_running_loop()
-        start_time = loop.time()
         text = text.strip()
         item = None
-        try:
-            item = await self.find_element_by_text(
-                text, best_match, return_enclosing_element
-            )
-        except (Exception, TypeError):
-            pass
-        while not item:
-            item = await self.find_element_by_text(
-                text, best_match, return_enclosing_element
-            )
-            if loop.time() - start_time > timeout:
-                raise asyncio.TimeoutError(
-                    "Time ran out while waiting for: {%s}" % text
+        poller = poll_utils.PollScheduler(timeout, name="Tab.find")
+        async for x in poller:
+            try:
+                item = await self.find_element_by_text(
+                    text, best_match, return_enclosing_element
                 )
-            await self.sleep(0.5)
-        return item
+            except (Exception, TypeError):
+                if x > 0:  # Only the first attempt may fail silently
+                    raise
+            if item:
+                return item
+        raise asyncio.TimeoutError(
+            "Time ran out while waiting for: {%s}" % text
+        )
 
     async def select(
         self,
@@ -264,23 +329,22 @@ class Tab(Connection):
          Raise timeout exception when after this many seconds nothing is found.
         :type timeout: float,int
         """
-        loop = asyncio.get_running_loop()
-        now = loop.time()
         text = text.strip()
         items = []
-        try:
-            items = await self.find_elements_by_text(text)
-        except (Exception, TypeError):
-            pass
-        while not items:
-            await self
-            items = await self.find_elements_by_text(text)
-            if loop.time() - now > timeout:
-                raise asyncio.TimeoutError(
-                    "Time ran out while waiting for: {%s}" % text
-                )
-            await self.sleep(0.5)
-        return items
+        poller = poll_utils.PollScheduler(timeout, name="Tab.find_all")
+        async for x in poller:
+            try:
+                if x > 0:
+                    await self
+                items = await self.find_elements_by_text(text)
+            except (Exception, TypeError):
+                if x > 0:  # Only the first attempt may fail silently
+                    raise
+            if items:
+                return items
+        raise asyncio.TimeoutError(
+            "Time ran out while waiting for: {%s}" % text
+        )
 
     async def select_all(
         self,
@@ -300,8 +364,7 @@ class Tab(Connection):
         :param include_frames: Whether to include results in iframes.
         :type include_frames: bool
         """
-        loop = asyncio.get_running_loop()
-        now = loop.time()
+        poller = poll_utils.PollScheduler(timeout, name="Tab.select_all")
         selector = selector.strip()
         items = []
         if include_frames:
@@ -310,21 +373,23 @@ class Tab(Connection):
             for fr in frames:
                 items.extend(await fr.query_selector_all(selector))
         items.extend(await self.query_selector_all(selector))
-        while not items:
+        if items:
+            return items
+        async for x in poller:
             await self
             items = await self.query_selector_all(selector)
-            if loop.time() - now > timeout:
-                raise asyncio.TimeoutError(
-                    "Time ran out while waiting for: {%s}" % selector
-                )
-            await self.sleep(0.5)
-        return items
+            if items:
+                return items
+        raise asyncio.TimeoutError(
+            "Time ran out while waiting for: {%s}" % selector
+        )
 
     async def get(
         self,
         url="about:blank",
         new_tab: bool = False,
         new_window: bool = False,
+        wait_until: str | None = None,
         **kwargs,
     ):
         """
@@ -335,6 +400,12 @@ class Tab(Connection):
         :param url: the url to navigate to
         :param new_tab: open new tab
         :param new_window: open new window
+        :param wait_until: (Optional) return as soon as the new document
+         reaches this milestone, instead of waiting for the tab to be idle:
+         "domcontentloaded", "load", "networkidle0", or "networkidle2".
+         (Not used with new tabs/windows, or with other kwargs.)
+         Returns right away if the navigation fails, and after
+         navigation.DEFAULT_TIMEOUT seconds if it never reaches it.
         :return: Page
         """
         if not self.browser:
@@ -360,7 +431,26 @@ class Tab(Connection):
                     url, new_tab=True, new_window=False, **kwargs
                 )
         else:
-            if not kwargs:
+            if not kwargs and wait_until:
+                navigation.check_milestone(wait_until)
+                tracker = await self._get_navigation_tracker()
+                result = await self.send(cdp.page.navigate(url))
+                if not result:
+                    return self
+                frame_id, loader_id, error_text, is_download = result
+                if error_text or is_download:
+                    # No new document will be loaded (no lifecycle events)
+                    if error_text:
+                        logger.debug(
+                            "Navigation to %s failed: %s", url, error_text
+                        )
+                    return self
+                if not await tracker.wait(loader_id, wait_until):
+                    logger.debug(
+                        "Timeout waiting for %s of %s", wait_until, url
+                    )
+                return self
+            elif not kwargs:
                 frame_id, loader_id, *_ = await self.send(
                     cdp.page.navigate(url)
                 )
@@ -381,6 +471,7 @@ class Tab(Connection):
         self,
         selector: str,
         _node: cdp.dom.Node | element.Element | None = None,
+        _retried: bool = False,
     ):
         """
         Equivalent of JavaScript "document.querySelectorAll".
@@ -391,8 +482,12 @@ class Tab(Connection):
         :type selector: str
         :param _node: internal use
         """
-        if not _node:
-            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+        shallow = self._uses_shallow_queries()
+        if not _node and shallow:
+            # Only the root node is needed for the query
+            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(0))
+        elif not _node:
+            doc: cdp.dom.Node = await self._get_full_document()
         else:
             doc = _node
             if _node.node_name == "IFRAME":
@@ -405,25 +500,29 @@ class Tab(Connection):
         except ProtocolException as e:
             if _node is not None:
                 if "could not find node" in e.message.lower():
-                    if getattr(_node, "__last", None):
-                        del _node.__last
+                    if _retried:
                         return []
                     # If the supplied node is not found,
                     # then the DOM has changed since acquiring the element.
                     # Therefore, we need to update our node, and try again.
                     await _node.update()
-                    _node.__last = (
-                        True  # Make sure this isn't turned into infinite loop.
+                    # (Retry only once so that this isn't an infinite loop.)
+                    return await self.query_selector_all(
+                        selector, _node, _retried=True
                     )
-                    return await self.query_selector_all(selector, _node)
             else:
-                await self.send(cdp.dom.disable())
+                await self._disable_dom()
                 raise
         if not node_ids:
             return []
+        if shallow:
+            return [
+                element.create(node, self)
+                for node in await self._describe_nodes(node_ids)
+            ]
         items = []
         for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
+            node = util.find_node_by_id(doc, nid)
             # Pass along the retrieved document tree to improve performance.
             if not node:
                 continue
@@ -435,6 +534,7 @@ class Tab(Connection):
         self,
         selector: str,
         _node: cdp.dom.Node | element.Element | None = None,
+        _retried: bool = False,
     ):
         """
         Find a single element based on a CSS Selector string.
@@ -442,8 +542,12 @@ class Tab(Connection):
         :type selector: str
         """
         selector = selector.strip()
-        if not _node:
-            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+        shallow = self._uses_shallow_queries()
+        if not _node and shallow:
+            # Only the root node is needed for the query
+            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(0))
+        elif not _node:
+            doc: cdp.dom.Node = await self._get_full_document()
         else:
             doc = _node
             if _node.node_name == "IFRAME":
@@ -456,23 +560,27 @@ class Tab(Connection):
         except ProtocolException as e:
             if _node is not None:
                 if "could not find node" in e.message.lower():
-                    if getattr(_node, "__last", None):
-                        del _node.__last
+                    if _retried:
                         return []
                     # If supplied node is not found,
                     # the dom has changed since acquiring the element,
                     # therefore, update our passed node and try again.
                     await _node.update()
-                    _node.__last = (
-                        True  # Make sure this isn't turned into infinite loop.
+                    # (Retry only once so that this isn't an infinite loop.)
+                    return await self.query_selector(
+                        selector, _node, _retried=True
                     )
-                    return await self.query_selector(selector, _node)
             else:
-                await self.send(cdp.dom.disable())
+                await self._disable_dom()
                 raise
         if not node_id:
             return
-        node = util.filter_recurse(doc, lambda n: n.node_id == node_id)
+        if shallow:
+            nodes = await self._describe_nodes([node_id])
+            if not nodes:
+                return
+            return element.create(nodes[0], self)
+        node = util.find_node_by_id(doc, node_id)
         if not node:
             return
         return element.create(node, self, doc)
@@ -488,22 +596,39 @@ class Tab(Connection):
         :param text:
         """
         text = text.strip()
-        doc = await self.send(cdp.dom.get_document(-1, True))
-        search_id, nresult = await self.send(
-            cdp.dom.perform_search(text, True)
-        )
-        if not nresult:
-            return []
-        if nresult:
-            node_ids = await self.send(
-                cdp.dom.get_search_results(search_id, 0, nresult)
+        if self._dom_mirror:
+            doc = await self._get_full_document()
+            search_id, nresult = await self.send(
+                cdp.dom.perform_search(text, True)
             )
         else:
+            # The search doesn't depend on the document, so send both at once.
+            doc, search = await self.send_many(
+                cdp.dom.get_document(-1, True),
+                cdp.dom.perform_search(text, True),
+            )
+            if isinstance(doc, Exception):
+                # Without the document, the nodes can't be found.
+                if search and not isinstance(search, Exception):
+                    with suppress(Exception):
+                        await self.send(
+                            cdp.dom.discard_search_results(search[0])
+                        )
+                raise doc
+            search_id, nresult = None, 0
+            if search and not isinstance(search, Exception):
+                search_id, nresult = search
+        if not nresult:
+            return []
+        node_ids, _ = await self.send_many(
+            cdp.dom.get_search_results(search_id, 0, nresult),
+            cdp.dom.discard_search_results(search_id),
+        )
+        if isinstance(node_ids, Exception):
             node_ids = []
-        await self.send(cdp.dom.discard_search_results(search_id))
         items = []
         for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
+            node = util.find_node_by_id(doc, nid)
             if not node:
                 node = await self.send(cdp.dom.resolve_node(node_id=nid))
                 if not node:
@@ -560,7 +685,7 @@ class Tab(Connection):
                         items.extend(
                             text_node.parent for text_node in iframe_text_elems
                         )
-        await self.send(cdp.dom.disable())
+        await self._disable_dom()
         return items or []
 
     async def find_element_by_text(
@@ -580,22 +705,42 @@ class Tab(Connection):
         :type best_match: bool
         :param return_enclosing_element:
         """
-        doc = await self.send(cdp.dom.get_document(-1, True))
         text = text.strip()
-        search_id, nresult = await self.send(
-            cdp.dom.perform_search(text, True)
-        )
+        if self._dom_mirror:
+            doc = await self._get_full_document()
+            search_id, nresult = await self.send(
+                cdp.dom.perform_search(text, True)
+            )
+        else:
+            # The search doesn't depend on the document, so send both at once.
+            doc, search = await self.send_many(
+                cdp.dom.get_document(-1, True),
+                cdp.dom.perform_search(text, True),
+            )
+            if isinstance(doc, Exception):
+                # Without the document, the nodes can't be found.
+                if search and not isinstance(search, Exception):
+                    with suppress(Exception):
+                        await self.send(
+                            cdp.dom.discard_search_results(search[0])
+                        )
+                raise doc
+            search_id, nresult = None, 0
+            if search and not isinstance(search, Exception):
+                search_id, nresult = search
         if not nresult:
             return
-        node_ids = await self.send(
-            cdp.dom.get_search_results(search_id, 0, nresult)
+        node_ids, _ = await self.send_many(
+            cdp.dom.get_search_results(search_id, 0, nresult),
+            cdp.dom.discard_search_results(search_id),
         )
-        await self.send(cdp.dom.discard_search_results(search_id))
+        if isinstance(node_ids, Exception):
+            node_ids = []
         if not node_ids:
             node_ids = []
         items = []
         for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
+            node = util.find_node_by_id(doc, nid)
             try:
                 elem = element.create(node, self, doc)
             except BaseException:
@@ -656,7 +801,7 @@ class Tab(Connection):
                     if elem:
                         return elem
         finally:
-            await self.send(cdp.dom.disable())
+            await self._disable_dom()
 
     async def back(self):
         """History back"""
@@ -915,7 +1060,7 @@ class Tab(Connection):
 
     async def get_content(self):
         """Gets the current page source content (html)"""
-        doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+        doc: cdp.dom.Node = await self._get_full_document()
         return await self.send(
             cdp.dom.get_outer_html(
                 backend_node_id=doc.backend_node_id,
@@ -1086,28 +1231,23 @@ class Tab(Connection):
         :return: Element
         :raises: asyncio.TimeoutError
         """
-        loop = asyncio.get_running_loop()
-        now = loop.time()
+        poller = poll_utils.PollScheduler(timeout, name="Tab.wait_for")
         if selector:
-            item = await self.query_selector(selector)
-            while not item:
+            async for x in poller:
                 item = await self.query_selector(selector)
-                if loop.time() - now > timeout:
-                    raise asyncio.TimeoutError(
-                        "Time ran out while waiting for: {%s}" % selector
-                    )
-                await self.sleep(0.068)
-            return item
+                if item:
+                    return item
+            raise asyncio.TimeoutError(
+                "Time ran out while waiting for: {%s}" % selector
+            )
         if text:
-            item = await self.find_element_by_text(text)
-            while not item:
+            async for x in poller:
                 item = await self.find_element_by_text(text)
-                if loop.time() - now > timeout:
-                    raise asyncio.TimeoutError(
-                        "Time ran out while waiting for: {%s}" % text
-                    )
-                await self.sleep(0.068)
-            return item
+                if item:
+                    return item
+            raise asyncio.TimeoutError(
+                "Time ran out while waiting for: {%s}" % text
+            )
 
     async def set_attributes(self, selector, attribute, value):
         """This method uses JavaScript to set/update a common attribute.
@@ -1860,6 +2000,8 @@ class Tab(Connection):
         await self.solve_captcha()
 
     async def get_document(self):
+        if self._dom_mirror:
+            return await self._dom_mirror.get_document()
         return await self.send(cdp.dom.get_document())
 
     async def get_flattened_document(self):
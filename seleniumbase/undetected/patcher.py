@@ -1,5 +1,8 @@
+import hashlib
 import io
+import json
 import logging
+import mmap
 import os
 import random
 import re
@@ -8,10 +11,35 @@ import sys
 import time
 import zipfile
 from contextlib import suppress
+from filelock import FileLock
+from seleniumbase.core import launch_cache
 from seleniumbase.fixtures import shared_utils
 
 logger = logging.getLogger(__name__)
 IS_POSIX = sys.platform.startswith(("darwin", "cygwin", "linux"))
+JS_GLOBALS = b"(?:Array|Promise|Symbol|Object|Proxy|JSON|Window)"
+CDC_PATTERN = re.compile(b"cdc_[a-zA-Z0-9]{22}_")  # (Has a literal prefix)
+UNPATCHED_PATTERN = re.compile(
+    b"window.cdc_adoQpoasnfa76pfcZLmcfl_" + JS_GLOBALS
+)
+# Each patch: (pattern, offset of "cdc_" in the match, replaces a name)
+PATCH_PATTERNS = (
+    (
+        re.compile(
+            b"window\\.cdc_[a-zA-Z0-9]{22}_" + JS_GLOBALS
+            + b" = window\\." + JS_GLOBALS + b";"
+        ),
+        7,
+        False,
+    ),
+    (
+        re.compile(b"window\\.cdc_[a-zA-Z0-9]{22}_" + JS_GLOBALS + b" \\|\\|"),
+        7,
+        False,
+    ),
+    (re.compile(b"'\\$cdc_[a-zA-Z0-9]{22}_';"), 2, True),
+)
+MARKER_SUFFIX = ".patched.json"  # The sidecar file of a patched binary
 
 
 class Patcher(object):
@@ -81,9 +109,11 @@ class Patcher(object):
             self.executable_path = executable_path
             self._custom_exe_path = True
         if self._custom_exe_path:
-            ispatched = self.is_binary_patched(self.executable_path)
+            with launch_cache.phase("uc patch check"):
+                ispatched = self.is_binary_patched(self.executable_path)
             if not ispatched:
-                return self.patch_exe()
+                with launch_cache.phase("uc patch"):
+                    return self.patch_exe()
             else:
                 return
         if version_main:
@@ -198,22 +228,68 @@ class Patcher(object):
         cdc[3] = "_"
         return "".join(cdc).encode()
 
+    @staticmethod
+    def get_marker_path(executable_path):
+        return executable_path + MARKER_SUFFIX
+
+    def write_patched_marker(self, executable_path, sha256):
+        """Saves the size, mtime, and hash of a patched binary in a sidecar
+        file, so that later checks only need a stat and a small read."""
+        stat = os.stat(executable_path)
+        marker = {
+            "patched": True,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+        }
+        marker_path = self.get_marker_path(executable_path)
+        temp_path = "%s.tmp.%s" % (marker_path, os.getpid())
+        with io.open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(marker, f)
+        os.replace(temp_path, marker_path)
+
+    def has_patched_marker(self, executable_path):
+        """Returns True if the sidecar file matches the binary.
+        If only the mtime changed (Eg. a copy), the hash is compared."""
+        try:
+            with io.open(
+                self.get_marker_path(executable_path), "r", encoding="utf-8"
+            ) as f:
+                marker = json.load(f)
+            stat = os.stat(executable_path)
+        except Exception:
+            return False
+        if not marker.get("patched") or marker.get("size") != stat.st_size:
+            return False
+        if marker.get("mtime_ns") == stat.st_mtime_ns:
+            return True
+        with io.open(executable_path, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hashlib.sha256(mm).hexdigest() != marker.get("sha256"):
+                    return False
+        with suppress(Exception):
+            self.write_patched_marker(executable_path, marker["sha256"])
+        return True
+
     def is_binary_patched(self, executable_path=None):
         executable_path = executable_path or self.executable_path
+        if self.has_patched_marker(executable_path):
+            return True
         with io.open(executable_path, "rb") as fh:
-            if re.search(
-                b"window.cdc_adoQpoasnfa76pfcZLmcfl_"
-                b"(Array|Promise|Symbol|Object|Proxy|JSON|Window)",
-                fh.read()
-            ):
-                return False
+            if not os.fstat(fh.fileno()).st_size:
+                return True  # (An empty file can't be mapped)
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if UNPATCHED_PATTERN.search(mm):
+                    return False
+                sha256 = hashlib.sha256(mm).hexdigest()
+        with suppress(Exception):
+            self.write_patched_marker(executable_path, sha256)
         return True
 
-    def patch_exe(self):
-        """Patches the ChromeDriver binary"""
-        def gen_js_whitespaces(match):
-            return b"\n" * len(match.group())
-
+    @staticmethod
+    def find_patches(mm):
+        """Returns [(position, replacement)] for the binary in one scan.
+        Replacements have the same length as the strings they replace."""
         def gen_call_function_js_cache_name(match):
             rep_len = len(match.group()) - 3
             ran_len = random.randint(6, rep_len)
@@ -222,28 +298,38 @@ class Patcher(object):
             )), 'ascii') + b"';" + (b"\n" * (rep_len - ran_len))
             return bb
 
-        with io.open(self.executable_path, "r+b") as fh:
-            file_bin = fh.read()
-            file_bin = re.sub(
-                b"window\\.cdc_[a-zA-Z0-9]{22}_"
-                b"(Array|Promise|Symbol|Object|Proxy|JSON|Window) "
-                b"= window\\.(Array|Promise|Symbol|Object|Proxy|JSON|Window);",
-                gen_js_whitespaces,
-                file_bin,
-            )
-            file_bin = re.sub(
-                b"window\\.cdc_[a-zA-Z0-9]{22}_"
-                b"(Array|Promise|Symbol|Object|Proxy|JSON|Window) \\|\\|",
-                gen_js_whitespaces,
-                file_bin,
-            )
-            file_bin = re.sub(
-                b"'\\$cdc_[a-zA-Z0-9]{22}_';",
-                gen_call_function_js_cache_name,
-                file_bin,
-            )
-            fh.seek(0)
-            fh.write(file_bin)
+        patches = []
+        end = 0
+        for cdc_match in CDC_PATTERN.finditer(mm):
+            if cdc_match.start() < end:
+                continue
+            for pattern, offset, replaces_name in PATCH_PATTERNS:
+                start = cdc_match.start() - offset
+                match = pattern.match(mm, start) if start >= 0 else None
+                if match:
+                    if replaces_name:
+                        replacement = gen_call_function_js_cache_name(match)
+                    else:
+                        replacement = b"\n" * len(match.group())
+                    patches.append((start, replacement))
+                    end = match.end()
+                    break
+        return patches
+
+    def patch_exe(self):
+        """Patches the ChromeDriver binary in place (through mmap).
+        Only one process patches a binary. Others wait, and then see it
+        patched by the sidecar file."""
+        with FileLock(self.executable_path + ".lock"):
+            if self.has_patched_marker(self.executable_path):
+                return True
+            with io.open(self.executable_path, "r+b") as fh:
+                with mmap.mmap(fh.fileno(), 0) as mm:
+                    for start, replacement in self.find_patches(mm):
+                        mm[start:start + len(replacement)] = replacement
+                    mm.flush()
+                    sha256 = hashlib.sha256(mm).hexdigest()
+            self.write_patched_marker(self.executable_path, sha256)
         return True
 
     @staticmethod